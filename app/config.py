@@ -1,13 +1,12 @@
 from __future__ import annotations
 
+import importlib
 import os
 import logging
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from app.providers.akshare_provider import AkshareHoldingsProvider, is_available as akshare_available
 from app.providers.base import GoldProvider, HoldingsProvider, IndexProvider, QuoteProvider
-from app.providers.eastmoney import EastmoneyHoldingsProvider, EastmoneyQuoteProvider
-from app.providers.mock import MockGoldProvider, MockHoldingsProvider, MockIndexProvider, MockQuoteProvider
+from app.providers.singleflight import SingleFlightHoldingsProvider, SingleFlightQuoteProvider
 
 DEFAULT_FUND_CODES = [
     "270042", "006479", "005698", "161128", "161130", "018993", "016452",
@@ -18,49 +17,191 @@ HTTP_TIMEOUT = 12
 
 HOLDINGS_PROVIDER = os.getenv("HOLDINGS_PROVIDER", "auto").strip().lower()
 QUOTE_PROVIDER = os.getenv("QUOTE_PROVIDER", "auto").strip().lower()
+# QUOTE_PROVIDER=composite 时按市场路由："市场=后端|后端,..."，市场为 cn/hk/us/default；
+# 每批优先交给当前最快的健康后端，未命中的代码依次交给后面的后端（末尾放 mock 即用模拟值补齐）
+QUOTE_ROUTES = os.getenv("QUOTE_ROUTES", "cn=eastmoney,hk=eastmoney,us=eastmoney,default=eastmoney")
+# 指数/黄金可配置多个适配器（逗号分隔），行情中心并发拉取，同一指数以靠前的适配器为准
 INDEX_PROVIDER = os.getenv("INDEX_PROVIDER", "mock").strip().lower()
 GOLD_PROVIDER = os.getenv("GOLD_PROVIDER", "mock").strip().lower()
+
+# /api/estimate 与 /api/funds/{code}/detail 的响应缓存：软 TTL 内视为新鲜，
+# 软/硬 TTL 之间返回旧值（stale=true）并后台刷新，上游故障时最多沿用到硬 TTL
+RESPONSE_SOFT_TTL = float(os.getenv("RESPONSE_SOFT_TTL", "15"))
+RESPONSE_HARD_TTL = float(os.getenv("RESPONSE_HARD_TTL", "900"))
+
+# symbol_secid 负缓存有效期：所有候选 secid 都无数据的代码，在此期间内不再探测
+SECID_NEGATIVE_TTL = int(os.getenv("SECID_NEGATIVE_TTL", str(24 * 3600)))
+
+# 交易时段感知：休市市场的成分股直接使用已持久化的收盘涨跌，收盘后的估值冻结入库。
+# 节假日文件格式见 examples/market_holidays.json；mock 行情下默认关闭
+MARKET_HOLIDAYS_FILE = os.getenv("MARKET_HOLIDAYS_FILE", os.path.join("data", "market_holidays.json"))
+SESSION_AWARE_QUOTES = os.getenv("SESSION_AWARE_QUOTES", "0" if QUOTE_PROVIDER == "mock" else "1").strip() == "1"
+
+# pingzhongdata 一次下载同时落库基金名称与净值序列；该时长内直接使用库中数据不再下载
+FUND_DATA_TTL = int(os.getenv("FUND_DATA_TTL", "3600"))
+# 净值区间查询默认/最大返回点数（超过时做 LTTB 降采样）
+NAV_DEFAULT_POINTS = int(os.getenv("NAV_DEFAULT_POINTS", "240"))
+NAV_MAX_POINTS = int(os.getenv("NAV_MAX_POINTS", "2000"))
+
+# 基金目录：fundcode_search.js（全部基金的代码/拼音缩写/名称/类型/全拼）载入内存，供名称解析与 /api/funds/search；
+# 启动时先读本地副本 FUND_CATALOG_FILE，超过 FUND_CATALOG_REFRESH 秒再从 FUND_CATALOG_URL 刷新并写回副本（URL 为空则只用本地副本）
+FUND_CATALOG_FILE = os.getenv("FUND_CATALOG_FILE", os.path.join("data", "fundcode_search.js"))
+FUND_CATALOG_URL = os.getenv(
+    "FUND_CATALOG_URL", "" if HOLDINGS_PROVIDER == "mock" else "https://fund.eastmoney.com/js/fundcode_search.js"
+).strip()
+FUND_CATALOG_REFRESH = float(os.getenv("FUND_CATALOG_REFRESH", str(24 * 3600)))
+
+# 全市场估值的持仓全集：CSV（fund_code,fund_name,symbol,weight）；未配置时用默认代码 + 活跃持仓在线构建
+UNIVERSE_HOLDINGS_FILE = os.getenv("UNIVERSE_HOLDINGS_FILE", "").strip()
+# 持仓全集最长复用 UNIVERSE_TTL 秒；持仓变更（在线构建）或 CSV 被改写时立即重建
+UNIVERSE_TTL = float(os.getenv("UNIVERSE_TTL", str(6 * 3600)))
+
+# 按上游主机的出站限制："host=每秒请求数:最大并发"，default 作用于未列出的主机；
+# 实际并发在 [1, 最大并发] 内按 AIMD 自适应，排队超过 UPSTREAM_QUEUE_TIMEOUT 秒放弃
+UPSTREAM_LIMITS = os.getenv(
+    "UPSTREAM_LIMITS",
+    "push2.eastmoney.com=20:8,fund.eastmoney.com=5:4,fundf10.eastmoney.com=5:4,default=10:4",
+)
+UPSTREAM_QUEUE_TIMEOUT = float(os.getenv("UPSTREAM_QUEUE_TIMEOUT", "10"))
+
+# 昂贵接口的入站准入："类别=并发上限:队列长度"。estimate: /api/estimate、/api/portfolio/valuation；
+# detail: 基金详情/批量详情/净值；market: 全市场排行。队列满返回 429，排队超过 ADMISSION_QUEUE_TIMEOUT 秒返回 503
+ADMISSION_LIMITS = os.getenv("ADMISSION_LIMITS", "estimate=4:16,detail=8:32,market=2:8")
+ADMISSION_QUEUE_TIMEOUT = float(os.getenv("ADMISSION_QUEUE_TIMEOUT", "5"))
+
+# 行情中心：按 (适配器, 市场/平台) 分别缓存，软 TTL 内直接返回，之后先返回旧值后台刷新，超过硬 TTL 才同步拉取；
+# 单次请求最多等待 MARKET_FETCH_TIMEOUT 秒，未返回的来源标记为 timeout，其余数据照常返回
+MARKET_INDEX_TTL = float(os.getenv("MARKET_INDEX_TTL", "10"))
+MARKET_GOLD_TTL = float(os.getenv("MARKET_GOLD_TTL", "5"))
+MARKET_HARD_TTL = float(os.getenv("MARKET_HARD_TTL", "300"))
+MARKET_FETCH_TIMEOUT = float(os.getenv("MARKET_FETCH_TIMEOUT", "2"))
+MARKET_HUB_WORKERS = int(os.getenv("MARKET_HUB_WORKERS", "8"))
+
+# 行情、持仓、基金名称的跨请求缓存后端：memory（进程内）| sqlite（同机多 worker 共享，WAL）| redis（需安装 redis 包）。
+# 未命中时只有取得租约的 worker 回源，其余等待其写入；租约 CACHE_LOCK_TTL 秒后过期，防止持有者崩溃后卡住
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory").strip().lower()
+CACHE_DB_PATH = os.getenv("CACHE_DB_PATH", os.path.join("data", "cache.db"))
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "redis://127.0.0.1:6379/0")
+CACHE_LOCK_TTL = float(os.getenv("CACHE_LOCK_TTL", "15"))
+QUOTE_CACHE_TTL = float(os.getenv("QUOTE_CACHE_TTL", "10"))
+HOLDINGS_CACHE_TTL = float(os.getenv("HOLDINGS_CACHE_TTL", str(6 * 3600)))
+FUND_NAME_CACHE_TTL = float(os.getenv("FUND_NAME_CACHE_TTL", str(24 * 3600)))
+
+# 启动预热：后台拉取活跃持仓 + DEFAULT_FUND_CODES 的持仓与名称、解析 secid（不预热行情）；
+# WARMUP_CONCURRENCY 为同时预热的基金数（各上游主机另受 UPSTREAM_LIMITS 约束）
+WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "1").strip() == "1"
+WARMUP_CONCURRENCY = int(os.getenv("WARMUP_CONCURRENCY", "4"))
+
+# 持仓 CSV/NDJSON 流式导入：每 IMPORT_CHUNK_SIZE 行一个事务写入，最多返回 IMPORT_MAX_ERRORS 条逐行错误（其余只计数）；
+# 导出按 EXPORT_PAGE_SIZE 行一页读库并写出
+IMPORT_CHUNK_SIZE = int(os.getenv("IMPORT_CHUNK_SIZE", "1000"))
+IMPORT_MAX_ERRORS = int(os.getenv("IMPORT_MAX_ERRORS", "100"))
+EXPORT_PAGE_SIZE = int(os.getenv("EXPORT_PAGE_SIZE", "1000"))
 logger = logging.getLogger(__name__)
 
+# provider 按名称登记为 (模块, 类名)，只有被选中时才 import，避免 mock 模式也加载 akshare/pandas
+HOLDINGS_PROVIDERS: Dict[str, Tuple[str, str]] = {
+    "mock": ("app.providers.mock", "MockHoldingsProvider"),
+    "eastmoney": ("app.providers.eastmoney", "EastmoneyHoldingsProvider"),
+    "akshare": ("app.providers.akshare_provider", "AkshareHoldingsProvider"),
+}
+QUOTE_PROVIDERS: Dict[str, Tuple[str, str]] = {
+    "mock": ("app.providers.mock", "MockQuoteProvider"),
+    "eastmoney": ("app.providers.eastmoney", "EastmoneyQuoteProvider"),
+    "composite": ("app.providers.composite", "CompositeQuoteProvider"),
+}
+INDEX_PROVIDERS: Dict[str, Tuple[str, str]] = {
+    "mock": ("app.providers.mock", "MockIndexProvider"),
+}
+GOLD_PROVIDERS: Dict[str, Tuple[str, str]] = {
+    "mock": ("app.providers.mock", "MockGoldProvider"),
+}
+
+
+def load_provider_class(registry: Dict[str, Tuple[str, str]], name: str) -> Any:
+    module_name, class_name = registry[name]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def load_holdings_provider(name: str) -> HoldingsProvider:
+    """按名称构造 holdings provider：共享缓存（持仓与名称）外再挂进程级 single-flight 合并并发的相同请求。"""
+    from app.providers.shared_cache import SharedCacheHoldingsProvider, get_shared_cache
+
+    inner = SharedCacheHoldingsProvider(
+        load_provider_class(HOLDINGS_PROVIDERS, name)(), get_shared_cache(), HOLDINGS_CACHE_TTL, FUND_NAME_CACHE_TTL
+    )
+    return SingleFlightHoldingsProvider(inner)
+
+
+def load_quote_provider(name: str, quote_cache: Optional[Dict[str, Optional[float]]] = None) -> QuoteProvider:
+    from app.providers.shared_cache import SharedCacheQuoteProvider, get_shared_cache
+
+    inner = SharedCacheQuoteProvider(load_provider_class(QUOTE_PROVIDERS, name)(quote_cache), get_shared_cache(), QUOTE_CACHE_TTL)
+    provider: QuoteProvider = SingleFlightQuoteProvider(inner)
+    if SESSION_AWARE_QUOTES and name != "mock":
+        from app.providers.session_aware import SessionAwareQuoteProvider
+
+        provider = SessionAwareQuoteProvider(provider)
+    return provider
+
+
+def akshare_available() -> bool:
+    from app.providers.akshare_provider import is_available
+
+    return is_available()
+
 
 def get_holdings_provider() -> HoldingsProvider:
-    if HOLDINGS_PROVIDER == "mock":
-        return MockHoldingsProvider()
-    if HOLDINGS_PROVIDER == "eastmoney":
-        return EastmoneyHoldingsProvider()
-    if HOLDINGS_PROVIDER == "akshare":
-        return AkshareHoldingsProvider()
+    if HOLDINGS_PROVIDER in HOLDINGS_PROVIDERS:
+        return load_holdings_provider(HOLDINGS_PROVIDER)
     if HOLDINGS_PROVIDER == "auto":
         if akshare_available():
-            return AkshareHoldingsProvider()
-        return EastmoneyHoldingsProvider()
+            return load_holdings_provider("akshare")
+        return load_holdings_provider("eastmoney")
 
-    return EastmoneyHoldingsProvider()
+    return load_holdings_provider("eastmoney")
 
 
 def get_quote_provider(quote_cache: Optional[Dict[str, Optional[float]]] = None) -> QuoteProvider:
-    if QUOTE_PROVIDER == "mock":
-        return MockQuoteProvider(quote_cache)
-    if QUOTE_PROVIDER == "eastmoney":
-        return EastmoneyQuoteProvider(quote_cache)
+    if QUOTE_PROVIDER in QUOTE_PROVIDERS:
+        return load_quote_provider(QUOTE_PROVIDER, quote_cache)
     if QUOTE_PROVIDER == "auto":
         # auto: 优先 eastmoney，失败后在运行期由 service 自动回退 mock
-        return EastmoneyQuoteProvider(quote_cache)
+        return load_quote_provider("eastmoney", quote_cache)
 
-    return EastmoneyQuoteProvider(quote_cache)
+    return load_quote_provider("eastmoney", quote_cache)
 
 
-def get_index_provider() -> IndexProvider:
-    if INDEX_PROVIDER == "mock":
-        return MockIndexProvider()
+def _provider_names(raw: str) -> List[str]:
+    return [name.strip() for name in raw.split(",") if name.strip()] or ["mock"]
 
-    logger.warning("INDEX_PROVIDER=%s 暂不支持，回退为 mock", INDEX_PROVIDER)
-    return MockIndexProvider(status_tag=f"fallback:{INDEX_PROVIDER}")
 
+def get_index_adapters() -> Dict[str, IndexProvider]:
+    """INDEX_PROVIDER 中的全部适配器，按配置顺序；不支持的名称回退为带 fallback 标记的 mock。"""
+    adapters: Dict[str, IndexProvider] = {}
+    for name in _provider_names(INDEX_PROVIDER):
+        if name in INDEX_PROVIDERS:
+            adapters[name] = load_provider_class(INDEX_PROVIDERS, name)()
+        else:
+            logger.warning("INDEX_PROVIDER=%s 暂不支持，回退为 mock", name)
+            adapters[name] = load_provider_class(INDEX_PROVIDERS, "mock")(status_tag=f"fallback:{name}")
+    return adapters
 
-def get_gold_provider() -> GoldProvider:
-    if GOLD_PROVIDER == "mock":
-        return MockGoldProvider()
 
-    logger.warning("GOLD_PROVIDER=%s 暂不支持，回退为 mock", GOLD_PROVIDER)
-    return MockGoldProvider(status_tag=f"fallback:{GOLD_PROVIDER}")
+def get_gold_adapters() -> Dict[str, GoldProvider]:
+    adapters: Dict[str, GoldProvider] = {}
+    for name in _provider_names(GOLD_PROVIDER):
+        if name in GOLD_PROVIDERS:
+            adapters[name] = load_provider_class(GOLD_PROVIDERS, name)()
+        else:
+            logger.warning("GOLD_PROVIDER=%s 暂不支持，回退为 mock", name)
+            adapters[name] = load_provider_class(GOLD_PROVIDERS, "mock")(status_tag=f"fallback:{name}")
+    return adapters
+
+
+def get_index_provider() -> IndexProvider:
+    return next(iter(get_index_adapters().values()))
+
+
+def get_gold_provider() -> GoldProvider:
+    return next(iter(get_gold_adapters().values()))
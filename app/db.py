@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import json
 import sqlite3
 import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 DB_PATH = Path("data") / "app.db"
 
+# (date, nav, accum_nav, change_percent)
+NavRow = Tuple[str, float, Optional[float], Optional[float]]
+
 
 def _ensure_db_dir() -> None:
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -34,6 +38,37 @@ def _migrate_positions_table(conn: sqlite3.Connection) -> None:
     conn.execute("UPDATE positions SET created_at=updated_at WHERE created_at IS NULL")
 
 
+def _ensure_position_changes_table(conn: sqlite3.Connection) -> None:
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='position_changes'"
+    ).fetchone()
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS position_changes(
+          version INTEGER PRIMARY KEY AUTOINCREMENT,
+          code TEXT NOT NULL,
+          op TEXT NOT NULL,
+          changed_at INTEGER
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_position_changes_code ON position_changes(code, version)")
+    if exists is None:
+        # 首次建表时把已有持仓记为一次 upsert，since=0 即可拿到完整快照
+        conn.execute(
+            "INSERT INTO position_changes(code, op, changed_at) SELECT code, 'upsert', ? FROM positions ORDER BY code",
+            (int(time.time()),),
+        )
+
+
+def _log_position_changes(conn: sqlite3.Connection, codes: Iterable[str], op: str, now: int) -> None:
+    """与持仓写入同一事务追加变更日志；version 由 AUTOINCREMENT 单调递增且不复用。"""
+    conn.executemany(
+        "INSERT INTO position_changes(code, op, changed_at) VALUES(?, ?, ?)",
+        [(code, op, now) for code in codes],
+    )
+
+
 def ensure_tables() -> None:
     with get_conn() as conn:
         conn.execute(
@@ -51,40 +86,300 @@ def ensure_tables() -> None:
             """
         )
         _migrate_positions_table(conn)
+        _ensure_position_changes_table(conn)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_positions_active_code ON positions(is_active, code)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_positions_updated_at ON positions(updated_at)")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS symbol_secid(
+              symbol TEXT PRIMARY KEY,
+              secid TEXT,
+              checked_at INTEGER
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS quote_snapshots(
+              symbol TEXT PRIMARY KEY,
+              pct REAL,
+              trade_date TEXT,
+              updated_at INTEGER
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS estimate_snapshots(
+              code TEXT PRIMARY KEY,
+              session_key TEXT,
+              payload TEXT,
+              updated_at INTEGER
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS fund_meta(
+              code TEXT PRIMARY KEY,
+              name TEXT,
+              updated_at INTEGER
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS nav_history(
+              code TEXT NOT NULL,
+              date TEXT NOT NULL,
+              nav REAL,
+              accum_nav REAL,
+              change_percent REAL,
+              PRIMARY KEY(code, date)
+            ) WITHOUT ROWID
+            """
+        )
         conn.commit()
 
 
-def list_positions(active_only: bool = True) -> Dict[str, object]:
+POSITION_FIELDS = ("code", "name", "share", "cost", "current_profit", "is_active", "created_at", "updated_at")
+# 不指定 fields 时的默认输出列（与旧接口一致，不含 updated_at）
+DEFAULT_POSITION_FIELDS = POSITION_FIELDS[:-1]
+MAX_POSITIONS_PAGE = 5000
+
+_POSITION_CONVERTERS = {
+    "code": lambda v: v,
+    "name": lambda v: v,
+    "share": lambda v: float(v or 0),
+    "cost": lambda v: float(v or 0),
+    "current_profit": lambda v: float(v or 0),
+    "is_active": lambda v: int(v or 0),
+    "created_at": lambda v: int(v or 0),
+    "updated_at": lambda v: int(v or 0),
+}
+
+
+def parse_position_fields(raw: str) -> List[str]:
+    """解析 fields=a,b,c；code 作为分页游标总会返回。未知字段抛 ValueError。"""
+    requested = [f.strip() for f in raw.split(",") if f.strip()]
+    if not requested:
+        return list(DEFAULT_POSITION_FIELDS)
+    unknown = [f for f in requested if f not in POSITION_FIELDS]
+    if unknown:
+        raise ValueError(f"fields 不支持: {','.join(unknown)}")
+    return ["code"] + [f for f in dict.fromkeys(requested) if f != "code"]
+
+
+def list_positions(
+    active_only: bool = True,
+    *,
+    after: str = "",
+    limit: int = 0,
+    fields: Optional[List[str]] = None,
+    code_prefix: str = "",
+    q: str = "",
+    updated_since: int = 0,
+    held_only: bool = False,
+) -> Dict[str, object]:
+    """按 code 升序返回持仓；limit>0 时按 after=code 做 keyset 分页并返回 next_after。"""
+    columns = list(fields) if fields else list(DEFAULT_POSITION_FIELDS)
+    select_cols = columns if "updated_at" in columns else columns + ["updated_at"]
+
+    where: List[str] = []
+    params: List[object] = []
+    if active_only:
+        where.append("is_active=1")
+    if after:
+        where.append("code > ?")
+        params.append(after)
+    if code_prefix:
+        # 前缀转成区间条件，可走 (is_active, code) 索引
+        where.append("code >= ? AND code < ?")
+        params.extend([code_prefix, code_prefix + "\uffff"])
+    if q:
+        where.append("(code LIKE ? ESCAPE '\\' OR name LIKE ? ESCAPE '\\')")
+        pattern = "%" + q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        params.extend([pattern, pattern])
+    if updated_since:
+        where.append("updated_at >= ?")
+        params.append(int(updated_since))
+    if held_only:
+        where.append("share > 0")
+
+    page_size = min(int(limit), MAX_POSITIONS_PAGE) if limit and limit > 0 else 0
+    sql = f"SELECT {', '.join(select_cols)} FROM positions"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY code"
+    if page_size:
+        sql += " LIMIT ?"
+        params.append(page_size + 1)
+
     with get_conn() as conn:
-        where_sql = "WHERE is_active=1" if active_only else ""
-        rows = conn.execute(
-            f"""
-            SELECT code, name, share, cost, current_profit, is_active, created_at, updated_at
-            FROM positions
-            {where_sql}
-            ORDER BY code
-            """
-        ).fetchall()
+        conn.row_factory = None
+        rows = conn.execute(sql, params).fetchall()
+        version = _current_position_version(conn)
+
+    next_after: Optional[str] = None
+    if page_size and len(rows) > page_size:
+        rows = rows[:page_size]
+        next_after = rows[-1][0]
 
+    converters = [(i, name, _POSITION_CONVERTERS[name]) for i, name in enumerate(select_cols) if name in columns]
+    updated_idx = select_cols.index("updated_at")
     positions: List[Dict[str, object]] = []
     max_updated_at = 0
     for r in rows:
-        updated = int(r["updated_at"] or 0)
+        updated = int(r[updated_idx] or 0)
         if updated > max_updated_at:
             max_updated_at = updated
-        positions.append(
-            {
-                "code": r["code"],
-                "name": r["name"],
-                "share": float(r["share"] or 0),
-                "cost": float(r["cost"] or 0),
-                "current_profit": float(r["current_profit"] or 0),
-                "is_active": int(r["is_active"] or 0),
-                "created_at": int(r["created_at"] or 0),
-            }
-        )
+        positions.append({name: convert(r[i]) for i, name, convert in converters})
+
+    result: Dict[str, object] = {"positions": positions, "updated_at": max_updated_at, "version": version}
+    if page_size:
+        result["next_after"] = next_after
+    return result
+
+
+def _current_position_version(conn: sqlite3.Connection) -> int:
+    row = conn.execute("SELECT MAX(version) FROM position_changes").fetchone()
+    return int(row[0] or 0)
+
+
+def list_position_changes(since: int = 0, limit: int = 0) -> Dict[str, object]:
+    """返回 version > since 以来发生变化的持仓（每个 code 只给最新状态），删除以 op=delete 表示。
+
+    version 为客户端下次请求应携带的 since；has_more 为真时需继续拉取。
+    """
+    page_size = min(int(limit), MAX_POSITIONS_PAGE) if limit and limit > 0 else 0
+    sql = f"""
+        SELECT c.version, c.code, c.op, {", ".join("p." + f for f in POSITION_FIELDS[1:])}, p.code
+        FROM position_changes c
+        LEFT JOIN positions p ON p.code = c.code
+        WHERE c.version > ? AND c.version <= ?
+          AND c.version = (SELECT MAX(c2.version) FROM position_changes c2 WHERE c2.code = c.code)
+        ORDER BY c.version
+    """
+
+    with get_conn() as conn:
+        conn.row_factory = None
+        # 先取当前版本再按上界查询，避免查询期间的新写入被跳过
+        version = _current_position_version(conn)
+        params: List[object] = [int(since), version]
+        if page_size:
+            sql += " LIMIT ?"
+            params.append(page_size + 1)
+        rows = conn.execute(sql, params).fetchall()
+
+    has_more = bool(page_size) and len(rows) > page_size
+    if has_more:
+        rows = rows[:page_size]
+        version = int(rows[-1][0])
+
+    changes: List[Dict[str, object]] = []
+    for r in rows:
+        row_version, code, op = int(r[0]), r[1], r[2]
+        if op == "delete" or r[-1] is None:
+            changes.append({"version": row_version, "code": code, "op": "delete"})
+            continue
+        position = {"code": code}
+        for i, name in enumerate(POSITION_FIELDS[1:], start=3):
+            position[name] = _POSITION_CONVERTERS[name](r[i])
+        changes.append({"version": row_version, "code": code, "op": "upsert", "position": position})
+
+    return {"changes": changes, "version": version, "has_more": has_more}
+
+
+def position_version() -> int:
+    """持仓变更日志的当前版本号，任何 upsert/删除都会使其增大。"""
+    with get_conn() as conn:
+        return _current_position_version(conn)
+
+
+def active_position_codes() -> List[str]:
+    with get_conn() as conn:
+        conn.row_factory = None
+        return [r[0] for r in conn.execute("SELECT code FROM positions WHERE is_active=1 ORDER BY code").fetchall()]
+
+
+def backfill_position_names(names: Dict[str, str]) -> int:
+    """批量补全空名称，一个事务内完成并记录变更，返回补全条数。"""
+    items = {code: name for code, name in names.items() if code and name}
+    if not items:
+        return 0
+    now = int(time.time())
+    with get_conn() as conn:
+        conn.row_factory = None
+        empty = [
+            r[0]
+            for r in conn.execute(
+                "SELECT value FROM json_each(?) JOIN positions ON positions.code = value "
+                "WHERE positions.name IS NULL OR TRIM(positions.name) = ''",
+                (json.dumps(list(items)),),
+            ).fetchall()
+        ]
+        conn.executemany("UPDATE positions SET name=?, updated_at=? WHERE code=?", [(items[c], now, c) for c in empty])
+        _log_position_changes(conn, empty, "upsert", now)
+        conn.commit()
+    return len(empty)
+
+
+def position_valuation(pcts: Dict[str, Optional[float]]) -> Dict[str, object]:
+    """按 code -> 预估涨跌幅(%) 计算活跃持仓的预估当日盈亏，逐行结果与合计均在 SQLite 内完成。
+
+    涨跌幅通过 json_each 传入，未估出的基金按 0 计入合计。
+    """
+    payload = json.dumps({code: pct for code, pct in pcts.items() if pct is not None})
+    row_sql = """
+        SELECT p.code, p.name, p.share, p.cost, p.current_profit,
+               p.share * p.cost AS cost_value,
+               e.value AS estimated_pct,
+               p.share * p.cost * COALESCE(e.value, 0) / 100.0 AS estimate_pnl
+        FROM positions p
+        LEFT JOIN json_each(?) e ON e.key = p.code
+        WHERE p.is_active = 1
+        ORDER BY p.code
+    """
+    total_sql = """
+        SELECT COUNT(*),
+               COALESCE(SUM(p.share * p.cost), 0),
+               COALESCE(SUM(p.current_profit), 0),
+               COALESCE(SUM(p.share * p.cost * COALESCE(e.value, 0) / 100.0), 0),
+               COUNT(e.value)
+        FROM positions p
+        LEFT JOIN json_each(?) e ON e.key = p.code
+        WHERE p.is_active = 1
+    """
+    with get_conn() as conn:
+        conn.row_factory = None
+        rows = conn.execute(row_sql, (payload,)).fetchall()
+        count, total_cost, holding_profit, estimate_pnl, estimated = conn.execute(total_sql, (payload,)).fetchone()
+        version = _current_position_version(conn)
 
-    return {"positions": positions, "updated_at": max_updated_at}
+    positions = [
+        {
+            "code": r[0],
+            "name": r[1],
+            "share": float(r[2] or 0),
+            "cost": float(r[3] or 0),
+            "current_profit": float(r[4] or 0),
+            "cost_value": round(float(r[5] or 0), 4),
+            "estimated_pct": None if r[6] is None else float(r[6]),
+            "estimate_pnl": round(float(r[7] or 0), 4),
+        }
+        for r in rows
+    ]
+    market_value = float(total_cost) + float(holding_profit)
+    totals = {
+        "positions": int(count),
+        "estimated_positions": int(estimated),
+        "total_cost": round(float(total_cost), 4),
+        "holding_profit": round(float(holding_profit), 4),
+        "market_value": round(market_value, 4),
+        "estimate_pnl": round(float(estimate_pnl), 4),
+        "estimate_pct": round(float(estimate_pnl) / market_value * 100, 4) if market_value else 0.0,
+    }
+    return {"positions": positions, "totals": totals, "version": version}
 
 
 def upsert_position(
@@ -117,12 +412,14 @@ def upsert_position(
                 """,
                 (final_name, share, cost, current_profit, final_active, now, code),
             )
+        _log_position_changes(conn, [code], "upsert", now)
         conn.commit()
 
 
 def bulk_upsert_positions(positions: List[Dict[str, object]]) -> int:
     now = int(time.time())
     count = 0
+    changed: List[str] = []
     with get_conn() as conn:
         for item in positions:
             code = str(item.get("code", "")).strip()
@@ -152,11 +449,64 @@ def bulk_upsert_positions(positions: List[Dict[str, object]]) -> int:
                     """,
                     (final_name, share, cost, current_profit, is_active, now, code),
                 )
+            changed.append(code)
             count += 1
+        _log_position_changes(conn, changed, "upsert", now)
         conn.commit()
     return count
 
 
+# (code, name, share, cost, current_profit, is_active)；name 为 None 时保留库中已有名称
+ImportRow = Tuple[str, Optional[str], float, float, float, int]
+
+
+def import_position_batches(batches: Iterable[List[ImportRow]]) -> int:
+    """逐批 executemany upsert 并记录变更，共用一个连接、每批单独提交；created_at 只在新插入时写入。
+
+    批与批之间不持有事务，流式导入等待请求体时不阻塞其他写入。返回写入行数。
+    """
+    count = 0
+    with get_conn() as conn:
+        for rows in batches:
+            if not rows:
+                continue
+            now = int(time.time())
+            conn.executemany(
+                """
+                INSERT INTO positions(code, name, share, cost, current_profit, is_active, created_at, updated_at)
+                VALUES(?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(code) DO UPDATE SET
+                  name=COALESCE(excluded.name, positions.name), share=excluded.share, cost=excluded.cost,
+                  current_profit=excluded.current_profit, is_active=excluded.is_active, updated_at=excluded.updated_at
+                """,
+                [row + (now, now) for row in rows],
+            )
+            _log_position_changes(conn, [row[0] for row in rows], "upsert", now)
+            conn.commit()
+            count += len(rows)
+    return count
+
+
+def iter_position_pages(active_only: bool = False, page_size: int = 1000) -> Iterator[List[Dict[str, object]]]:
+    """按 code 升序逐页读出全部持仓（字段同 POSITION_FIELDS）。
+
+    每页一次 keyset 短查询，导出期间不长时间占用读锁，内存只保留一页。
+    """
+    where = "code > ?" + (" AND is_active=1" if active_only else "")
+    sql = f"SELECT {', '.join(POSITION_FIELDS)} FROM positions WHERE {where} ORDER BY code LIMIT ?"
+    after = ""
+    while True:
+        with get_conn() as conn:
+            conn.row_factory = None
+            rows = conn.execute(sql, (after, page_size)).fetchall()
+        if not rows:
+            return
+        yield [{name: _POSITION_CONVERTERS[name](r[i]) for i, name in enumerate(POSITION_FIELDS)} for r in rows]
+        if len(rows) < page_size:
+            return
+        after = rows[-1][0]
+
+
 def set_position_active(code: str, is_active: int) -> bool:
     now = int(time.time())
     with get_conn() as conn:
@@ -164,6 +514,8 @@ def set_position_active(code: str, is_active: int) -> bool:
             "UPDATE positions SET is_active=?, updated_at=? WHERE code=?",
             (int(bool(is_active)), now, code),
         )
+        if cur.rowcount > 0:
+            _log_position_changes(conn, [code], "upsert", now)
         conn.commit()
         return cur.rowcount > 0
 
@@ -171,6 +523,8 @@ def set_position_active(code: str, is_active: int) -> bool:
 def delete_position(code: str) -> bool:
     with get_conn() as conn:
         cur = conn.execute("DELETE FROM positions WHERE code=?", (code,))
+        if cur.rowcount > 0:
+            _log_position_changes(conn, [code], "delete", int(time.time()))
         conn.commit()
         return cur.rowcount > 0
 
@@ -193,6 +547,7 @@ def sync_positions(codes: List[str]) -> None:
                     "UPDATE positions SET is_active=1, updated_at=? WHERE code=?",
                     (now, code),
                 )
+        _log_position_changes(conn, codes, "upsert", now)
         conn.commit()
 
 
@@ -206,5 +561,130 @@ def update_position_name_if_empty(code: str, name: str) -> None:
         existing = (row["name"] or "").strip()
         if existing:
             return
-        conn.execute("UPDATE positions SET name=?, updated_at=? WHERE code=?", (name, int(time.time()), code))
+        now = int(time.time())
+        conn.execute("UPDATE positions SET name=?, updated_at=? WHERE code=?", (name, now, code))
+        _log_position_changes(conn, [code], "upsert", now)
+        conn.commit()
+
+
+def load_symbol_secids() -> Dict[str, Tuple[Optional[str], int]]:
+    """symbol -> (secid, checked_at)；secid 为 NULL 表示所有候选都没有返回数据。"""
+    with get_conn() as conn:
+        rows = conn.execute("SELECT symbol, secid, checked_at FROM symbol_secid").fetchall()
+    return {str(r["symbol"]): (r["secid"], int(r["checked_at"] or 0)) for r in rows}
+
+
+def save_symbol_secids(items: Iterable[Tuple[str, Optional[str], int]]) -> None:
+    with get_conn() as conn:
+        conn.executemany(
+            """
+            INSERT INTO symbol_secid(symbol, secid, checked_at) VALUES(?, ?, ?)
+            ON CONFLICT(symbol) DO UPDATE SET secid=excluded.secid, checked_at=excluded.checked_at
+            """,
+            list(items),
+        )
         conn.commit()
+
+
+def load_quote_snapshots() -> Dict[str, Tuple[float, str]]:
+    """symbol -> (收盘涨跌幅, 交易日)。"""
+    with get_conn() as conn:
+        rows = conn.execute("SELECT symbol, pct, trade_date FROM quote_snapshots").fetchall()
+    return {str(r["symbol"]): (float(r["pct"]), str(r["trade_date"])) for r in rows}
+
+
+def save_quote_snapshots(items: Iterable[Tuple[str, float, str]]) -> None:
+    now = int(time.time())
+    with get_conn() as conn:
+        conn.executemany(
+            """
+            INSERT INTO quote_snapshots(symbol, pct, trade_date, updated_at) VALUES(?, ?, ?, ?)
+            ON CONFLICT(symbol) DO UPDATE SET pct=excluded.pct, trade_date=excluded.trade_date, updated_at=excluded.updated_at
+            """,
+            [(symbol, pct, trade_date, now) for symbol, pct, trade_date in items],
+        )
+        conn.commit()
+
+
+def get_estimate_snapshot(code: str) -> Optional[Tuple[str, Dict[str, object]]]:
+    with get_conn() as conn:
+        row = conn.execute("SELECT session_key, payload FROM estimate_snapshots WHERE code=?", (code,)).fetchone()
+    if row is None:
+        return None
+    return str(row["session_key"]), json.loads(row["payload"])
+
+
+def save_estimate_snapshot(code: str, session_key: str, payload: Dict[str, object]) -> None:
+    with get_conn() as conn:
+        conn.execute(
+            """
+            INSERT INTO estimate_snapshots(code, session_key, payload, updated_at) VALUES(?, ?, ?, ?)
+            ON CONFLICT(code) DO UPDATE SET session_key=excluded.session_key, payload=excluded.payload, updated_at=excluded.updated_at
+            """,
+            (code, session_key, json.dumps(payload, ensure_ascii=False), int(time.time())),
+        )
+        conn.commit()
+
+
+def iter_estimate_snapshot_pages(page_size: int = 1000) -> Iterator[List[Tuple[str, str, int, Dict[str, object]]]]:
+    """按 code 升序逐页读出已冻结的估值快照 (code, session_key, updated_at, payload)。"""
+    after = ""
+    while True:
+        with get_conn() as conn:
+            conn.row_factory = None
+            rows = conn.execute(
+                "SELECT code, session_key, updated_at, payload FROM estimate_snapshots WHERE code > ? ORDER BY code LIMIT ?",
+                (after, page_size),
+            ).fetchall()
+        if not rows:
+            return
+        yield [(str(r[0]), str(r[1] or ""), int(r[2] or 0), json.loads(r[3] or "{}")) for r in rows]
+        if len(rows) < page_size:
+            return
+        after = rows[-1][0]
+
+
+def get_fund_meta(code: str) -> Optional[Tuple[str, int]]:
+    """(name, updated_at)；updated_at 为最近一次成功下载 pingzhongdata 的时间。"""
+    with get_conn() as conn:
+        row = conn.execute("SELECT name, updated_at FROM fund_meta WHERE code=?", (code,)).fetchone()
+    if row is None:
+        return None
+    return str(row["name"] or ""), int(row["updated_at"] or 0)
+
+
+def save_fund_data(code: str, name: str, nav_rows: List[NavRow]) -> int:
+    """写入基金名称，并只追加晚于库中最新日期的净值（按日期升序传入），返回新增行数。"""
+    with get_conn() as conn:
+        row = conn.execute("SELECT MAX(date) FROM nav_history WHERE code=?", (code,)).fetchone()
+        latest = row[0] or ""
+        fresh = [r for r in nav_rows if r[0] > latest]
+        conn.executemany(
+            "INSERT OR IGNORE INTO nav_history(code, date, nav, accum_nav, change_percent) VALUES(?, ?, ?, ?, ?)",
+            [(code, *r) for r in fresh],
+        )
+        conn.execute(
+            """
+            INSERT INTO fund_meta(code, name, updated_at) VALUES(?, ?, ?)
+            ON CONFLICT(code) DO UPDATE SET name=excluded.name, updated_at=excluded.updated_at
+            """,
+            (code, name, int(time.time())),
+        )
+        conn.commit()
+    return len(fresh)
+
+
+def query_nav_history(code: str, start: str = "", end: str = "") -> List[NavRow]:
+    """按日期升序返回 [start, end] 内的 (date, nav, accum_nav, change_percent)，走 (code, date) 主键。"""
+    sql = "SELECT date, nav, accum_nav, change_percent FROM nav_history WHERE code=?"
+    params: List[object] = [code]
+    if start:
+        sql += " AND date >= ?"
+        params.append(start)
+    if end:
+        sql += " AND date <= ?"
+        params.append(end)
+    sql += " ORDER BY date"
+    with get_conn() as conn:
+        conn.row_factory = None
+        return [tuple(r) for r in conn.execute(sql, params).fetchall()]
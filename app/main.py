@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import json
 import urllib.parse
 from pathlib import Path
+from typing import Iterator
 
-from fastapi import FastAPI, Query
-from fastapi.responses import FileResponse, JSONResponse
+import anyio.from_thread
+from fastapi import FastAPI, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 
 from app.config import (
     DEFAULT_FUND_CODES,
@@ -12,19 +16,24 @@ from app.config import (
     HOLDINGS_PROVIDER,
     INDEX_PROVIDER,
     QUOTE_PROVIDER,
-    get_gold_provider,
-    get_index_provider,
+    WARMUP_ENABLED,
 )
 from app.db import (
     bulk_upsert_positions,
     delete_position,
     ensure_tables,
+    list_position_changes,
     list_positions,
+    parse_position_fields,
     set_position_active,
     sync_positions,
     update_position_name_if_empty,
     upsert_position,
 )
+from app.providers.composite import quote_backend_stats
+from app.providers.fund_catalog import catalog_fund_names, fund_catalog_status, search_funds, start_fund_catalog
+from app.providers.ratelimit import get_outbound_limiter
+from app.providers.shared_cache import get_shared_cache
 from app.schemas import (
     EstimateResponse,
     GoldQuote,
@@ -33,12 +42,57 @@ from app.schemas import (
     PortfolioSyncRequest,
     PositionUpsertRequest,
 )
-from app.services.estimate import build_fund_detail, estimate_codes
+from app.services.admission import AdmissionRejected, admission_stats, gate_for_path
+from app.services.bulk_io import MEDIA_TYPES, export_estimate_history, export_positions, import_positions, parse_format
+from app.services.columnar import shape_estimate
+from app.services.estimate import (
+    build_fund_details,
+    cached_estimate_codes,
+    cached_fund_detail,
+    iter_fund_details,
+)
+from app.services.market_hub import get_market_hub, parse_markets
+from app.services.nav_history import get_nav_history
+from app.services.universe import top_funds
+from app.services.valuation import value_portfolio
+from app.services.warmup import start_cache_warmup, warmup_status
 
 app = FastAPI(title="Fund Dashboard API")
 WEB_DIR = Path(__file__).parent / "web"
 
 
+class AdmissionMiddleware:
+    """昂贵接口的准入控制。名额在整个 ASGI 调用结束后释放：body 发送完毕、客户端断开、
+    HEAD 请求不迭代 body 时都会走到 finally。"""
+
+    def __init__(self, app) -> None:  # noqa: ANN001
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:  # noqa: ANN001
+        gate = gate_for_path(scope["path"]) if scope["type"] == "http" else None
+        if gate is None:
+            await self.app(scope, receive, send)
+            return
+        try:
+            # 在事件循环里排队，不占用同步接口的线程池，廉价接口不受影响
+            entered_at = await gate.enter_async()
+        except AdmissionRejected as exc:
+            response = JSONResponse(
+                status_code=exc.status,
+                content={"ok": False, "error": str(exc)},
+                headers={"Retry-After": str(exc.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            gate.release(entered_at)
+
+
+app.add_middleware(AdmissionMiddleware)
+
+
 def _web_file(filename: str, media_type: str | None = None) -> FileResponse:
     return FileResponse(WEB_DIR / filename, media_type=media_type)
 
@@ -46,6 +100,9 @@ def _web_file(filename: str, media_type: str | None = None) -> FileResponse:
 @app.on_event("startup")
 def startup() -> None:
     ensure_tables()
+    start_fund_catalog()
+    if WARMUP_ENABLED:
+        start_cache_warmup()
 
 
 @app.get("/")
@@ -87,9 +144,18 @@ def health() -> dict:
         "quote_provider": QUOTE_PROVIDER,
         "index_provider": INDEX_PROVIDER,
         "gold_provider": GOLD_PROVIDER,
+        "admission": admission_stats(),
+        "cache": get_shared_cache().stats(),
+        "warmup": warmup_status(),
+        "catalog": fund_catalog_status(),
     }
 
 
+@app.get("/api/upstream/limits")
+def api_upstream_limits() -> dict:
+    return {"hosts": get_outbound_limiter().stats(), "quote_backends": quote_backend_stats()}
+
+
 @app.get("/api/default-codes")
 def default_codes() -> dict:
     return {"codes": DEFAULT_FUND_CODES}
@@ -97,29 +163,114 @@ def default_codes() -> dict:
 
 @app.get("/api/indexes")
 def api_indexes(market: str = Query(default="cn")) -> dict:
-    provider = get_index_provider()
-    rows = provider.get_indexes(market)
-    quotes = [IndexQuote(**row.__dict__).model_dump() for row in rows]
-    return {"market": market, "quotes": quotes}
+    # market 可为逗号分隔的多个市场，各适配器 × 市场并发拉取
+    hub = get_market_hub()
+    result = hub.get_indexes(parse_markets(market, hub.index_markets()))
+    quotes = [IndexQuote(**row.__dict__).model_dump() for row in result["quotes"]]
+    return {"market": market, "quotes": quotes, "sources": result["sources"], "partial": result["partial"]}
 
 
 @app.get("/api/gold/realtime")
 def api_gold_realtime() -> dict:
-    provider = get_gold_provider()
-    rows = provider.get_gold_quotes()
-    quotes = [GoldQuote(**row.__dict__).model_dump() for row in rows]
-    return {"quotes": quotes}
+    result = get_market_hub().get_gold_quotes()
+    quotes = [GoldQuote(**row.__dict__).model_dump() for row in result["quotes"]]
+    return {"quotes": quotes, "sources": result["sources"], "partial": result["partial"]}
+
+
+
+
+@app.get("/api/market/funds/top")
+def api_market_funds_top(
+    by: str = Query(default="estimated_pct"),
+    n: int = Query(default=20, ge=1),
+    order: str = Query(default="desc"),
+) -> JSONResponse:
+    try:
+        data = top_funds(by=by.strip(), n=n, ascending=order == "asc")
+    except ValueError as exc:
+        return JSONResponse(status_code=400, content={"ok": False, "error": str(exc)})
+    return JSONResponse(content=data)
+
+
+@app.get("/api/funds/search")
+def api_fund_search(q: str = Query(default=""), limit: int = Query(default=10, ge=1, le=50)) -> dict:
+    return search_funds(q, limit)
+
 
+@app.get("/api/funds/names")
+def api_fund_names(codes: str = Query(default="")) -> dict:
+    code_list = [c.strip() for c in urllib.parse.unquote(codes).split(",") if c.strip()]
+    return {"names": catalog_fund_names(code_list)}
 
 
+@app.get("/api/funds/details")
+def api_fund_details(codes: str = Query(default=""), format: str = Query(default="json")):  # noqa: A002, ANN201
+    code_list = [c.strip() for c in urllib.parse.unquote(codes).split(",") if c.strip()]
+    if format == "ndjson":
+        lines = (json.dumps(item, ensure_ascii=False) + "\n" for item in iter_fund_details(code_list))
+        return StreamingResponse(lines, media_type="application/x-ndjson")
+    return build_fund_details(code_list)
+
 
 @app.get("/api/funds/{code}/detail")
 def api_fund_detail(code: str) -> dict:
-    return build_fund_detail(code.strip())
+    return cached_fund_detail(code.strip())
+
+
+@app.get("/api/funds/{code}/nav")
+def api_fund_nav(
+    code: str,
+    start: str = Query(default=""),
+    end: str = Query(default=""),
+    points: int = Query(default=0, ge=0),
+) -> JSONResponse:
+    try:
+        data = get_nav_history(code.strip(), start=start.strip(), end=end.strip(), points=points)
+    except ValueError as exc:
+        return JSONResponse(status_code=400, content={"ok": False, "error": str(exc)})
+    return JSONResponse(content=data)
 
 @app.get("/api/portfolio")
-def api_portfolio(active_only: int = Query(default=1)) -> dict:
-    return list_positions(active_only=active_only != 0)
+def api_portfolio(
+    active_only: int = Query(default=1),
+    after: str = Query(default=""),
+    limit: int = Query(default=0, ge=0),
+    fields: str = Query(default=""),
+    code_prefix: str = Query(default=""),
+    q: str = Query(default=""),
+    updated_since: int = Query(default=0, ge=0),
+    held_only: int = Query(default=0),
+) -> JSONResponse:
+    try:
+        selected = parse_position_fields(fields)
+    except ValueError as exc:
+        return JSONResponse(status_code=400, content={"ok": False, "error": str(exc)})
+    data = list_positions(
+        active_only=active_only != 0,
+        after=after.strip(),
+        limit=limit,
+        fields=selected,
+        code_prefix=code_prefix.strip(),
+        q=q.strip(),
+        updated_since=updated_since,
+        held_only=held_only != 0,
+    )
+    return JSONResponse(content=data)
+
+
+@app.get("/api/portfolio/changes")
+def api_portfolio_changes(since: int = Query(default=0, ge=0), limit: int = Query(default=0, ge=0)) -> dict:
+    return list_position_changes(since=since, limit=limit)
+
+
+@app.get("/api/portfolio/valuation")
+def api_portfolio_valuation(
+    details: int = Query(default=1),
+    format: str = Query(default="json"),  # noqa: A002
+    top: int = Query(default=0, ge=0),
+) -> JSONResponse:
+    data = value_portfolio(include_details=details != 0)
+    return JSONResponse(content=shape_estimate(data, columnar=format == "columnar", top=top or None, key="positions"))
 
 
 @app.post("/api/portfolio/positions")
@@ -145,6 +296,52 @@ def api_bulk_upsert_positions(payload: PortfolioBulkUpsertRequest) -> dict:
     return {"ok": True, "count": count}
 
 
+@app.post("/api/portfolio/positions/import")
+async def api_import_positions(request: Request, format: str = Query(default="csv")) -> JSONResponse:  # noqa: A002
+    try:
+        fmt = parse_format(format)
+    except ValueError as exc:
+        return JSONResponse(status_code=400, content={"ok": False, "error": str(exc)})
+    body = request.stream().__aiter__()
+
+    def _chunks() -> Iterator[bytes]:
+        # 在工作线程里逐块取请求体，解析与写库不阻塞事件循环，也不把整个文件读进内存
+        while True:
+            try:
+                yield anyio.from_thread.run(body.__anext__)
+            except StopAsyncIteration:
+                return
+
+    try:
+        result = await run_in_threadpool(import_positions, _chunks(), fmt)
+    except ValueError as exc:
+        return JSONResponse(status_code=400, content={"ok": False, "error": str(exc)})
+    return JSONResponse(content=result)
+
+
+def _export_response(lines: Iterator[str], fmt: str, filename: str) -> StreamingResponse:
+    headers = {"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'}
+    return StreamingResponse(lines, media_type=MEDIA_TYPES[fmt], headers=headers)
+
+
+@app.get("/api/portfolio/positions/export")
+def api_export_positions(format: str = Query(default="csv"), active_only: int = Query(default=0)):  # noqa: A002, ANN201
+    try:
+        fmt = parse_format(format)
+    except ValueError as exc:
+        return JSONResponse(status_code=400, content={"ok": False, "error": str(exc)})
+    return _export_response(export_positions(fmt, active_only=active_only != 0), fmt, "positions")
+
+
+@app.get("/api/estimate/history/export")
+def api_export_estimate_history(format: str = Query(default="csv")):  # noqa: A002, ANN201
+    try:
+        fmt = parse_format(format)
+    except ValueError as exc:
+        return JSONResponse(status_code=400, content={"ok": False, "error": str(exc)})
+    return _export_response(export_estimate_history(fmt), fmt, "estimate_history")
+
+
 @app.delete("/api/portfolio/positions/{code}")
 def api_delete_position(code: str) -> dict:
     cleaned = code.strip()
@@ -180,12 +377,16 @@ def api_sync_portfolio(payload: PortfolioSyncRequest) -> dict:
 
 
 @app.get("/api/estimate", response_model=EstimateResponse)
-def api_estimate(codes: str = Query(default="")) -> JSONResponse:
+def api_estimate(
+    codes: str = Query(default=""),
+    format: str = Query(default="json"),  # noqa: A002
+    top: int = Query(default=0, ge=0),
+) -> JSONResponse:
     raw_codes = urllib.parse.unquote(codes)
     code_list = [c.strip() for c in raw_codes.split(",") if c.strip()]
-    result = estimate_codes(code_list)
+    result = cached_estimate_codes(code_list)
 
     for item in result.get("results", []):
         update_position_name_if_empty(item.get("code", ""), item.get("name", ""))
 
-    return JSONResponse(content=result)
+    return JSONResponse(content=shape_estimate(result, columnar=format == "columnar", top=top or None))
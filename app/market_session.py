@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import datetime as dt
+import json
+import logging
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 各市场交易时段（交易所当地时间），午休视为盘中暂停而非收盘
+SESSIONS: Dict[str, List[Tuple[dt.time, dt.time]]] = {
+    "cn": [(dt.time(9, 30), dt.time(11, 30)), (dt.time(13, 0), dt.time(15, 0))],
+    "hk": [(dt.time(9, 30), dt.time(12, 0)), (dt.time(13, 0), dt.time(16, 0))],
+    "us": [(dt.time(9, 30), dt.time(16, 0))],
+}
+
+_TIMEZONES = {"cn": "Asia/Shanghai", "hk": "Asia/Hong_Kong", "us": "America/New_York"}
+# 缺少 tzdata（如部分 Windows 环境）时退化为固定偏移，美股夏令时误差一小时
+_FALLBACK_OFFSETS = {"cn": 8, "hk": 8, "us": -5}
+
+# Eastmoney secid 市场前缀 -> 市场
+SECID_MARKETS = {"0": "cn", "1": "cn", "116": "hk", "105": "us", "106": "us", "107": "us"}
+
+_US_TICKER_RE = re.compile(r"[A-Z.]{1,10}")
+
+
+def classify_symbol(symbol: str) -> Optional[str]:
+    """按持仓代码形态判断所属市场，规则与 Eastmoney 候选 secid 一致。"""
+    s = symbol.upper().strip()
+    if s.isdigit() and len(s) == 6:
+        return "cn"
+    if s.isdigit() and len(s) == 5:
+        return "hk"
+    if _US_TICKER_RE.fullmatch(s):
+        return "us"
+    return None
+
+
+def market_of_secid(secid: str) -> Optional[str]:
+    return SECID_MARKETS.get(secid.split(".", 1)[0])
+
+
+def _zone(market: str) -> dt.tzinfo:
+    try:
+        from zoneinfo import ZoneInfo
+
+        return ZoneInfo(_TIMEZONES[market])
+    except Exception:  # noqa: BLE001
+        return dt.timezone(dt.timedelta(hours=_FALLBACK_OFFSETS[market]))
+
+
+class TradingCalendar:
+    """周末 + 本地节假日文件（JSON：{"cn": ["2026-01-01", ...], "hk": [...], "us": [...]}）。"""
+
+    def __init__(self, holidays_file: Optional[Path] = None) -> None:
+        self.holidays_file = holidays_file
+        self._lock = threading.Lock()
+        self._holidays: Optional[Dict[str, Set[dt.date]]] = None
+
+    def _load(self) -> Dict[str, Set[dt.date]]:
+        if self._holidays is not None:
+            return self._holidays
+        with self._lock:
+            if self._holidays is not None:
+                return self._holidays
+            holidays: Dict[str, Set[dt.date]] = {market: set() for market in SESSIONS}
+            if self.holidays_file is not None and self.holidays_file.exists():
+                try:
+                    raw = json.loads(self.holidays_file.read_text(encoding="utf-8"))
+                    for market in SESSIONS:
+                        holidays[market] = {dt.date.fromisoformat(day) for day in raw.get(market, [])}
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning("节假日文件解析失败，仅按周末判断: %s", exc)
+            self._holidays = holidays
+            return holidays
+
+    def reload(self) -> None:
+        with self._lock:
+            self._holidays = None
+
+    def is_trading_day(self, market: str, day: dt.date) -> bool:
+        return day.weekday() < 5 and day not in self._load()[market]
+
+    def local_now(self, market: str, now: Optional[dt.datetime] = None) -> dt.datetime:
+        zone = _zone(market)
+        if now is None:
+            return dt.datetime.now(zone)
+        if now.tzinfo is None:
+            now = now.astimezone()
+        return now.astimezone(zone)
+
+    def session_state(self, market: str, now: Optional[dt.datetime] = None) -> str:
+        """返回 open / break（午休）/ pre（开盘前）/ closed（收盘后或非交易日）。"""
+        local = self.local_now(market, now)
+        if not self.is_trading_day(market, local.date()):
+            return "closed"
+        clock = local.time()
+        sessions = SESSIONS[market]
+        if clock < sessions[0][0]:
+            return "pre"
+        for start, end in sessions:
+            if start <= clock < end:
+                return "open"
+        if clock >= sessions[-1][1]:
+            return "closed"
+        return "break"
+
+    def is_open(self, market: str, now: Optional[dt.datetime] = None) -> bool:
+        return self.session_state(market, now) in {"open", "break"}
+
+    def last_close_date(self, market: str, now: Optional[dt.datetime] = None) -> dt.date:
+        """最近一个已经收盘的交易日（当地日期）。"""
+        local = self.local_now(market, now)
+        day = local.date()
+        if not (self.is_trading_day(market, day) and local.time() >= SESSIONS[market][-1][1]):
+            day -= dt.timedelta(days=1)
+        for _ in range(30):
+            if self.is_trading_day(market, day):
+                return day
+            day -= dt.timedelta(days=1)
+        return day
+
+
+_CALENDAR: Optional[TradingCalendar] = None
+
+
+def get_calendar() -> TradingCalendar:
+    global _CALENDAR
+    if _CALENDAR is None:
+        from app.config import MARKET_HOLIDAYS_FILE
+
+        _CALENDAR = TradingCalendar(Path(MARKET_HOLIDAYS_FILE) if MARKET_HOLIDAYS_FILE else None)
+    return _CALENDAR
+
+
+def session_key(markets: Set[str], now: Optional[dt.datetime] = None) -> Optional[str]:
+    """所有市场都已收盘时返回形如 "cn:2026-10-16|us:2026-10-16" 的收盘批次标识，否则返回 None。"""
+    if not markets:
+        return None
+    calendar = get_calendar()
+    parts = []
+    for market in sorted(markets):
+        if calendar.session_state(market, now) not in {"pre", "closed"}:
+            return None
+        parts.append(f"{market}:{calendar.last_close_date(market, now).isoformat()}")
+    return "|".join(parts)
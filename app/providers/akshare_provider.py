@@ -1,23 +1,107 @@
 from __future__ import annotations
 
+import importlib.util
+import threading
 import time
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from app.providers.base import Holding, HoldingsProvider, ProviderError
+from app.providers.ratelimit import get_outbound_limiter
 
-try:
-    import akshare as ak  # type: ignore
-except Exception:  # noqa: BLE001
-    ak = None
+# akshare 会连带加载 pandas 等重依赖，推迟到第一次真正抓取时再 import
+ak = None
+pd = None
+_IMPORT_LOCK = threading.Lock()
+_AVAILABLE: Optional[bool] = None
+
+# 每只基金最近一次拿到数据的 (年份, 披露期, 确认更新年份无数据的时间)，下次优先查询该年份
+_LAST_DISCLOSURE: Dict[str, Tuple[int, str, float]] = {}
+_LAST_DISCLOSURE_LOCK = threading.Lock()
+# 任一基金最近一次命中的年份，作为尚无记忆的基金的首选年份（披露节奏全市场一致）
+_LAST_YEAR_ANY: Optional[Tuple[int, float]] = None
+# 记忆的年份早于当年时，超过该时长后重新优先探测较新的年份，避免错过新一年的披露
+_REPROBE_NEWER_SECONDS = 6 * 3600
 
 
 def is_available() -> bool:
-    return ak is not None
+    """只检查 akshare 是否可被 import，不实际加载。"""
+    global _AVAILABLE
+    if ak is not None:
+        return True
+    if _AVAILABLE is None:
+        _AVAILABLE = importlib.util.find_spec("akshare") is not None
+    return _AVAILABLE
+
+
+def _load_akshare() -> None:
+    global ak, pd
+    if ak is not None:
+        return
+    with _IMPORT_LOCK:
+        if ak is not None:
+            return
+        try:
+            import akshare  # type: ignore
+            import pandas  # type: ignore
+        except Exception as exc:  # noqa: BLE001
+            raise ProviderError("akshare 不可用") from exc
+        pd = pandas
+        ak = akshare
+
+
+def _candidate_years(code: str) -> List[int]:
+    current_year = time.localtime().tm_year
+    years = [current_year, current_year - 1, current_year - 2]
+    with _LAST_DISCLOSURE_LOCK:
+        remembered = _LAST_DISCLOSURE.get(code)
+        hint = _LAST_YEAR_ANY
+    if remembered is not None:
+        year, _, recorded_at = remembered
+    elif hint is not None:
+        year, recorded_at = hint
+    else:
+        return years
+
+    if year not in years:
+        return years
+    if year < current_year and time.time() - recorded_at > _REPROBE_NEWER_SECONDS:
+        return years
+    return [year] + [y for y in years if y != year]
+
+
+def _remember_disclosure(code: str, year: int, period: str, probed_newer: bool) -> None:
+    """记录命中年份；只有本次确实探测过更新的年份才刷新时间戳，否则沿用旧的。"""
+    global _LAST_YEAR_ANY
+    now = time.time()
+    with _LAST_DISCLOSURE_LOCK:
+        previous = _LAST_DISCLOSURE.get(code)
+        if probed_newer or previous is None or previous[0] != year:
+            _LAST_DISCLOSURE[code] = (year, period, now)
+        else:
+            _LAST_DISCLOSURE[code] = (year, period, previous[2])
+        if probed_newer or _LAST_YEAR_ANY is None or _LAST_YEAR_ANY[0] != year:
+            _LAST_YEAR_ANY = (year, now)
+
+
+def _frame_to_holdings(df, code_col: str, name_col: str, weight_col: str) -> List[Holding]:  # noqa: ANN001
+    """按列批量清洗，只在最后一步生成 Holding 列表。"""
+    symbols = df[code_col].astype(str).str.strip()
+    names = df[name_col].astype(str).str.strip()
+    weight_txt = df[weight_col].astype(str).str.replace("%", "", regex=False).str.strip()
+    weights = pd.to_numeric(weight_txt.mask(weight_txt == "", "0"), errors="coerce")
+
+    valid = weights.notna() & (symbols != "") & (symbols.str.lower() != "nan")
+    return [
+        Holding(symbol=symbol, name=name, weight=weight)
+        for symbol, name, weight in zip(
+            symbols[valid].tolist(), names[valid].tolist(), weights[valid].astype(float).tolist()
+        )
+    ]
 
 
 class AkshareHoldingsProvider(HoldingsProvider):
     def get_fund_name(self, code: str) -> str:
-        if ak is None:
+        if not is_available():
             raise ProviderError("akshare 不可用")
 
         # 用 Eastmoney 名称口径保持行为一致
@@ -26,16 +110,19 @@ class AkshareHoldingsProvider(HoldingsProvider):
         return EastmoneyHoldingsProvider().get_fund_name(code)
 
     def get_latest_holdings(self, code: str) -> Tuple[List[Holding], str, str]:
-        if ak is None:
-            raise ProviderError("akshare 不可用")
+        _load_akshare()
 
-        current_year = time.localtime().tm_year
         best: List[Holding] = []
         best_period = ""
+        best_year: Optional[int] = None
+        tried: List[int] = []
 
         try:
-            for year in [current_year, current_year - 1, current_year - 2]:
-                df = ak.fund_portfolio_hold_em(symbol=code, date=str(year))
+            for year in _candidate_years(code):
+                tried.append(year)
+                # akshare 内部同样请求 fundf10.eastmoney.com，与 eastmoney provider 共用限流
+                with get_outbound_limiter().request("fundf10.eastmoney.com"):
+                    df = ak.fund_portfolio_hold_em(symbol=code, date=str(year))
                 if df is None or df.empty:
                     continue
 
@@ -48,32 +135,27 @@ class AkshareHoldingsProvider(HoldingsProvider):
                     continue
 
                 if period_col:
-                    latest_period = str(df[period_col].iloc[0])
-                    sub_df = df[df[period_col].astype(str) == latest_period].copy()
+                    periods = df[period_col].astype(str)
+                    latest_period = periods.iloc[0]
+                    sub_df = df[periods == latest_period]
                 else:
                     latest_period = f"{year} 年"
-                    sub_df = df.copy()
-
-                holdings: List[Holding] = []
-                for _, row in sub_df.iterrows():
-                    symbol = str(row[code_col]).strip()
-                    name = str(row[name_col]).strip()
-                    weight_txt = str(row[weight_col]).replace("%", "").strip() or "0"
-                    try:
-                        weight = float(weight_txt)
-                    except ValueError:
-                        continue
-                    if symbol and symbol.lower() != "nan":
-                        holdings.append(Holding(symbol=symbol, name=name, weight=weight))
+                    sub_df = df
 
+                holdings = _frame_to_holdings(sub_df, code_col, name_col, weight_col)
                 if holdings:
                     best = holdings
                     best_period = latest_period
+                    best_year = year
                     break
         except Exception as exc:  # noqa: BLE001
             raise ProviderError(f"akshare 抓持仓失败: {exc}") from exc
 
-        if not best:
+        if not best or best_year is None:
             raise ProviderError("akshare 无可用持仓数据")
 
+        current_year = time.localtime().tm_year
+        probed_newer = all(y in tried for y in range(best_year + 1, current_year + 1))
+        _remember_disclosure(code, best_year, best_period, probed_newer)
+
         return best, best_period, "akshare"
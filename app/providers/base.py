@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 
 class ProviderError(RuntimeError):
@@ -53,14 +53,29 @@ class QuoteProvider(ABC):
     def get_pct_change(self, symbol: str) -> Optional[float]:
         raise NotImplementedError
 
+    def get_pct_changes(self, symbols: List[str]) -> Dict[str, Optional[float]]:
+        """批量取涨跌幅；默认逐个调用，有批量接口的 provider 覆盖此方法。"""
+        return {symbol: self.get_pct_change(symbol) for symbol in symbols}
+
 
 class IndexProvider(ABC):
     @abstractmethod
     def get_indexes(self, market: str) -> List[IndexQuote]:
         raise NotImplementedError
 
+    def markets(self) -> List[str]:
+        """支持的市场；行情中心只为其中的市场拉取和缓存。"""
+        return ["cn"]
+
 
 class GoldProvider(ABC):
     @abstractmethod
     def get_gold_quotes(self) -> List[GoldQuote]:
         raise NotImplementedError
+
+    def platforms(self) -> List[str]:
+        """可单独拉取的平台列表；为空时行情中心整体调用 get_gold_quotes。"""
+        return []
+
+    def get_platform_quotes(self, platform: str) -> List[GoldQuote]:
+        return [quote for quote in self.get_gold_quotes() if quote.platform == platform]
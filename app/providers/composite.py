@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Dict, List, Optional, Tuple
+
+from app.market_session import classify_symbol
+from app.providers.base import QuoteProvider
+
+logger = logging.getLogger(__name__)
+
+# 不属于 cn/hk/us 的代码走 default 路由
+DEFAULT_ROUTE = "default"
+
+
+class BackendStats:
+    """单个行情后端的滚动统计：最近 window 次批量调用的耗时与成败。
+
+    成功率低于 min_success_rate（样本不少于 min_samples）视为不健康，只在健康后端都未命中时才尝试。
+    """
+
+    def __init__(self, name: str, window: int = 50, min_samples: int = 5, min_success_rate: float = 0.5) -> None:
+        self.name = name
+        self.min_samples = min_samples
+        self.min_success_rate = min_success_rate
+        self._lock = threading.Lock()
+        self._calls: Deque[Tuple[float, bool]] = deque(maxlen=window)
+        self._counts: Dict[str, int] = {"calls": 0, "failures": 0, "symbols": 0, "hits": 0}
+
+    def record(self, latency: float, ok: bool, symbols: int, hits: int) -> None:
+        with self._lock:
+            self._calls.append((latency, ok))
+            self._counts["calls"] += 1
+            self._counts["failures"] += 0 if ok else 1
+            self._counts["symbols"] += symbols
+            self._counts["hits"] += hits
+
+    def snapshot(self) -> Tuple[bool, float]:
+        """(是否健康, 成功调用的平均耗时)；没有样本时耗时为 0，新后端会先被试探。"""
+        with self._lock:
+            calls = list(self._calls)
+        if not calls:
+            return True, 0.0
+        ok_latencies = [latency for latency, ok in calls if ok]
+        success_rate = len(ok_latencies) / len(calls)
+        healthy = len(calls) < self.min_samples or success_rate >= self.min_success_rate
+        latency = sum(ok_latencies) / len(ok_latencies) if ok_latencies else float("inf")
+        return healthy, latency
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            calls = list(self._calls)
+            counts = dict(self._counts)
+        healthy, latency = self.snapshot()
+        return {
+            "backend": self.name,
+            "healthy": healthy,
+            "window": len(calls),
+            "success_rate": round(sum(1 for _, ok in calls if ok) / len(calls), 3) if calls else None,
+            "latency_ms": None if not calls or latency == float("inf") else round(latency * 1000, 1),
+            **counts,
+        }
+
+
+# 进程级：每个请求都会新建 provider，统计需要跨请求累积
+_STATS: Dict[str, BackendStats] = {}
+_STATS_LOCK = threading.Lock()
+
+
+def backend_stats(name: str) -> BackendStats:
+    with _STATS_LOCK:
+        stats = _STATS.get(name)
+        if stats is None:
+            stats = _STATS[name] = BackendStats(name)
+        return stats
+
+
+def quote_backend_stats() -> List[Dict[str, object]]:
+    with _STATS_LOCK:
+        items = sorted(_STATS.values(), key=lambda x: x.name)
+    return [item.stats() for item in items]
+
+
+def parse_routes(raw: str) -> Dict[str, List[str]]:
+    """"cn=eastmoney|mock,default=eastmoney" -> {市场: [后端, ...]}，忽略格式错误的项。"""
+    routes: Dict[str, List[str]] = {}
+    for item in raw.split(","):
+        market, _, spec = item.strip().partition("=")
+        backends = [name.strip().lower() for name in spec.split("|") if name.strip()]
+        if market.strip() and backends:
+            routes[market.strip().lower()] = backends
+    return routes
+
+
+class CompositeQuoteProvider(QuoteProvider):
+    """按市场把代码路由到有序的后端列表（QUOTE_ROUTES）。
+
+    每批先交给当前最快的健康后端（mock 始终排在最后），未命中（None）或整批失败的代码只在下一个后端重试；
+    后端的耗时与成败计入进程级滚动统计，决定下一批的顺序。
+    """
+
+    def __init__(
+        self,
+        quote_cache: Optional[Dict[str, Optional[float]]] = None,
+        *,
+        routes: Optional[Dict[str, List[str]]] = None,
+        backends: Optional[Dict[str, QuoteProvider]] = None,
+    ) -> None:
+        from app.config import QUOTE_PROVIDERS, QUOTE_ROUTES, load_provider_class
+
+        self.quote_cache = quote_cache if quote_cache is not None else {}
+        self.routes = routes if routes is not None else parse_routes(QUOTE_ROUTES)
+        if backends is None:
+            # 各后端用独立的请求级缓存：前一个后端缓存的 None 不能挡住后一个后端
+            names = {name for chain in self.routes.values() for name in chain if name in QUOTE_PROVIDERS and name != "composite"}
+            backends = {name: load_provider_class(QUOTE_PROVIDERS, name)({}) for name in names}
+        self.backends = backends
+
+    def _ordered(self, market: str) -> List[str]:
+        chain = [name for name in self.routes.get(market) or self.routes.get(DEFAULT_ROUTE, []) if name in self.backends]
+        ranked = []
+        for position, name in enumerate(chain):
+            healthy, latency = backend_stats(name).snapshot()
+            # mock 是模拟值，再快也只用来补齐
+            ranked.append((name == "mock", not healthy, latency, position, name))
+        return [name for *_, name in sorted(ranked)]
+
+    def get_pct_change(self, symbol: str) -> Optional[float]:
+        return self.get_pct_changes([symbol]).get(symbol)
+
+    def get_pct_changes(self, symbols: List[str]) -> Dict[str, Optional[float]]:
+        result: Dict[str, Optional[float]] = {}
+        pending: Dict[str, List[str]] = {}
+        for symbol in dict.fromkeys(symbols):
+            if symbol in self.quote_cache:
+                result[symbol] = self.quote_cache[symbol]
+            else:
+                pending.setdefault(classify_symbol(symbol) or DEFAULT_ROUTE, []).append(symbol)
+        chains = {market: self._ordered(market) for market in pending}
+
+        # 第 step 轮：各市场剩余代码交给各自链上第 step 个后端，同一后端的代码合成一批
+        step = 0
+        while pending:
+            batches: Dict[str, List[str]] = {}
+            market_of: Dict[str, str] = {}
+            for market, remaining in pending.items():
+                if step >= len(chains[market]):
+                    result.update(dict.fromkeys(remaining))
+                    continue
+                batches.setdefault(chains[market][step], []).extend(remaining)
+                market_of.update(dict.fromkeys(remaining, market))
+            pending = {}
+            if len(batches) == 1:
+                name, batch = next(iter(batches.items()))
+                result.update(self._fetch(name, batch))
+            else:
+                # 同一轮里不同后端的批次并发请求
+                with ThreadPoolExecutor(max_workers=len(batches)) as pool:
+                    for hits in pool.map(lambda item: self._fetch(*item), batches.items()):
+                        result.update(hits)
+            for batch in batches.values():
+                for symbol in batch:
+                    if result.get(symbol) is None:
+                        pending.setdefault(market_of[symbol], []).append(symbol)
+            step += 1
+
+        self.quote_cache.update(result)
+        return result
+
+    def _fetch(self, name: str, batch: List[str]) -> Dict[str, float]:
+        """把一批代码交给后端 name，返回命中的部分；失败只记入统计。"""
+        begin = time.monotonic()
+        try:
+            fetched = self.backends[name].get_pct_changes(batch)
+        except Exception as exc:  # noqa: BLE001
+            backend_stats(name).record(time.monotonic() - begin, False, len(batch), 0)
+            logger.warning("行情后端 %s 失败（%s 个代码改走下一个后端）: %s", name, len(batch), exc)
+            return {}
+        hits = {symbol: value for symbol, value in fetched.items() if value is not None}
+        backend_stats(name).record(time.monotonic() - begin, True, len(batch), len(hits))
+        return hits
@@ -1,45 +1,123 @@
 from __future__ import annotations
 
+import datetime as dt
+import html
 import json
+import logging
 import re
+import threading
 import time
 import urllib.request
-from html.parser import HTMLParser
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
+from app.config import FUND_DATA_TTL, SECID_NEGATIVE_TTL
+from app.market_session import classify_symbol
 from app.providers.base import Holding, HoldingsProvider, ProviderError, QuoteProvider
+from app.providers.fund_catalog import catalog_fund_name
+from app.providers.ratelimit import get_outbound_limiter
+from app.providers.singleflight import UPSTREAM_FLIGHT
 
+logger = logging.getLogger(__name__)
 
-class _SimpleTableParser(HTMLParser):
-    def __init__(self) -> None:
-        super().__init__()
-        self.in_tr = False
-        self.in_cell = False
-        self.cell_text: List[str] = []
-        self.current_row: List[str] = []
-        self.rows: List[List[str]] = []
 
-    def handle_starttag(self, tag: str, attrs) -> None:  # noqa: ANN001
+_TABLE_TAG_RE = re.compile(r"<(\\?/)?(table|t[rdh])\b[^>]*>", re.I)
+_INNER_TAG_RE = re.compile(r"<[^>]*>")
+
+
+def _cell_text(raw: str) -> str:
+    if "\\" in raw:
+        raw = raw.replace('\\"', '"').replace("\\n", "").replace("\\/", "/")
+    if "<" in raw:
+        raw = _INNER_TAG_RE.sub("", raw)
+    if "&" in raw:
+        raw = html.unescape(raw)
+    return " ".join(raw.split())
+
+
+def _parse_latest_table(content: str, start: int = 0, end: int = -1) -> List[Holding]:
+    """单遍扫描仍为 JS 转义态的持仓 HTML，只解析第一张表（最新披露期）。
+
+    表头之后只解码 代码/名称/占净值 三列，遇到第一个 </table> 即停止。
+    """
+    if end < 0:
+        end = len(content)
+
+    header: List[str] = []
+    seen_row = False
+    idx_code = idx_name = idx_weight = -1
+    last_idx = -1
+    holdings: List[Holding] = []
+
+    in_tr = False
+    col = -1
+    cell_start = -1
+    symbol = name = weight_txt = ""
+    for m in _TABLE_TAG_RE.finditer(content, start, end):
+        closing = m.group(1) is not None
+        tag = m.group(2).lower()
+        if tag == "table":
+            if closing and seen_row:
+                break
+            continue
+
         if tag == "tr":
-            self.in_tr = True
-            self.current_row = []
-        elif self.in_tr and tag in {"td", "th"}:
-            self.in_cell = True
-            self.cell_text = []
-
-    def handle_data(self, data: str) -> None:
-        if self.in_cell:
-            self.cell_text.append(data)
-
-    def handle_endtag(self, tag: str) -> None:
-        if self.in_tr and tag in {"td", "th"} and self.in_cell:
-            txt = "".join(self.cell_text).strip()
-            self.current_row.append(re.sub(r"\s+", " ", txt))
-            self.in_cell = False
-        elif tag == "tr" and self.in_tr:
-            if self.current_row:
-                self.rows.append(self.current_row)
-            self.in_tr = False
+            if not closing:
+                in_tr = True
+                col = -1
+                cell_start = -1
+                symbol = name = weight_txt = ""
+                continue
+            if not in_tr:
+                continue
+            in_tr = False
+            if col < 0:
+                continue
+            if not seen_row:
+                seen_row = True
+                for i, text in enumerate(header):
+                    if "股票代码" in text:
+                        idx_code = i
+                    elif "股票名称" in text:
+                        idx_name = i
+                    elif "占净值" in text:
+                        idx_weight = i
+                if min(idx_code, idx_name, idx_weight) < 0:
+                    raise ProviderError("持仓表字段不完整")
+                last_idx = max(idx_code, idx_name, idx_weight)
+                continue
+            if col < last_idx:
+                continue
+            weight_txt = weight_txt.replace("%", "").replace("--", "0").strip() or "0"
+            try:
+                weight = float(weight_txt)
+            except ValueError:
+                continue
+            if symbol:
+                holdings.append(Holding(symbol=symbol, name=name, weight=weight))
+            continue
+
+        if not in_tr:
+            continue
+        if not closing:
+            if cell_start < 0:
+                col += 1
+                cell_start = m.end()
+            continue
+        if cell_start < 0:
+            continue
+        if not seen_row:
+            header.append(_cell_text(content[cell_start : m.start()]))
+        elif col == idx_code:
+            symbol = _cell_text(content[cell_start : m.start()])
+        elif col == idx_name:
+            name = _cell_text(content[cell_start : m.start()])
+        elif col == idx_weight:
+            weight_txt = _cell_text(content[cell_start : m.start()])
+        cell_start = -1
+
+    if not seen_row:
+        raise ProviderError("持仓表为空")
+    return holdings
 
 
 def _http_get(url: str, timeout: int = 12) -> str:
@@ -50,15 +128,90 @@ def _http_get(url: str, timeout: int = 12) -> str:
             "Referer": "https://fundf10.eastmoney.com/",
         },
     )
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        return resp.read().decode("utf-8", errors="ignore")
+    with get_outbound_limiter().request(url):
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return resp.read().decode("utf-8", errors="ignore")
+
+
+_FUND_NAME_RE = re.compile(r"fS_name\s*=\s*\"(.*?)\"")
+# 净值日期为北京时间零点的毫秒时间戳
+_CN_TZ = dt.timezone(dt.timedelta(hours=8))
+
+
+def _js_array(text: str, var: str) -> list:
+    """取出 `var <name> = [...];` 的数组字面量，缺失或无法解析时返回空列表。"""
+    start = text.find(f"var {var}")
+    if start < 0:
+        return []
+    start = text.find("[", start)
+    end = text.find("];", start)
+    if start < 0 or end < 0:
+        return []
+    try:
+        return json.loads(text[start : end + 1])
+    except ValueError:
+        return []
+
+
+def _parse_pingzhongdata(code: str, text: str) -> Tuple[str, List[Tuple[str, float, Optional[float], Optional[float]]]]:
+    """一次解析出 (基金名称, [(date, nav, accum_nav, change_percent), ...])，日期升序。"""
+    match = _FUND_NAME_RE.search(text)
+    name = match.group(1) if match else code
+
+    accum: Dict[int, float] = {}
+    for item in _js_array(text, "Data_ACWorthTrend"):
+        if isinstance(item, list) and len(item) >= 2 and item[1] is not None:
+            accum[int(item[0])] = float(item[1])
+
+    rows: Dict[str, Tuple[str, float, Optional[float], Optional[float]]] = {}
+    for item in _js_array(text, "Data_netWorthTrend"):
+        if not isinstance(item, dict) or item.get("x") is None or item.get("y") is None:
+            continue
+        ts = int(item["x"])
+        day = dt.datetime.fromtimestamp(ts / 1000, _CN_TZ).date().isoformat()
+        change = item.get("equityReturn")
+        rows[day] = (
+            day,
+            float(item["y"]),
+            accum.get(ts),
+            float(change) if isinstance(change, (int, float)) else None,
+        )
+    return name, [rows[day] for day in sorted(rows)]
+
+
+def _download_fund_data(code: str) -> str:
+    text = _http_get(f"https://fund.eastmoney.com/pingzhongdata/{code}.js?v={int(time.time()*1000)}")
+    name, nav_rows = _parse_pingzhongdata(code, text)
+    try:
+        from app.db import save_fund_data
+
+        save_fund_data(code, name, nav_rows)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("写入基金净值失败 %s: %s", code, exc)
+    return name
+
+
+def sync_fund_data(code: str, max_age: int = FUND_DATA_TTL) -> str:
+    """返回基金名称；库中数据超过 max_age 秒才重新下载 pingzhongdata，名称与净值一并落库。
+
+    名称查询与净值查询共用同一个 single-flight key，并发时只下载一次。
+    """
+    if max_age > 0:
+        try:
+            from app.db import get_fund_meta
+
+            meta = get_fund_meta(code)
+        except Exception:  # noqa: BLE001
+            meta = None
+        if meta is not None and meta[0] and time.time() - meta[1] < max_age:
+            return meta[0]
+    return UPSTREAM_FLIGHT.do(("eastmoney", "pingzhongdata", code), lambda: _download_fund_data(code))
 
 
 class EastmoneyHoldingsProvider(HoldingsProvider):
     def get_fund_name(self, code: str) -> str:
-        text = _http_get(f"https://fund.eastmoney.com/pingzhongdata/{code}.js?v={int(time.time()*1000)}")
-        match = re.search(r"fS_name\s*=\s*\"(.*?)\"", text)
-        return match.group(1) if match else code
+        # 基金目录已载入时不发请求；目录未就绪或没有该代码才下载 pingzhongdata
+        return catalog_fund_name(code) or sync_fund_data(code)
 
     def get_latest_holdings(self, code: str) -> Tuple[List[Holding], str, str]:
         text = _http_get(
@@ -67,43 +220,160 @@ class EastmoneyHoldingsProvider(HoldingsProvider):
         period_match = re.search(r"<label class='left'>(.*?)</label>", text)
         period = period_match.group(1).strip() if period_match else "最新披露期"
 
-        html_match = re.search(r"content:\"(.*)\",arryear", text, flags=re.S)
-        if not html_match:
+        # 等价于旧的 content:"(.*)",arryear 贪婪匹配，但不复制整段内容
+        start = text.find('content:"')
+        end = text.rfind('",arryear')
+        if start < 0 or end < start + len('content:"'):
             raise ProviderError("未解析到持仓内容")
 
-        table_html = html_match.group(1).replace('\\"', '"').replace("\\n", "").replace("\\/", "/")
-        parser = _SimpleTableParser()
-        parser.feed(table_html)
-        if not parser.rows:
-            raise ProviderError("持仓表为空")
-
-        header = parser.rows[0]
-        idx_code = idx_name = idx_weight = -1
-        for i, col in enumerate(header):
-            if "股票代码" in col:
-                idx_code = i
-            elif "股票名称" in col:
-                idx_name = i
-            elif "占净值" in col:
-                idx_weight = i
-        if min(idx_code, idx_name, idx_weight) < 0:
-            raise ProviderError("持仓表字段不完整")
-
-        holdings: List[Holding] = []
-        for row in parser.rows[1:]:
-            if max(idx_code, idx_name, idx_weight) >= len(row):
-                continue
-            symbol = row[idx_code].strip()
-            name = row[idx_name].strip()
-            weight_txt = row[idx_weight].replace("%", "").replace("--", "0").strip() or "0"
+        holdings = _parse_latest_table(text, start + len('content:"'), end)
+        return holdings, period, "eastmoney"
+
+
+class SecidResolver:
+    """记住每个代码实际可用的 Eastmoney secid（或确认均不可用），持久化到 symbol_secid 表。
+
+    已知 secid 的代码直接请求该 secid；负结果在 negative_ttl 内不再探测。
+    """
+
+    def __init__(self, negative_ttl: int) -> None:
+        self.negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self._known: Dict[str, Tuple[Optional[str], int]] = {}
+        self._loaded = False
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        try:
+            from app.db import load_symbol_secids
+
+            rows = load_symbol_secids()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("symbol_secid 读取失败，仅使用内存表: %s", exc)
+            rows = {}
+        with self._lock:
+            if not self._loaded:
+                for symbol, entry in rows.items():
+                    self._known.setdefault(symbol, entry)
+                self._loaded = True
+
+    def lookup(self, symbol: str) -> Tuple[bool, Optional[str]]:
+        """返回 (是否已有有效记录, secid)。"""
+        self._ensure_loaded()
+        with self._lock:
+            entry = self._known.get(symbol)
+        if entry is None:
+            return False, None
+        secid, checked_at = entry
+        if secid is None and time.time() - checked_at >= self.negative_ttl:
+            return False, None
+        return True, secid
+
+    def record(self, results: Dict[str, Optional[str]]) -> None:
+        if not results:
+            return
+        now = int(time.time())
+        with self._lock:
+            for symbol, secid in results.items():
+                self._known[symbol] = (secid, now)
+        try:
+            from app.db import save_symbol_secids
+
+            save_symbol_secids((symbol, secid, now) for symbol, secid in results.items())
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("symbol_secid 写入失败: %s", exc)
+
+    def resolve_many(self, symbols: Iterable[str], chunk_size: int = 100) -> Dict[str, Optional[str]]:
+        """批量解析：未知代码的全部候选 secid 合并进 ulist 接口一次性探测。"""
+        resolved: Dict[str, Optional[str]] = {}
+        pending: Dict[str, List[str]] = {}
+        for symbol in dict.fromkeys(symbols):
+            known, secid = self.lookup(symbol)
+            if known:
+                resolved[symbol] = secid
+            else:
+                pending[symbol] = _candidate_secids(symbol)
+
+        unknown_format = {symbol: None for symbol, cands in pending.items() if not cands}
+        probe = [(symbol, cands) for symbol, cands in pending.items() if cands]
+        learned: Dict[str, Optional[str]] = dict(unknown_format)
+        for i in range(0, len(probe), chunk_size):
+            batch = probe[i : i + chunk_size]
+            secids = [secid for _, cands in batch for secid in cands]
             try:
-                weight = float(weight_txt)
-            except ValueError:
+                available = _fetch_available_secids(secids)
+            except Exception as exc:  # noqa: BLE001
+                # 网络失败不是“无数据”，不写负缓存，留待下次再探测
+                logger.warning("批量解析 secid 失败: %s", exc)
                 continue
-            if symbol:
-                holdings.append(Holding(symbol=symbol, name=name, weight=weight))
+            for symbol, cands in batch:
+                learned[symbol] = next((secid for secid in cands if secid in available), None)
 
-        return holdings, period, "eastmoney"
+        self.record(learned)
+        resolved.update(learned)
+        return resolved
+
+
+def _fetch_available_secids(secids: List[str]) -> Set[str]:
+    text = _http_get(
+        "https://push2.eastmoney.com/api/qt/ulist.np/get?fltt=2&fields=f12,f13,f170&secids=" + ",".join(secids)
+    )
+    data = json.loads(text).get("data") or {}
+    available: Set[str] = set()
+    for row in data.get("diff") or []:
+        if row.get("f170") in (None, "-"):
+            continue
+        available.add(f"{row.get('f13')}.{row.get('f12')}")
+    return available
+
+
+SECID_RESOLVER = SecidResolver(SECID_NEGATIVE_TTL)
+
+
+def resolve_secids(symbols: Iterable[str]) -> Dict[str, Optional[str]]:
+    return SECID_RESOLVER.resolve_many(symbols)
+
+
+def fetch_pct_changes(symbols: Iterable[str], chunk_size: int = 100) -> Dict[str, Optional[float]]:
+    """批量行情快照：先批量解析 secid，再按 ulist 接口每批 chunk_size 个 secid 取涨跌幅(%)。
+
+    部分批次失败时，这些代码按缺失（None）返回，由调用方换后端或降级；
+    没有任何一批成功时立即抛 ProviderError，不再逐个重试。
+    """
+    symbols = list(dict.fromkeys(symbols))
+    resolved = resolve_secids(symbols)
+    # secid 探测失败的代码不在 resolved 里
+    failed = [symbol for symbol in symbols if symbol not in resolved]
+    by_secid: Dict[str, List[str]] = {}
+    for symbol, secid in resolved.items():
+        if secid:
+            by_secid.setdefault(secid, []).append(symbol)
+
+    pcts: Dict[str, Optional[float]] = dict.fromkeys(symbols)
+    secids = list(by_secid)
+    succeeded = 0
+    for i in range(0, len(secids), chunk_size):
+        chunk = secids[i : i + chunk_size]
+        try:
+            text = _http_get(
+                "https://push2.eastmoney.com/api/qt/ulist.np/get?fltt=2&fields=f12,f13,f170&secids=" + ",".join(chunk)
+            )
+            data = json.loads(text).get("data") or {}
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("批量行情请求失败（%s 个 secid）: %s", len(chunk), exc)
+            failed.extend(symbol for secid in chunk for symbol in by_secid[secid])
+            continue
+        succeeded += 1
+        for row in data.get("diff") or []:
+            value = row.get("f170")
+            if value in (None, "-"):
+                continue
+            for symbol in by_secid.get(f"{row.get('f13')}.{row.get('f12')}", []):
+                pcts[symbol] = float(value)
+    if failed and not succeeded:
+        raise ProviderError(f"批量行情请求全部失败：{len(failed)} 个代码没有结果")
+    return pcts
 
 
 class EastmoneyQuoteProvider(QuoteProvider):
@@ -114,31 +384,65 @@ class EastmoneyQuoteProvider(QuoteProvider):
         if symbol in self.quote_cache:
             return self.quote_cache[symbol]
 
-        for secid in _candidate_secids(symbol):
+        known, known_secid = SECID_RESOLVER.lookup(symbol)
+        if known:
+            candidates = [known_secid] if known_secid else []
+        else:
+            candidates = _candidate_secids(symbol)
+
+        definitive = True
+        for secid in candidates:
             try:
                 # 行为保持旧版：push2 + f170 字段
                 text = _http_get(f"https://push2.eastmoney.com/api/qt/stock/get?secid={secid}&fields=f170")
                 data = json.loads(text).get("data")
                 if not data or data.get("f170") is None:
                     continue
-                self.quote_cache[symbol] = float(data["f170"]) / 100.0
-                return self.quote_cache[symbol]
+                pct = float(data["f170"]) / 100.0
             except Exception:
+                definitive = False
                 continue
+            if not known:
+                SECID_RESOLVER.record({symbol: secid})
+            self.quote_cache[symbol] = pct
+            return pct
 
+        # 只有每个候选都明确返回“无数据”时才写负缓存；已知 secid 暂无数据（如停牌）不改写记录
+        if not known and definitive:
+            if not candidates:
+                logger.warning("无法识别的代码格式，按缺失处理: %s", symbol)
+            SECID_RESOLVER.record({symbol: None})
         self.quote_cache[symbol] = None
         return None
 
+    def get_pct_changes(self, symbols: List[str]) -> Dict[str, Optional[float]]:
+        """未缓存的代码走 ulist 批量接口；失败批次的代码返回 None（组合后端会交给下一个后端），
+        全部批次失败时抛 ProviderError。"""
+        result = {symbol: self.quote_cache[symbol] for symbol in symbols if symbol in self.quote_cache}
+        missing = [symbol for symbol in symbols if symbol not in result]
+        if missing:
+            try:
+                fetched = fetch_pct_changes(missing)
+            except ProviderError:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                raise ProviderError(f"批量行情请求失败: {exc}") from exc
+            self.quote_cache.update(fetched)
+            result.update(fetched)
+        return result
+
 
 def _candidate_secids(symbol: str) -> List[str]:
     s = symbol.upper().strip()
-    if s.isdigit() and len(s) == 6:
+    market = classify_symbol(s)
+    if market == "cn":
         if s.startswith(("6", "5", "9")):
             return [f"1.{s}"]
         if s.startswith(("0", "3", "8", "4")):
             return [f"0.{s}", f"1.{s}"]
-    if s.isdigit() and len(s) == 5:
+    if market == "hk":
         return [f"116.{s}"]
-    if re.fullmatch(r"[A-Z.]{1,10}", s):
-        return [f"105.{s}"]
+    if market == "us":
+        # NASDAQ / NYSE / NYSE American；命中的市场会记入 symbol_secid，之后不再逐个试
+        return [f"105.{s}", f"106.{s}", f"107.{s}"]
     return []
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from app.config import FUND_CATALOG_FILE, FUND_CATALOG_REFRESH, FUND_CATALOG_URL
+
+logger = logging.getLogger(__name__)
+
+# 上游刷新失败后的重试间隔（不超过 FUND_CATALOG_REFRESH）
+RETRY_DELAY = 600.0
+MAX_SEARCH_LIMIT = 50
+
+
+def parse_catalog_text(text: str) -> List[list]:
+    """fundcode_search.js（`var r = [[代码, 拼音缩写, 名称, 类型, 全拼], ...];`）或同结构的 JSON 数组。"""
+    start = text.find("[")
+    end = text.rfind("]")
+    if start < 0 or end < start:
+        return []
+    try:
+        rows = json.loads(text[start : end + 1])
+    except ValueError:
+        return []
+    return [row for row in rows if isinstance(row, list)]
+
+
+class FundCatalog:
+    """全部基金的内存目录：代码 → 条目，外加 代码/拼音缩写/名称/全拼 四个有序前缀索引。
+
+    每个索引是排好序的键列表与条目下标的平行数组，前缀查询为一次二分加顺序扫描；
+    按 代码 → 拼音缩写 → 名称 → 全拼 的顺序取满 limit 条即停止。
+    """
+
+    def __init__(self, rows: Iterable[Sequence[str]]) -> None:
+        self.codes: List[str] = []
+        self.names: List[str] = []
+        self.abbrs: List[str] = []
+        self.types: List[str] = []
+        self._by_code: Dict[str, int] = {}
+        pinyins: List[str] = []
+        for row in rows:
+            if len(row) < 3:
+                continue
+            code = str(row[0]).strip()
+            if not code or code in self._by_code:
+                continue
+            self._by_code[code] = len(self.codes)
+            self.codes.append(code)
+            self.abbrs.append(str(row[1] or "").strip())
+            self.names.append(str(row[2] or "").strip())
+            self.types.append(str(row[3] or "").strip() if len(row) > 3 else "")
+            pinyins.append(str(row[4] or "").strip() if len(row) > 4 else "")
+
+        self._indexes = []
+        for values in (self.codes, self.abbrs, self.names, pinyins):
+            pairs = sorted((value.lower(), i) for i, value in enumerate(values) if value)
+            self._indexes.append(([key for key, _ in pairs], array("i", [i for _, i in pairs])))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def entry(self, i: int) -> Dict[str, str]:
+        return {"code": self.codes[i], "name": self.names[i], "abbr": self.abbrs[i], "type": self.types[i]}
+
+    def name(self, code: str) -> Optional[str]:
+        i = self._by_code.get(code)
+        if i is None:
+            return None
+        return self.names[i] or None
+
+    def names_for(self, codes: Iterable[str]) -> Dict[str, str]:
+        """批量解析名称，目录中没有的代码不出现在结果里。"""
+        names = {}
+        for code in codes:
+            name = self.name(code)
+            if name:
+                names[code] = name
+        return names
+
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, str]]:
+        prefix = query.strip().lower()
+        if not prefix or limit <= 0:
+            return []
+        found: Dict[int, None] = {}
+        for keys, ids in self._indexes:
+            pos = bisect_left(keys, prefix)
+            while pos < len(keys) and len(found) < limit and keys[pos].startswith(prefix):
+                found.setdefault(ids[pos])
+                pos += 1
+            if len(found) >= limit:
+                break
+        return [self.entry(i) for i in found]
+
+
+class FundCatalogStore:
+    """持有当前目录并在后台维护：先读本地副本，副本超过 refresh 秒（或不存在）再从 url 下载，
+    成功后整体替换内存目录并写回副本，之后每 refresh 秒刷新一次。
+
+    目录未就绪时 catalog 为 None，调用方按未命中处理（名称回退 pingzhongdata，搜索返回空）。
+    """
+
+    def __init__(self, path: str, url: str, refresh: float) -> None:
+        self.path = Path(path)
+        self.url = url
+        self.refresh = refresh
+        self.catalog: Optional[FundCatalog] = None
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._status: Dict[str, object] = {"state": "idle", "size": 0}
+
+    def _update(self, **fields: object) -> None:
+        with self._lock:
+            self._status.update(fields)
+
+    def status(self) -> Dict[str, object]:
+        with self._lock:
+            return dict(self._status)
+
+    def _install(self, catalog: FundCatalog, source: str) -> None:
+        self.catalog = catalog
+        self._update(state="ready", size=len(catalog), source=source, loaded_at=int(time.time()), error=None)
+
+    def load_file(self) -> Optional[float]:
+        """读取本地副本，返回副本的年龄（秒）；不存在或解析为空时返回 None。"""
+        try:
+            text = self.path.read_text(encoding="utf-8")
+            age = time.time() - self.path.stat().st_mtime
+        except OSError:
+            return None
+        catalog = FundCatalog(parse_catalog_text(text))
+        if not len(catalog):
+            logger.warning("基金目录副本为空或无法解析: %s", self.path)
+            return None
+        self._install(catalog, "file")
+        return age
+
+    def refresh_remote(self) -> bool:
+        from app.providers.eastmoney import _http_get
+
+        try:
+            text = _http_get(self.url, timeout=30)
+            catalog = FundCatalog(parse_catalog_text(text))
+            if not len(catalog):
+                raise ValueError("基金目录为空")
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("基金目录刷新失败: %s", exc)
+            self._update(error=str(exc))
+            return False
+        self._install(catalog, "remote")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            tmp.write_text(text, encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError as exc:
+            logger.warning("写入基金目录副本失败 %s: %s", self.path, exc)
+        return True
+
+    def start(self) -> bool:
+        """已在运行时返回 False。"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return False
+            self._status.update(state="loading")
+            self._thread = threading.Thread(target=self._run, name="fund-catalog", daemon=True)
+            self._thread.start()
+            return True
+
+    def _run(self) -> None:
+        age = self.load_file()
+        if not self.url:
+            if self.catalog is None:
+                self._update(state="unavailable")
+            return
+        if self.refresh <= 0:
+            # 不定期刷新：只在没有本地副本时下载一次
+            if age is None:
+                self.refresh_remote()
+            return
+        delay = 0.0 if age is None else max(0.0, self.refresh - age)
+        while True:
+            time.sleep(delay)
+            delay = self.refresh if self.refresh_remote() else min(self.refresh, RETRY_DELAY)
+
+
+FUND_CATALOG = FundCatalogStore(FUND_CATALOG_FILE, FUND_CATALOG_URL, FUND_CATALOG_REFRESH)
+
+
+def start_fund_catalog() -> bool:
+    return FUND_CATALOG.start()
+
+
+def fund_catalog_status() -> Dict[str, object]:
+    return FUND_CATALOG.status()
+
+
+def catalog_fund_name(code: str) -> Optional[str]:
+    catalog = FUND_CATALOG.catalog
+    return catalog.name(code) if catalog is not None else None
+
+
+def catalog_fund_names(codes: Iterable[str]) -> Dict[str, str]:
+    catalog = FUND_CATALOG.catalog
+    return catalog.names_for(codes) if catalog is not None else {}
+
+
+def search_funds(query: str, limit: int = 10) -> dict:
+    catalog = FUND_CATALOG.catalog
+    limit = max(1, min(limit, MAX_SEARCH_LIMIT))
+    results = catalog.search(query, limit) if catalog is not None else []
+    return {"results": results, "ready": catalog is not None}
@@ -67,13 +67,27 @@ class MockIndexProvider(IndexProvider):
         ],
     }
 
-    def __init__(self, *, fallback_market: str = "cn", status_tag: str = "mock", return_empty_on_unknown: bool = True) -> None:
+    def __init__(
+        self,
+        *,
+        fallback_market: str = "cn",
+        status_tag: str = "mock",
+        return_empty_on_unknown: bool = True,
+        latency: float = 0.0,
+    ) -> None:
         self.fallback_market = (fallback_market or "cn").lower()
         self.status_tag = status_tag
         self.return_empty_on_unknown = return_empty_on_unknown
+        # 模拟上游耗时，便于在本地验证行情中心的并发与超时
+        self.latency = latency
+
+    def markets(self) -> List[str]:
+        return list(self._INDEXES)
 
     def get_indexes(self, market: str) -> List[IndexQuote]:
         requested_market = (market or self.fallback_market).lower()
+        if self.latency:
+            time.sleep(self.latency)
 
         if requested_market in self._INDEXES:
             normalized = requested_market
@@ -106,25 +120,36 @@ class MockIndexProvider(IndexProvider):
 
 
 class MockGoldProvider(GoldProvider):
-    def __init__(self, *, status_tag: str = "mock") -> None:
+    PLATFORMS = ["招商", "浙商", "民生"]
+
+    def __init__(self, *, status_tag: str = "mock", latency: float = 0.0) -> None:
         self.status_tag = status_tag
+        self.latency = latency
+
+    def platforms(self) -> List[str]:
+        return list(self.PLATFORMS)
+
+    def get_platform_quotes(self, platform: str) -> List[GoldQuote]:
+        if platform not in self.PLATFORMS:
+            return []
+        if self.latency:
+            time.sleep(self.latency)
+        price = _stable_base(platform, 520, 620)
+        change_percent = _stable_pct(platform, -1.0, 1.0)
+        change = round(price * change_percent / 100.0, 2)
+        return [
+            GoldQuote(
+                platform=platform,
+                price=price,
+                change=change,
+                change_percent=change_percent,
+                status=self.status_tag,
+                updated_at=int(time.time()),
+            )
+        ]
 
     def get_gold_quotes(self) -> List[GoldQuote]:
-        platforms = ["招商", "浙商", "民生"]
-        now = int(time.time())
         result: List[GoldQuote] = []
-        for platform in platforms:
-            price = _stable_base(platform, 520, 620)
-            change_percent = _stable_pct(platform, -1.0, 1.0)
-            change = round(price * change_percent / 100.0, 2)
-            result.append(
-                GoldQuote(
-                    platform=platform,
-                    price=price,
-                    change=change,
-                    change_percent=change_percent,
-                    status=self.status_tag,
-                    updated_at=now,
-                )
-            )
+        for platform in self.PLATFORMS:
+            result.extend(self.get_platform_quotes(platform))
         return result
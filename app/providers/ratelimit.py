@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import socket
+import threading
+import time
+import urllib.error
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from app.providers.base import ProviderError
+
+# 上游结果分类：throttled（429/503）、timeout、latency spike 触发乘性减；error 只计数不调整
+OK = "ok"
+THROTTLED = "throttled"
+TIMEOUT = "timeout"
+ERROR = "error"
+
+
+class HostLimiter:
+    """单个上游主机的出站限制：令牌桶限制每秒请求数，并发上限按 AIMD 自适应。
+
+    - 成功且延迟正常：并发上限每个“窗口”加 1（每次成功加 1/limit）
+    - 429/503、超时或延迟超过基线 spike_ratio 倍：上限减半；同一批在途请求的连续失败只算一次，
+      冷却期取 cooldown，未指定时为延迟基线（约一个往返）
+    """
+
+    def __init__(
+        self,
+        host: str,
+        rate: float,
+        max_concurrency: int,
+        *,
+        min_concurrency: int = 1,
+        burst: Optional[float] = None,
+        spike_ratio: float = 3.0,
+        cooldown: Optional[float] = None,
+    ) -> None:
+        self.host = host
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self.min_concurrency = max(1, min_concurrency)
+        self.max_concurrency = max(self.min_concurrency, max_concurrency)
+        self.spike_ratio = spike_ratio
+        self.cooldown = cooldown
+
+        self._cond = threading.Condition()
+        self._tokens = self.burst
+        self._refilled_at = time.monotonic()
+        # 从上限的一半起步，由 AIMD 向上试探
+        self._limit = float(max(self.min_concurrency, self.max_concurrency // 2))
+        self._in_flight = 0
+        self._waiting = 0
+        self._latency_ewma: Optional[float] = None
+        self._last_decrease = 0.0
+        self._counts: Dict[str, int] = {OK: 0, THROTTLED: 0, TIMEOUT: 0, ERROR: 0}
+
+    def _refill(self, now: float) -> None:
+        if self.rate <= 0:
+            self._tokens = self.burst
+            return
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+
+    def acquire(self, timeout: float) -> None:
+        """排队等待并发名额与令牌，超过 timeout 秒抛 ProviderError。"""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            self._waiting += 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    if self._in_flight < int(self._limit) and self._tokens >= 1.0:
+                        self._tokens -= 1.0
+                        self._in_flight += 1
+                        return
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        raise ProviderError(f"上游 {self.host} 限流排队超时")
+                    wait = remaining
+                    if self._in_flight < int(self._limit) and self.rate > 0:
+                        wait = min(wait, (1.0 - self._tokens) / self.rate)
+                    self._cond.wait(wait)
+            finally:
+                self._waiting -= 1
+
+    def release(self, latency: float, outcome: str) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            self._counts[outcome] = self._counts.get(outcome, 0) + 1
+            baseline = self._latency_ewma
+            spike = outcome == OK and baseline is not None and latency > baseline * self.spike_ratio
+            if outcome == OK:
+                self._latency_ewma = latency if baseline is None else baseline * 0.9 + latency * 0.1
+
+            now = time.monotonic()
+            if outcome in {THROTTLED, TIMEOUT} or spike:
+                cooldown = self.cooldown if self.cooldown is not None else (self._latency_ewma or 0.05)
+                if now - self._last_decrease >= cooldown:
+                    self._limit = max(float(self.min_concurrency), self._limit / 2)
+                    self._last_decrease = now
+            elif outcome == OK:
+                self._limit = min(float(self.max_concurrency), self._limit + 1.0 / self._limit)
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, object]:
+        with self._cond:
+            self._refill(time.monotonic())
+            return {
+                "host": self.host,
+                "rate": self.rate,
+                "concurrency_limit": int(self._limit),
+                "max_concurrency": self.max_concurrency,
+                "in_flight": self._in_flight,
+                "queue_depth": self._waiting,
+                "tokens": round(self._tokens, 2),
+                "latency_ewma_ms": None if self._latency_ewma is None else round(self._latency_ewma * 1000, 1),
+                **self._counts,
+            }
+
+
+def classify_error(exc: BaseException) -> str:
+    if isinstance(exc, urllib.error.HTTPError):
+        return THROTTLED if exc.code in {429, 503} else ERROR
+    if isinstance(exc, (socket.timeout, TimeoutError)):
+        return TIMEOUT
+    if isinstance(exc, urllib.error.URLError) and isinstance(exc.reason, (socket.timeout, TimeoutError)):
+        return TIMEOUT
+    return ERROR
+
+
+def parse_limits(raw: str) -> Dict[str, Tuple[float, int]]:
+    """"host=rps:并发上限,default=rps:并发上限" -> {host: (rps, max_concurrency)}，忽略格式错误的项。"""
+    limits: Dict[str, Tuple[float, int]] = {}
+    for item in raw.split(","):
+        host, _, spec = item.strip().partition("=")
+        rate, _, concurrency = spec.partition(":")
+        try:
+            limits[host.strip().lower()] = (float(rate), int(concurrency or 1))
+        except ValueError:
+            continue
+    return limits
+
+
+class OutboundLimiter:
+    """进程内所有 provider 共用的按主机出站限制表。"""
+
+    def __init__(self, limits: Dict[str, Tuple[float, int]], queue_timeout: float) -> None:
+        self.limits = limits
+        self.queue_timeout = queue_timeout
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, HostLimiter] = {}
+
+    def for_host(self, host: str) -> HostLimiter:
+        host = host.lower()
+        with self._lock:
+            limiter = self._hosts.get(host)
+            if limiter is None:
+                rate, concurrency = self.limits.get(host) or self.limits.get("default") or (10.0, 4)
+                limiter = self._hosts[host] = HostLimiter(host, rate, concurrency)
+            return limiter
+
+    @contextmanager
+    def request(self, url_or_host: str) -> Iterator[None]:
+        """包住一次上游请求：排队取得名额，结束后按耗时与异常类型反馈给 AIMD。"""
+        host = urlparse(url_or_host).hostname if "://" in url_or_host else url_or_host
+        limiter = self.for_host(host or url_or_host)
+        limiter.acquire(self.queue_timeout)
+        begin = time.monotonic()
+        outcome = OK
+        try:
+            yield
+        except BaseException as exc:
+            outcome = classify_error(exc)
+            raise
+        finally:
+            limiter.release(time.monotonic() - begin, outcome)
+
+    def stats(self) -> List[Dict[str, object]]:
+        with self._lock:
+            limiters = list(self._hosts.values())
+        return [limiter.stats() for limiter in sorted(limiters, key=lambda x: x.host)]
+
+
+_OUTBOUND: Optional[OutboundLimiter] = None
+_OUTBOUND_LOCK = threading.Lock()
+
+
+def get_outbound_limiter() -> OutboundLimiter:
+    global _OUTBOUND
+    if _OUTBOUND is None:
+        with _OUTBOUND_LOCK:
+            if _OUTBOUND is None:
+                from app.config import UPSTREAM_LIMITS, UPSTREAM_QUEUE_TIMEOUT
+
+                _OUTBOUND = OutboundLimiter(parse_limits(UPSTREAM_LIMITS), UPSTREAM_QUEUE_TIMEOUT)
+    return _OUTBOUND
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from app.market_session import classify_symbol, get_calendar
+from app.providers.base import QuoteProvider
+
+logger = logging.getLogger(__name__)
+
+
+class _CloseStore:
+    """收盘涨跌快照：内存表 + quote_snapshots 表，进程内首次使用时整表加载。"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._rows: Dict[str, Tuple[float, str]] = {}
+        self._loaded = False
+
+    def get(self, symbol: str) -> Optional[Tuple[float, str]]:
+        if not self._loaded:
+            try:
+                from app.db import load_quote_snapshots
+
+                rows = load_quote_snapshots()
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("quote_snapshots 读取失败: %s", exc)
+                rows = {}
+            with self._lock:
+                if not self._loaded:
+                    for key, value in rows.items():
+                        self._rows.setdefault(key, value)
+                    self._loaded = True
+        with self._lock:
+            return self._rows.get(symbol)
+
+    def put(self, symbol: str, pct: float, trade_date: str) -> None:
+        with self._lock:
+            self._rows[symbol] = (pct, trade_date)
+        try:
+            from app.db import save_quote_snapshots
+
+            save_quote_snapshots([(symbol, pct, trade_date)])
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("quote_snapshots 写入失败: %s", exc)
+
+
+CLOSE_STORE = _CloseStore()
+
+
+class SessionAwareQuoteProvider(QuoteProvider):
+    """成分股所在市场休市时（开盘前/收盘后/非交易日），返回最近一个收盘日的涨跌，
+    每个交易日每只股票最多请求上游一次；盘中（含午休）原样透传。"""
+
+    def __init__(self, inner: QuoteProvider, store: _CloseStore = CLOSE_STORE) -> None:
+        self.inner = inner
+        self.store = store
+        self.quote_cache: Optional[Dict[str, Optional[float]]] = getattr(inner, "quote_cache", None)
+
+    def get_pct_change(self, symbol: str) -> Optional[float]:
+        market = classify_symbol(symbol)
+        calendar = get_calendar()
+        if market is None or calendar.session_state(market) not in {"pre", "closed"}:
+            return self.inner.get_pct_change(symbol)
+
+        trade_date = calendar.last_close_date(market).isoformat()
+        snapshot = self.store.get(symbol)
+        if snapshot is not None and snapshot[1] == trade_date:
+            if self.quote_cache is not None:
+                self.quote_cache[symbol] = snapshot[0]
+            return snapshot[0]
+
+        pct = self.inner.get_pct_change(symbol)
+        if pct is not None:
+            self.store.put(symbol, pct, trade_date)
+        return pct
+
+    def get_pct_changes(self, symbols: List[str]) -> Dict[str, Optional[float]]:
+        calendar = get_calendar()
+        result: Dict[str, Optional[float]] = {}
+        live: List[str] = []
+        closing: Dict[str, str] = {}
+        for symbol in symbols:
+            market = classify_symbol(symbol)
+            if market is None or calendar.session_state(market) not in {"pre", "closed"}:
+                live.append(symbol)
+                continue
+            trade_date = calendar.last_close_date(market).isoformat()
+            snapshot = self.store.get(symbol)
+            if snapshot is not None and snapshot[1] == trade_date:
+                result[symbol] = snapshot[0]
+            else:
+                closing[symbol] = trade_date
+                live.append(symbol)
+
+        if live:
+            fetched = self.inner.get_pct_changes(live)
+            for symbol, trade_date in closing.items():
+                pct = fetched.get(symbol)
+                if pct is not None:
+                    self.store.put(symbol, pct, trade_date)
+            result.update(fetched)
+        if self.quote_cache is not None:
+            self.quote_cache.update(result)
+        return result
@@ -0,0 +1,413 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from app.providers.base import Holding, HoldingsProvider, QuoteProvider
+from app.providers.singleflight import UPSTREAM_FLIGHT, SingleFlight
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# get() 未命中时的返回值；缓存的 None（如行情缺失）是合法值
+MISS: Any = object()
+
+
+class CacheBackend(ABC):
+    """跨请求（可选跨进程）的键值缓存，值需可 JSON 序列化；附带按 key 的租约锁。"""
+
+    name = "base"
+
+    @abstractmethod
+    def get(self, key: str) -> Any:
+        """返回缓存值，不存在或已过期时返回 MISS。"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def try_lock(self, key: str, owner: str, ttl: float) -> bool:
+        """尝试取得 key 的刷新租约；租约过期（持有者崩溃）后可被其他进程接手。"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def unlock(self, key: str, owner: str) -> None:
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, object]:
+        return {"backend": self.name}
+
+
+class MemoryBackend(CacheBackend):
+    """进程内实现：单 worker 部署的默认选择。"""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 100_000) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._data: Dict[str, Tuple[float, Any]] = {}
+        self._leases: Dict[str, Tuple[str, float]] = {}
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return MISS
+            if entry[0] <= time.time():
+                del self._data[key]
+                return MISS
+            return entry[1]
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        now = time.time()
+        with self._lock:
+            self._data.pop(key, None)
+            if len(self._data) >= self.max_entries:
+                # dict 保持插入顺序，淘汰最早写入的一项
+                self._data.pop(next(iter(self._data)))
+            self._data[key] = (now + ttl, value)
+
+    def try_lock(self, key: str, owner: str, ttl: float) -> bool:
+        now = time.time()
+        with self._lock:
+            lease = self._leases.get(key)
+            if lease is not None and lease[1] > now and lease[0] != owner:
+                return False
+            self._leases[key] = (owner, now + ttl)
+            return True
+
+    def unlock(self, key: str, owner: str) -> None:
+        with self._lock:
+            lease = self._leases.get(key)
+            if lease is not None and lease[0] == owner:
+                del self._leases[key]
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {"backend": self.name, "entries": len(self._data), "leases": len(self._leases)}
+
+
+class SqliteBackend(CacheBackend):
+    """同一主机多 worker 共享：独立的 SQLite 文件，WAL 模式下读不阻塞写。
+
+    租约锁为一行 (key, owner, expires_at)，用 INSERT ... ON CONFLICT DO UPDATE WHERE 已过期 原子抢占。
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._purged_at = 0.0
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL) WITHOUT ROWID"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_leases(key TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL) WITHOUT ROWID"
+        )
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # autocommit：每条语句单独提交，避免长事务阻塞其他 worker
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Any:
+        row = self._conn().execute(
+            "SELECT value FROM cache_entries WHERE key=? AND expires_at>?", (key, time.time())
+        ).fetchone()
+        return MISS if row is None else json.loads(row[0])
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        now = time.time()
+        conn = self._conn()
+        conn.execute(
+            "INSERT INTO cache_entries(key, value, expires_at) VALUES(?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value=excluded.value, expires_at=excluded.expires_at",
+            (key, json.dumps(value, ensure_ascii=False), now + ttl),
+        )
+        if now - self._purged_at > 60:
+            self._purged_at = now
+            conn.execute("DELETE FROM cache_entries WHERE expires_at<=?", (now,))
+
+    def try_lock(self, key: str, owner: str, ttl: float) -> bool:
+        now = time.time()
+        cur = self._conn().execute(
+            "INSERT INTO cache_leases(key, owner, expires_at) VALUES(?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET owner=excluded.owner, expires_at=excluded.expires_at "
+            "WHERE cache_leases.expires_at<=? OR cache_leases.owner=excluded.owner",
+            (key, owner, now + ttl, now),
+        )
+        return cur.rowcount == 1
+
+    def unlock(self, key: str, owner: str) -> None:
+        self._conn().execute("DELETE FROM cache_leases WHERE key=? AND owner=?", (key, owner))
+
+    def stats(self) -> Dict[str, object]:
+        conn = self._conn()
+        now = time.time()
+        entries = conn.execute("SELECT COUNT(*) FROM cache_entries WHERE expires_at>?", (now,)).fetchone()[0]
+        leases = conn.execute("SELECT COUNT(*) FROM cache_leases WHERE expires_at>?", (now,)).fetchone()[0]
+        return {"backend": self.name, "path": str(self.path), "entries": entries, "leases": leases}
+
+
+class RedisBackend(CacheBackend):
+    """可选：Redis 或兼容实现（如本地 KeyDB/Dragonfly），需要安装 redis 包。"""
+
+    name = "redis"
+
+    _UNLOCK_SCRIPT = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) end return 0"
+
+    def __init__(self, url: str, prefix: str = "fund:") -> None:
+        try:
+            import redis
+        except ImportError as exc:
+            raise RuntimeError("CACHE_BACKEND=redis 需要安装 redis 包") from exc
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Any:
+        raw = self._client.get(self.prefix + key)
+        return MISS if raw is None else json.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self._client.set(self.prefix + key, json.dumps(value, ensure_ascii=False), px=max(1, int(ttl * 1000)))
+
+    def try_lock(self, key: str, owner: str, ttl: float) -> bool:
+        return bool(self._client.set(self.prefix + "lock:" + key, owner, nx=True, px=max(1, int(ttl * 1000))))
+
+    def unlock(self, key: str, owner: str) -> None:
+        self._client.eval(self._UNLOCK_SCRIPT, 1, self.prefix + "lock:" + key, owner)
+
+
+class SharedCache:
+    """在 CacheBackend 上实现“读缓存 → 抢租约 → 只有持有者回源”。
+
+    进程内先经 single-flight 合并，每个进程只有一个线程参与跨进程竞争；
+    没抢到租约的进程轮询等待持有者写入。持有者回源失败会释放租约，由等待者接手；
+    持有者卡住超过 lock_ttl 时等待者直接回源。
+    """
+
+    def __init__(self, backend: CacheBackend, lock_ttl: float, flight: SingleFlight = UPSTREAM_FLIGHT) -> None:
+        self.backend = backend
+        self.lock_ttl = lock_ttl
+        self.flight = flight
+        self.owner = f"{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._counts_lock = threading.Lock()
+        self._counts: Dict[str, int] = {"hits": 0, "misses": 0, "computed": 0, "waited": 0}
+
+    def _count(self, name: str) -> None:
+        with self._counts_lock:
+            self._counts[name] += 1
+
+    def get_or_compute(self, key: str, ttl: float, compute: Callable[[], T], poll: float = 0.05) -> T:
+        value = self.backend.get(key)
+        if value is not MISS:
+            self._count("hits")
+            return value
+        self._count("misses")
+        return self.flight.do(("shared_cache", key), lambda: self._lead_or_wait(key, ttl, compute, poll))
+
+    def _lead_or_wait(self, key: str, ttl: float, compute: Callable[[], T], poll: float) -> T:
+        deadline = time.monotonic() + self.lock_ttl
+        while True:
+            if self.backend.try_lock(key, self.owner, self.lock_ttl):
+                try:
+                    # 抢到租约前别的 worker 可能刚写入
+                    value = self.backend.get(key)
+                    if value is not MISS:
+                        return value
+                    value = compute()
+                    self._count("computed")
+                    self.backend.set(key, value, ttl)
+                    return value
+                finally:
+                    self.backend.unlock(key, self.owner)
+            self._count("waited")
+            time.sleep(poll)
+            value = self.backend.get(key)
+            if value is not MISS:
+                return value
+            if time.monotonic() >= deadline:
+                # 持有者卡住：自行回源，不写回以免与持有者的结果交错
+                logger.warning("等待共享缓存 %s 超时，直接回源", key)
+                return compute()
+
+    def get_many_or_compute(
+        self, keys: List[str], ttl: float, compute: Callable[[List[str]], Dict[str, Any]], poll: float = 0.05
+    ) -> Dict[str, Any]:
+        """批量版 get_or_compute：未命中的 key 逐个抢租约，抢到的合成一批交给 compute 并写回，
+        其余轮询等待持有者写入；等待超过 lock_ttl 的剩余 key 自行回源（不写回）。
+
+        compute 返回 {key: 值}，未返回的 key 结果为 None 且不写缓存。
+        """
+        result: Dict[str, Any] = {}
+        pending: List[str] = []
+        for key in dict.fromkeys(keys):
+            value = self.backend.get(key)
+            if value is MISS:
+                self._count("misses")
+                pending.append(key)
+            else:
+                self._count("hits")
+                result[key] = value
+
+        deadline = time.monotonic() + self.lock_ttl
+        while pending:
+            locked = [key for key in pending if self.backend.try_lock(key, self.owner, self.lock_ttl)]
+            if locked:
+                try:
+                    todo = []
+                    for key in locked:
+                        # 抢到租约前别的 worker 可能刚写入
+                        value = self.backend.get(key)
+                        if value is MISS:
+                            todo.append(key)
+                        else:
+                            result[key] = value
+                    if todo:
+                        fetched = compute(todo)
+                        self._count("computed")
+                        for key in todo:
+                            if key in fetched:
+                                self.backend.set(key, fetched[key], ttl)
+                            result[key] = fetched.get(key)
+                finally:
+                    for key in locked:
+                        self.backend.unlock(key, self.owner)
+                pending = [key for key in pending if key not in result]
+                if not pending:
+                    break
+
+            self._count("waited")
+            time.sleep(poll)
+            waiting = []
+            for key in pending:
+                value = self.backend.get(key)
+                if value is MISS:
+                    waiting.append(key)
+                else:
+                    result[key] = value
+            pending = waiting
+            if pending and time.monotonic() >= deadline:
+                logger.warning("等待共享缓存超时（%s 个 key），直接回源", len(pending))
+                fetched = compute(pending)
+                result.update({key: fetched.get(key) for key in pending})
+                break
+        return result
+
+    def stats(self) -> Dict[str, object]:
+        with self._counts_lock:
+            counts = dict(self._counts)
+        try:
+            info = self.backend.stats()
+        except Exception as exc:  # noqa: BLE001
+            info = {"backend": self.backend.name, "error": str(exc)}
+        return {**info, **counts}
+
+
+class SharedCacheQuoteProvider(QuoteProvider):
+    def __init__(self, inner: QuoteProvider, cache: SharedCache, ttl: float) -> None:
+        self.inner = inner
+        self.cache = cache
+        self.ttl = ttl
+        self._name = type(inner).__name__
+        # 与被包装 provider 共用请求级缓存
+        self.quote_cache: Optional[Dict[str, Optional[float]]] = getattr(inner, "quote_cache", None)
+
+    def get_pct_change(self, symbol: str) -> Optional[float]:
+        if self.quote_cache is not None and symbol in self.quote_cache:
+            return self.quote_cache[symbol]
+        value = self.cache.get_or_compute(self._key(symbol), self.ttl, lambda: self.inner.get_pct_change(symbol))
+        if self.quote_cache is not None:
+            self.quote_cache[symbol] = value
+        return value
+
+    def get_pct_changes(self, symbols: List[str]) -> Dict[str, Optional[float]]:
+        """命中的直接返回；未命中的按代码抢租约，本进程抢到的合成一批回源，其余等待持有者写入。"""
+        result: Dict[str, Optional[float]] = {}
+        keys: Dict[str, str] = {}
+        for symbol in symbols:
+            if self.quote_cache is not None and symbol in self.quote_cache:
+                result[symbol] = self.quote_cache[symbol]
+            else:
+                keys[self._key(symbol)] = symbol
+        if keys:
+
+            def _fetch(batch: List[str]) -> Dict[str, Any]:
+                fetched = self.inner.get_pct_changes([keys[key] for key in batch])
+                return {self._key(symbol): value for symbol, value in fetched.items()}
+
+            shared = self.cache.get_many_or_compute(list(keys), self.ttl, _fetch)
+            result.update({keys[key]: value for key, value in shared.items()})
+        if self.quote_cache is not None:
+            self.quote_cache.update(result)
+        return result
+
+    def _key(self, symbol: str) -> str:
+        return f"quote:{self._name}:{symbol}"
+
+
+class SharedCacheHoldingsProvider(HoldingsProvider):
+    def __init__(self, inner: HoldingsProvider, cache: SharedCache, holdings_ttl: float, name_ttl: float) -> None:
+        self.inner = inner
+        self.cache = cache
+        self.holdings_ttl = holdings_ttl
+        self.name_ttl = name_ttl
+        self._name = type(inner).__name__
+
+    def get_fund_name(self, code: str) -> str:
+        return self.cache.get_or_compute(f"name:{self._name}:{code}", self.name_ttl, lambda: self.inner.get_fund_name(code))
+
+    def get_latest_holdings(self, code: str) -> Tuple[List[Holding], str, str]:
+        def _fetch() -> list:
+            holdings, period, source = self.inner.get_latest_holdings(code)
+            return [[[h.symbol, h.name, h.weight] for h in holdings], period, source]
+
+        rows, period, source = self.cache.get_or_compute(f"holdings:{self._name}:{code}", self.holdings_ttl, _fetch)
+        return [Holding(symbol=s, name=n, weight=w) for s, n, w in rows], period, source
+
+
+_SHARED: Optional[SharedCache] = None
+_SHARED_LOCK = threading.Lock()
+
+
+def build_backend(name: str) -> CacheBackend:
+    from app.config import CACHE_DB_PATH, CACHE_REDIS_URL
+
+    if name == "sqlite":
+        return SqliteBackend(Path(CACHE_DB_PATH))
+    if name == "redis":
+        return RedisBackend(CACHE_REDIS_URL)
+    if name != "memory":
+        logger.warning("CACHE_BACKEND=%s 暂不支持，回退为 memory", name)
+    return MemoryBackend()
+
+
+def get_shared_cache() -> SharedCache:
+    global _SHARED
+    if _SHARED is None:
+        with _SHARED_LOCK:
+            if _SHARED is None:
+                from app.config import CACHE_BACKEND, CACHE_LOCK_TTL
+
+                _SHARED = SharedCache(build_backend(CACHE_BACKEND), CACHE_LOCK_TTL)
+    return _SHARED
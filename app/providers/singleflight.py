@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, TypeVar
+
+from app.providers.base import Holding, HoldingsProvider, QuoteProvider
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """同一 key 的并发调用只执行一次，其余调用方等待并共享结果或异常。
+
+    只合并“正在进行中”的调用，完成后立即移除，不承担缓存职责。
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.executed = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                self.executed += 1
+            else:
+                call.waiters += 1
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as exc:  # noqa: BLE001
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result
+
+    def do_many(self, keys: List[Hashable], fn: Callable[[List[Hashable]], Dict[Hashable, Any]]) -> Dict[Hashable, Any]:
+        """批量版 do：未在进行中的 key 由本调用合成一批交给 fn，其余等待已有调用的结果。
+
+        fn 返回 {key: 结果}，缺失的 key 结果为 None；fn 或被等待的调用抛错时原样抛出。
+        """
+        led: Dict[Hashable, _Call] = {}
+        joined: Dict[Hashable, _Call] = {}
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                call = self._calls.get(key)
+                if call is None:
+                    call = led[key] = self._calls[key] = _Call()
+                else:
+                    call.waiters += 1
+                    joined[key] = call
+            if led:
+                self.executed += 1
+            self.shared += len(joined)
+
+        results: Dict[Hashable, Any] = {}
+        if led:
+            try:
+                fetched = fn(list(led))
+                for key, call in led.items():
+                    call.result = results[key] = fetched.get(key)
+            except BaseException as exc:  # noqa: BLE001
+                for call in led.values():
+                    call.error = exc
+                raise
+            finally:
+                with self._lock:
+                    for key in led:
+                        self._calls.pop(key, None)
+                for call in led.values():
+                    call.done.set()
+        # 先完成自己领的批次再等待别人的，两个批次互相等待不会死锁
+        for key, call in joined.items():
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            results[key] = call.result
+        return results
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+
+# 进程内所有 provider 共用，key 为 (provider 类名, 方法名, 参数)
+UPSTREAM_FLIGHT = SingleFlight()
+
+
+def provider_name(provider: Any) -> str:
+    """沿 inner 链找到最内层（真正回源的）provider 的类名，缓存等包装层不参与 key。"""
+    while hasattr(provider, "inner"):
+        provider = provider.inner
+    return type(provider).__name__
+
+
+class SingleFlightHoldingsProvider(HoldingsProvider):
+    def __init__(self, inner: HoldingsProvider, flight: SingleFlight = UPSTREAM_FLIGHT) -> None:
+        self.inner = inner
+        self.flight = flight
+        self._name = provider_name(inner)
+
+    def get_fund_name(self, code: str) -> str:
+        return self.flight.do((self._name, "get_fund_name", code), lambda: self.inner.get_fund_name(code))
+
+    def get_latest_holdings(self, code: str) -> Tuple[List[Holding], str, str]:
+        return self.flight.do((self._name, "get_latest_holdings", code), lambda: self.inner.get_latest_holdings(code))
+
+
+class SingleFlightQuoteProvider(QuoteProvider):
+    def __init__(self, inner: QuoteProvider, flight: SingleFlight = UPSTREAM_FLIGHT) -> None:
+        self.inner = inner
+        self.flight = flight
+        self._name = provider_name(inner)
+        # 与被包装 provider 共用同一份请求级缓存，跟随者拿到的结果也写回本请求的缓存
+        self.quote_cache: Optional[Dict[str, Optional[float]]] = getattr(inner, "quote_cache", None)
+
+    def get_pct_change(self, symbol: str) -> Optional[float]:
+        if self.quote_cache is not None and symbol in self.quote_cache:
+            return self.quote_cache[symbol]
+        value = self.flight.do((self._name, "get_pct_change", symbol), lambda: self.inner.get_pct_change(symbol))
+        if self.quote_cache is not None:
+            self.quote_cache[symbol] = value
+        return value
+
+    def get_pct_changes(self, symbols: List[str]) -> Dict[str, Optional[float]]:
+        # 与 get_pct_change 共用按代码的 key：已在其他请求里取的代码直接等待，其余合成一批回源
+        cache = self.quote_cache if self.quote_cache is not None else {}
+        result = {symbol: cache[symbol] for symbol in symbols if symbol in cache}
+        missing = [symbol for symbol in symbols if symbol not in result]
+        if missing:
+
+            def _fetch(keys: List[Hashable]) -> Dict[Hashable, Any]:
+                fetched = self.inner.get_pct_changes([key[2] for key in keys])
+                return {(self._name, "get_pct_change", symbol): value for symbol, value in fetched.items()}
+
+            shared = self.flight.do_many([(self._name, "get_pct_change", symbol) for symbol in missing], _fetch)
+            fetched = {key[2]: value for key, value in shared.items()}
+            cache.update(fetched)
+            result.update(fetched)
+        return result
@@ -8,6 +8,11 @@ from pydantic import BaseModel
 class EstimateResponse(BaseModel):
     results: List[Dict[str, Any]]
     failures: List[str]
+    as_of: Optional[int] = None
+    stale: bool = False
+    # format=columnar 时：results 内 details 换成平行数组 columns，股票名称在 symbols 中
+    format: Optional[str] = None
+    symbols: Optional[Dict[str, str]] = None
 
 
 class PositionUpsertRequest(BaseModel):
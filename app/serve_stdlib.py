@@ -5,28 +5,37 @@ import os
 import sys
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from typing import Iterator
 from urllib.parse import parse_qs, unquote, urlparse
 
 ROOT_DIR = Path(__file__).resolve().parent.parent
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
-from app.config import DEFAULT_FUND_CODES
+from app.config import DEFAULT_FUND_CODES, WARMUP_ENABLED
 from app.db import (
     bulk_upsert_positions,
     delete_position,
     ensure_tables,
+    list_position_changes,
     list_positions,
+    parse_position_fields,
     set_position_active,
     sync_positions,
     update_position_name_if_empty,
     upsert_position,
 )
 from app.providers.mock import MockGoldProvider, MockIndexProvider
+from app.providers.fund_catalog import catalog_fund_names, fund_catalog_status, search_funds, start_fund_catalog
+from app.providers.shared_cache import get_shared_cache
+from app.services.admission import AdmissionRejected, admission_stats, gate_for_path
+from app.services.bulk_io import MEDIA_TYPES, export_estimate_history, export_positions, import_positions, parse_format
+from app.services.columnar import parse_top, shape_estimate
+from app.services.market_hub import MarketDataHub, parse_markets
+from app.services.warmup import start_cache_warmup, warmup_status
 
 WEB_DIR = Path(__file__).parent / "web"
-INDEX_PROVIDER = MockIndexProvider()
-GOLD_PROVIDER = MockGoldProvider()
+MARKET_HUB = MarketDataHub({"mock": MockIndexProvider()}, {"mock": MockGoldProvider()})
 
 
 def _json(handler: BaseHTTPRequestHandler, status: int, payload: dict) -> None:
@@ -66,11 +75,36 @@ def _safe_int(value: object, default: int = 0) -> int:
         return default
 
 
+def _stream_text(handler: BaseHTTPRequestHandler, lines: Iterator[str], fmt: str, filename: str) -> None:
+    # HTTP/1.0 无 Content-Length，逐页写出后由关闭连接表示结束
+    handler.send_response(200)
+    handler.send_header("Content-Type", MEDIA_TYPES[fmt])
+    handler.send_header("Content-Disposition", f'attachment; filename="{filename}.{fmt}"')
+    handler.end_headers()
+    for text in lines:
+        handler.wfile.write(text.encode("utf-8"))
+
+
+def _read_body_chunks(handler: BaseHTTPRequestHandler, length: int, size: int = 64 * 1024) -> Iterator[bytes]:
+    """按 Content-Length 分块读取请求体，不一次性读入内存。"""
+    while length > 0:
+        chunk = handler.rfile.read(min(size, length))
+        if not chunk:
+            return
+        length -= len(chunk)
+        yield chunk
+
+
 def _fallback_estimate(codes: list[str]) -> dict:
     failures = [f"{code}:stdlib fallback mode" for code in codes]
     return {"results": [], "failures": failures}
 
 
+def _shape_estimate(data: dict, query: dict, key: str = "results") -> dict:
+    columnar = query.get("format", ["json"])[0] == "columnar"
+    return shape_estimate(data, columnar=columnar, top=parse_top(query.get("top", [""])[0]), key=key)
+
+
 class StdlibHandler(BaseHTTPRequestHandler):
     server_version = "FundStdlibHTTP/1.0"
 
@@ -90,6 +124,27 @@ class StdlibHandler(BaseHTTPRequestHandler):
         self.end_headers()
 
     def do_GET(self) -> None:  # noqa: N802
+        gate = gate_for_path(urlparse(self.path).path)
+        if gate is None:
+            self._handle_get()
+            return
+        try:
+            entered_at = gate.enter()
+        except AdmissionRejected as exc:
+            data = json.dumps({"ok": False, "error": str(exc)}, ensure_ascii=False).encode("utf-8")
+            self.send_response(exc.status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.send_header("Retry-After", str(exc.retry_after))
+            self.end_headers()
+            self.wfile.write(data)
+            return
+        try:
+            self._handle_get()
+        finally:
+            gate.release(entered_at)
+
+    def _handle_get(self) -> None:
         parsed = urlparse(self.path)
         path = parsed.path
 
@@ -114,28 +169,138 @@ class StdlibHandler(BaseHTTPRequestHandler):
                     "quote_provider": "mock",
                     "index_provider": "mock",
                     "gold_provider": "mock",
+                    "admission": admission_stats(),
+                    "cache": get_shared_cache().stats(),
+                    "warmup": warmup_status(),
+                    "catalog": fund_catalog_status(),
                 },
             )
             return
 
+        if path == "/api/upstream/limits":
+            from app.providers.composite import quote_backend_stats
+            from app.providers.ratelimit import get_outbound_limiter
+
+            _json(self, 200, {"hosts": get_outbound_limiter().stats(), "quote_backends": quote_backend_stats()})
+            return
+
         if path == "/api/default-codes":
             _json(self, 200, {"codes": DEFAULT_FUND_CODES})
             return
 
         if path == "/api/indexes":
             market = parse_qs(parsed.query).get("market", ["cn"])[0]
-            quotes = [x.__dict__ for x in INDEX_PROVIDER.get_indexes(market)]
-            _json(self, 200, {"market": market, "quotes": quotes})
+            result = MARKET_HUB.get_indexes(parse_markets(market, MARKET_HUB.index_markets()))
+            quotes = [x.__dict__ for x in result["quotes"]]
+            _json(self, 200, {"market": market, "quotes": quotes, "sources": result["sources"], "partial": result["partial"]})
             return
 
         if path == "/api/gold/realtime":
-            quotes = [x.__dict__ for x in GOLD_PROVIDER.get_gold_quotes()]
-            _json(self, 200, {"quotes": quotes})
+            result = MARKET_HUB.get_gold_quotes()
+            quotes = [x.__dict__ for x in result["quotes"]]
+            _json(self, 200, {"quotes": quotes, "sources": result["sources"], "partial": result["partial"]})
             return
 
         if path == "/api/portfolio":
-            active_only = parse_qs(parsed.query).get("active_only", ["1"])[0]
-            _json(self, 200, list_positions(active_only=active_only != "0"))
+            query = parse_qs(parsed.query)
+
+            def _arg(name: str, default: str = "") -> str:
+                return query.get(name, [default])[0].strip()
+
+            try:
+                selected = parse_position_fields(_arg("fields"))
+            except ValueError as exc:
+                _json(self, 400, {"ok": False, "error": str(exc)})
+                return
+            data = list_positions(
+                active_only=_arg("active_only", "1") != "0",
+                after=_arg("after"),
+                limit=max(0, _safe_int(_arg("limit"), 0)),
+                fields=selected,
+                code_prefix=_arg("code_prefix"),
+                q=_arg("q"),
+                updated_since=max(0, _safe_int(_arg("updated_since"), 0)),
+                held_only=_arg("held_only", "0") not in {"", "0"},
+            )
+            _json(self, 200, data)
+            return
+
+        if path == "/api/portfolio/changes":
+            query = parse_qs(parsed.query)
+            since = max(0, _safe_int(query.get("since", ["0"])[0], 0))
+            limit = max(0, _safe_int(query.get("limit", ["0"])[0], 0))
+            _json(self, 200, list_position_changes(since=since, limit=limit))
+            return
+
+        if path == "/api/market/funds/top":
+            query = parse_qs(parsed.query)
+            from app.services.universe import top_funds
+
+            try:
+                data = top_funds(
+                    by=query.get("by", ["estimated_pct"])[0].strip(),
+                    n=max(1, _safe_int(query.get("n", ["20"])[0], 20)),
+                    ascending=query.get("order", ["desc"])[0] == "asc",
+                )
+            except ValueError as exc:
+                _json(self, 400, {"ok": False, "error": str(exc)})
+                return
+            _json(self, 200, data)
+            return
+
+        if path in {"/api/portfolio/positions/export", "/api/estimate/history/export"}:
+            query = parse_qs(parsed.query)
+            try:
+                fmt = parse_format(query.get("format", ["csv"])[0])
+            except ValueError as exc:
+                _json(self, 400, {"ok": False, "error": str(exc)})
+                return
+            if path == "/api/estimate/history/export":
+                _stream_text(self, export_estimate_history(fmt), fmt, "estimate_history")
+            else:
+                active_only = query.get("active_only", ["0"])[0] not in {"", "0"}
+                _stream_text(self, export_positions(fmt, active_only=active_only), fmt, "positions")
+            return
+
+        if path == "/api/portfolio/valuation":
+            query = parse_qs(parsed.query)
+            include_details = query.get("details", ["1"])[0] != "0"
+            from app.services.valuation import value_portfolio
+
+            try:
+                data = value_portfolio(include_details=include_details)
+            except Exception:
+                data = value_portfolio(estimate=_fallback_estimate, include_details=include_details)
+            _json(self, 200, _shape_estimate(data, query, key="positions"))
+            return
+
+        if path == "/api/funds/search":
+            query = parse_qs(parsed.query)
+            limit = max(1, _safe_int(query.get("limit", ["10"])[0], 10))
+            _json(self, 200, search_funds(query.get("q", [""])[0], limit))
+            return
+
+        if path == "/api/funds/names":
+            code_raw = parse_qs(parsed.query).get("codes", [""])[0]
+            codes = [c.strip() for c in unquote(code_raw).split(",") if c.strip()]
+            _json(self, 200, {"names": catalog_fund_names(codes)})
+            return
+
+        if path == "/api/funds/details":
+            query = parse_qs(parsed.query)
+            codes = [c.strip() for c in unquote(query.get("codes", [""])[0]).split(",") if c.strip()]
+            from app.services.estimate import build_fund_details, iter_fund_details
+
+            if query.get("format", ["json"])[0] == "ndjson":
+                # HTTP/1.0 无 Content-Length，逐行写出后由关闭连接表示结束
+                self.send_response(200)
+                self.send_header("Content-Type", "application/x-ndjson; charset=utf-8")
+                self.end_headers()
+                for item in iter_fund_details(codes):
+                    self.wfile.write((json.dumps(item, ensure_ascii=False) + "\n").encode("utf-8"))
+                    self.wfile.flush()
+                return
+            _json(self, 200, build_fund_details(codes))
             return
 
         if path.startswith("/api/funds/") and path.endswith("/detail"):
@@ -144,9 +309,9 @@ class StdlibHandler(BaseHTTPRequestHandler):
                 _json(self, 400, {"ok": False, "error": "code 不能为空"})
                 return
             try:
-                from app.services.estimate import build_fund_detail
+                from app.services.estimate import cached_fund_detail
 
-                _json(self, 200, build_fund_detail(code))
+                _json(self, 200, cached_fund_detail(code))
             except Exception:
                 _json(
                     self,
@@ -165,18 +330,40 @@ class StdlibHandler(BaseHTTPRequestHandler):
                 )
             return
 
+        if path.startswith("/api/funds/") and path.endswith("/nav"):
+            code = path[len("/api/funds/") : -len("/nav")].strip().strip("/")
+            if not code:
+                _json(self, 400, {"ok": False, "error": "code 不能为空"})
+                return
+            query = parse_qs(parsed.query)
+            from app.services.nav_history import get_nav_history
+
+            try:
+                data = get_nav_history(
+                    code,
+                    start=query.get("start", [""])[0].strip(),
+                    end=query.get("end", [""])[0].strip(),
+                    points=max(0, _safe_int(query.get("points", ["0"])[0], 0)),
+                )
+            except ValueError as exc:
+                _json(self, 400, {"ok": False, "error": str(exc)})
+                return
+            _json(self, 200, data)
+            return
+
         if path == "/api/estimate":
-            code_raw = parse_qs(parsed.query).get("codes", [""])[0]
+            query = parse_qs(parsed.query)
+            code_raw = query.get("codes", [""])[0]
             codes = [c.strip() for c in unquote(code_raw).split(",") if c.strip()]
             try:
-                from app.services.estimate import estimate_codes
+                from app.services.estimate import cached_estimate_codes
 
-                data = estimate_codes(codes)
+                data = cached_estimate_codes(codes)
                 for item in data.get("results", []):
                     update_position_name_if_empty(item.get("code", ""), item.get("name", ""))
-                _json(self, 200, data)
             except Exception:
-                _json(self, 200, _fallback_estimate(codes))
+                data = _fallback_estimate(codes)
+            _json(self, 200, _shape_estimate(data, query))
             return
 
         _json(self, 404, {"ok": False, "error": "not found"})
@@ -189,6 +376,18 @@ class StdlibHandler(BaseHTTPRequestHandler):
             content_length = int(self.headers.get("Content-Length", "0"))
         except ValueError:
             content_length = 0
+
+        if path == "/api/portfolio/positions/import":
+            # 请求体边读边解析写库，不走下面的整体 JSON 解析
+            try:
+                fmt = parse_format(parse_qs(parsed.query).get("format", ["csv"])[0])
+                result = import_positions(_read_body_chunks(self, max(0, content_length)), fmt)
+            except ValueError as exc:
+                _json(self, 400, {"ok": False, "error": str(exc)})
+                return
+            _json(self, 200, result)
+            return
+
         body = self.rfile.read(max(0, content_length))
 
         try:
@@ -266,6 +465,9 @@ class StdlibHandler(BaseHTTPRequestHandler):
 
 def main() -> None:
     ensure_tables()
+    start_fund_catalog()
+    if WARMUP_ENABLED:
+        start_cache_warmup()
     port = int(os.getenv("PORT", "8000"))
     server = ThreadingHTTPServer(("0.0.0.0", port), StdlibHandler)
     print(f"[stdlib] serving on http://0.0.0.0:{port}")
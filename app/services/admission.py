@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from app.config import ADMISSION_LIMITS, ADMISSION_QUEUE_TIMEOUT
+
+
+class AdmissionRejected(Exception):
+    """请求未被接纳：429 表示等待队列已满，503 表示排队超时。"""
+
+    def __init__(self, status: int, retry_after: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class _Waiter:
+    __slots__ = ("granted", "_notify")
+
+    def __init__(self, notify: Callable[[], None]) -> None:
+        self.granted = False
+        self._notify = notify
+
+    def grant(self) -> None:
+        self.granted = True
+        self._notify()
+
+
+class AdmissionGate:
+    """单类昂贵接口的并发闸门：最多 limit 个在处理，最多 queue 个按 FIFO 排队。
+
+    释放时名额直接移交给队首等待者；线程（stdlib 服务）与协程（FastAPI 中间件）共用同一闸门，
+    协程排队期间不占用线程池。
+    """
+
+    def __init__(self, name: str, limit: int, queue: int, queue_timeout: float) -> None:
+        self.name = name
+        self.limit = max(1, limit)
+        self.queue = max(0, queue)
+        self.queue_timeout = queue_timeout
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._waiters: Deque[_Waiter] = deque()
+        self._service_ewma = 1.0
+        self._counts: Dict[str, int] = {"admitted": 0, "rejected_full": 0, "rejected_timeout": 0, "cancelled": 0}
+
+    def _retry_after(self) -> int:
+        # 约为排在前面的请求全部处理完所需的时间
+        return max(1, math.ceil(self._service_ewma * (len(self._waiters) + 1) / self.limit))
+
+    def _try_enter(self, make_waiter: Callable[[], _Waiter]) -> Optional[_Waiter]:
+        """立即获得名额返回 None，否则返回已入队的等待者；队列满抛 429。"""
+        with self._lock:
+            if self._in_flight < self.limit and not self._waiters:
+                self._in_flight += 1
+                self._counts["admitted"] += 1
+                return None
+            if len(self._waiters) >= self.queue:
+                self._counts["rejected_full"] += 1
+                raise AdmissionRejected(429, self._retry_after(), f"{self.name} 请求过多，请稍后重试")
+            waiter = make_waiter()
+            self._waiters.append(waiter)
+            return waiter
+
+    def _give_up(self, waiter: _Waiter) -> None:
+        with self._lock:
+            if waiter.granted:
+                # 超时与移交同时发生：名额已经归本请求
+                self._counts["admitted"] += 1
+                return
+            self._waiters.remove(waiter)
+            self._counts["rejected_timeout"] += 1
+            retry_after = self._retry_after()
+        raise AdmissionRejected(503, retry_after, f"{self.name} 繁忙，排队超时")
+
+    def enter(self) -> float:
+        """阻塞式进入（线程），返回进入时间供 release 统计处理耗时。"""
+        event = threading.Event()
+        waiter = self._try_enter(lambda: _Waiter(event.set))
+        if waiter is not None:
+            if not event.wait(self.queue_timeout):
+                self._give_up(waiter)
+            elif waiter.granted:
+                with self._lock:
+                    self._counts["admitted"] += 1
+        return time.monotonic()
+
+    async def enter_async(self) -> float:
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[None]" = loop.create_future()
+
+        def _notify() -> None:
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_result(None))
+
+        waiter = self._try_enter(lambda: _Waiter(_notify))
+        if waiter is not None:
+            try:
+                await asyncio.wait_for(future, self.queue_timeout)
+                with self._lock:
+                    self._counts["admitted"] += 1
+            except asyncio.TimeoutError:
+                self._give_up(waiter)
+            except asyncio.CancelledError:
+                self._abandon(waiter)
+                raise
+        return time.monotonic()
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        """排队中被取消（如客户端断开）：还在队列里就出队，名额已移交过来则转给下一个。"""
+        with self._lock:
+            if waiter.granted:
+                self._hand_off()
+            else:
+                self._waiters.remove(waiter)
+            self._counts["cancelled"] += 1
+
+    def _hand_off(self) -> None:
+        # 调用方持有 self._lock
+        if self._waiters:
+            self._waiters.popleft().grant()
+        else:
+            self._in_flight -= 1
+
+    def release(self, entered_at: float) -> None:
+        with self._lock:
+            self._service_ewma = self._service_ewma * 0.8 + (time.monotonic() - entered_at) * 0.2
+            self._hand_off()
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "limit": self.limit,
+                "queue": self.queue,
+                "in_flight": self._in_flight,
+                "waiting": len(self._waiters),
+                "service_ewma_ms": round(self._service_ewma * 1000, 1),
+                **self._counts,
+            }
+
+
+def parse_admission_limits(raw: str) -> Dict[str, Tuple[int, int]]:
+    """"estimate=4:16,detail=8:32" -> {类别: (并发上限, 队列长度)}，忽略格式错误的项。"""
+    limits: Dict[str, Tuple[int, int]] = {}
+    for item in raw.split(","):
+        name, _, spec = item.strip().partition("=")
+        limit, _, queue = spec.partition(":")
+        try:
+            limits[name.strip()] = (int(limit), int(queue or 0))
+        except ValueError:
+            continue
+    return limits
+
+
+GATES: Dict[str, AdmissionGate] = {
+    name: AdmissionGate(name, limit, queue, ADMISSION_QUEUE_TIMEOUT)
+    for name, (limit, queue) in parse_admission_limits(ADMISSION_LIMITS).items()
+}
+
+
+def gate_for_path(path: str) -> Optional[AdmissionGate]:
+    """昂贵接口映射到各自的闸门；持仓、行情中心等廉价接口不受限，过载时仍能立即响应。"""
+    if path in {"/api/estimate", "/api/portfolio/valuation"}:
+        return GATES.get("estimate")
+    if path == "/api/funds/details" or (path.startswith("/api/funds/") and path.endswith(("/detail", "/nav"))):
+        return GATES.get("detail")
+    if path == "/api/market/funds/top":
+        return GATES.get("market")
+    return None
+
+
+def admission_stats() -> List[Dict[str, object]]:
+    return [gate.stats() for gate in GATES.values()]
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import codecs
+import csv
+import io
+import json
+import math
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from app.config import EXPORT_PAGE_SIZE, IMPORT_CHUNK_SIZE, IMPORT_MAX_ERRORS
+from app.db import POSITION_FIELDS, ImportRow, import_position_batches, iter_estimate_snapshot_pages, iter_position_pages
+
+FORMATS = ("csv", "ndjson")
+MEDIA_TYPES = {"csv": "text/csv; charset=utf-8", "ndjson": "application/x-ndjson; charset=utf-8"}
+ESTIMATE_HISTORY_FIELDS = (
+    "code", "name", "session_key", "updated_at", "estimated_pct", "matched_weight", "report_period", "source",
+)
+
+
+def iter_text_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    """把请求体字节块增量解码（UTF-8，容忍 BOM）并按行切分，保留行尾；内存只保留一块加半行。"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    tail = ""
+    for chunk in chunks:
+        text = tail + decoder.decode(chunk)
+        start = 0
+        end = text.find("\n")
+        while end >= 0:
+            yield text[start : end + 1]
+            start = end + 1
+            end = text.find("\n", start)
+        tail = text[start:]
+    tail += decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def _iter_csv(lines: Iterable[str]) -> Iterator[Tuple[int, object]]:
+    reader = csv.DictReader(lines)
+    if reader.fieldnames is None:
+        return
+    reader.fieldnames = [f.strip() for f in reader.fieldnames]
+    if "code" not in reader.fieldnames:
+        raise ValueError("CSV 表头缺少 code 列")
+    for record in reader:
+        yield reader.line_num, record
+
+
+def _iter_ndjson(lines: Iterable[str]) -> Iterator[Tuple[int, object]]:
+    for line_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_no, json.loads(line)
+        except ValueError as exc:
+            yield line_no, ValueError(f"JSON 解析失败: {exc}")
+
+
+_TRUE = {"1", "true", "yes"}
+_FALSE = {"0", "false", "no"}
+
+
+def _number(raw: object, field: str) -> float:
+    if raw is None or raw == "":
+        return 0.0
+    try:
+        value = float(raw)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        if isinstance(raw, str) and not raw.strip():
+            return 0.0
+        raise ValueError(f"{field} 不是数字: {raw!r}") from None
+    if not math.isfinite(value):
+        raise ValueError(f"{field} 不是有限数: {raw!r}")
+    return value
+
+
+def _flag(raw: object) -> int:
+    if raw is None or raw == "":
+        return 1
+    if isinstance(raw, str):
+        text = raw.strip().lower()
+        if text in _TRUE or not text:
+            return 1
+        if text in _FALSE:
+            return 0
+    elif isinstance(raw, (bool, int, float)):
+        return int(bool(raw))
+    raise ValueError(f"is_active 无法识别: {raw!r}")
+
+
+def parse_position_record(record: object) -> ImportRow:
+    """一行导入记录 → (code, name, share, cost, current_profit, is_active)，口径与 bulk_upsert 一致：
+    name 为空保留库中名称，数值为空按 0，is_active 为空按 1。不合法时抛 ValueError。
+    """
+    if not isinstance(record, dict):
+        raise ValueError("每行必须是对象")
+    get = record.get
+    code = str(get("code") or "").strip()
+    if not code:
+        raise ValueError("code 不能为空")
+    name = get("name")
+    if name is not None:
+        name = str(name).strip() or None
+    return (
+        code,
+        name,
+        _number(get("share"), "share"),
+        _number(get("cost"), "cost"),
+        _number(get("current_profit"), "current_profit"),
+        _flag(get("is_active")),
+    )
+
+
+def import_positions(
+    chunks: Iterable[bytes],
+    fmt: str,
+    *,
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+    max_errors: int = IMPORT_MAX_ERRORS,
+    write: Callable[[Iterable[List[ImportRow]]], int] = import_position_batches,
+) -> Dict[str, object]:
+    """流式导入持仓：边解析边按 chunk_size 行分批 upsert，坏行记入 errors 后继续。
+
+    每批单独提交，中途断开时已写入的批次保留；errors 最多 max_errors 条，failed 为全部坏行数。
+    CSV 表头缺少 code 列时抛 ValueError，不写入任何行。
+    """
+    records = _iter_csv if fmt == "csv" else _iter_ndjson
+    failed = 0
+    errors: List[Dict[str, object]] = []
+
+    def _fail(line_no: Optional[int], message: str) -> None:
+        nonlocal failed
+        failed += 1
+        if len(errors) < max_errors:
+            errors.append({"line": line_no, "error": message})
+
+    def _batches() -> Iterator[List[ImportRow]]:
+        batch: List[ImportRow] = []
+        try:
+            for line_no, record in records(iter_text_lines(chunks)):
+                try:
+                    if isinstance(record, Exception):
+                        raise record
+                    batch.append(parse_position_record(record))
+                except ValueError as exc:
+                    _fail(line_no, str(exc))
+                    continue
+                if len(batch) >= chunk_size:
+                    yield batch
+                    batch = []
+        except csv.Error as exc:
+            # CSV 结构损坏（如引号不闭合）无法定位后续行，之前的批次已写入
+            _fail(None, f"CSV 解析中止: {exc}")
+        yield batch
+
+    imported = write(_batches())
+    return {"ok": True, "imported": imported, "failed": failed, "errors": errors, "errors_truncated": failed > len(errors)}
+
+
+def _encode_pages(pages: Iterable[List[Dict[str, object]]], fields: Tuple[str, ...], fmt: str) -> Iterator[str]:
+    """每页编码成一段文本写出；CSV 先输出表头。"""
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=fields, extrasaction="ignore", lineterminator="\n")
+        writer.writeheader()
+        yield buffer.getvalue()
+        for page in pages:
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(page)
+            yield buffer.getvalue()
+        return
+    for page in pages:
+        yield "".join(json.dumps({f: item.get(f) for f in fields}, ensure_ascii=False) + "\n" for item in page)
+
+
+def export_positions(fmt: str, active_only: bool = False, page_size: int = EXPORT_PAGE_SIZE) -> Iterator[str]:
+    """导出全部持仓（按 code 升序），导出结果可直接用于导入。"""
+    return _encode_pages(iter_position_pages(active_only=active_only, page_size=page_size), POSITION_FIELDS, fmt)
+
+
+def _estimate_history_pages(page_size: int) -> Iterator[List[Dict[str, object]]]:
+    for page in iter_estimate_snapshot_pages(page_size=page_size):
+        yield [
+            {**{f: payload.get(f) for f in ESTIMATE_HISTORY_FIELDS}, "code": code, "session_key": key, "updated_at": updated_at}
+            for code, key, updated_at, payload in page
+        ]
+
+
+def export_estimate_history(fmt: str, page_size: int = EXPORT_PAGE_SIZE) -> Iterator[str]:
+    """导出已冻结的收盘估值（estimate_snapshots，每只基金保留最近一个交易时段）。"""
+    return _encode_pages(_estimate_history_pages(page_size), ESTIMATE_HISTORY_FIELDS, fmt)
+
+
+def parse_format(raw: Optional[str]) -> str:
+    fmt = (raw or "csv").strip().lower()
+    if fmt not in FORMATS:
+        raise ValueError("format 仅支持 csv、ndjson")
+    return fmt
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+# 成分股明细逐项的列；name 收进响应顶层的 symbols 字典，同一股票在多只基金里只出现一次
+DETAIL_COLUMNS = ("symbol", "weight", "change", "contribution")
+
+
+def parse_top(raw: object) -> Optional[int]:
+    """top 参数：正整数表示只保留贡献绝对值最大的 N 条明细，其余（空、0、非法）不截断。"""
+    try:
+        top = int(str(raw).strip())
+    except (TypeError, ValueError):
+        return None
+    return top if top > 0 else None
+
+
+def top_details(details: List[dict], top: Optional[int]) -> List[dict]:
+    """按贡献绝对值取前 top 条，保持原有顺序（贡献降序）。"""
+    if top is None or len(details) <= top:
+        return details
+    keep = sorted(range(len(details)), key=lambda i: abs(details[i].get("contribution") or 0.0), reverse=True)[:top]
+    return [details[i] for i in sorted(keep)]
+
+
+def shape_estimate(data: dict, *, columnar: bool = False, top: Optional[int] = None, key: str = "results") -> dict:
+    """按请求参数改写估值响应，data[key] 为带 details 的逐基金列表。
+
+    - top：每只基金的 details 截断为贡献最大的 N 条，details_count 保留截断前的条数
+    - columnar：details 改为平行数组 columns，股票名称去重到顶层 symbols 字典，并标记 format=columnar
+
+    data 可能来自共享缓存，只构造新对象，不修改传入的字典。
+    """
+    if not columnar and top is None:
+        return data
+    symbols: Dict[str, str] = {}
+    items = []
+    for item in data.get(key, []):
+        if "details" not in item:
+            items.append(item)
+            continue
+        details = item["details"]
+        kept = top_details(details, top)
+        shaped = {k: v for k, v in item.items() if k != "details"}
+        if top is not None:
+            shaped["details_count"] = len(details)
+        if columnar:
+            columns: Dict[str, list] = {column: [] for column in DETAIL_COLUMNS}
+            for detail in kept:
+                for column in DETAIL_COLUMNS:
+                    columns[column].append(detail.get(column))
+                symbols.setdefault(detail["symbol"], detail.get("name", ""))
+            shaped["columns"] = columns
+        else:
+            shaped["details"] = kept
+        items.append(shaped)
+
+    shaped_data = {**data, key: items}
+    if columnar:
+        shaped_data["format"] = "columnar"
+        shaped_data["symbols"] = symbols
+    return shaped_data
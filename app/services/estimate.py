@@ -1,13 +1,35 @@
 from __future__ import annotations
 
 import hashlib
-import datetime as dt
-from typing import Dict, List, Optional
+import logging
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
 
-from app.config import HOLDINGS_PROVIDER, QUOTE_PROVIDER, get_holdings_provider, get_quote_provider
+from app.config import (
+    HOLDINGS_PROVIDER,
+    QUOTE_PROVIDER,
+    RESPONSE_HARD_TTL,
+    RESPONSE_SOFT_TTL,
+    SESSION_AWARE_QUOTES,
+    get_holdings_provider,
+    get_quote_provider,
+    load_holdings_provider,
+    load_quote_provider,
+)
+from app.market_session import classify_symbol, session_key
 from app.providers.base import HoldingsProvider, ProviderError, QuoteProvider
-from app.providers.eastmoney import EastmoneyHoldingsProvider
-from app.providers.mock import MockQuoteProvider
+from app.services.nav_history import recent_nav_history
+from app.services.response_cache import StaleWhileRevalidateCache
+
+logger = logging.getLogger(__name__)
+
+# 有失败时，只有至少一只基金是本次新算出的才覆盖上一次的结果（失败的基金已沿用上次结果）
+_ESTIMATE_CACHE = StaleWhileRevalidateCache(
+    RESPONSE_SOFT_TTL,
+    RESPONSE_HARD_TTL,
+    is_good=lambda data: not data.get("failures") or any(not r.get("stale") for r in data.get("results", [])),
+)
+_DETAIL_CACHE = StaleWhileRevalidateCache(RESPONSE_SOFT_TTL, RESPONSE_HARD_TTL)
 
 
 def _stable(seed: str, low: float, high: float, precision: int = 4) -> float:
@@ -25,8 +47,10 @@ def estimate_fund(code: str, holdings_provider: HoldingsProvider, quote_provider
     matched_weight = 0.0
     missing_symbols = []
 
+    # 整只基金的成分股一次批量取行情
+    quotes = quote_provider.get_pct_changes(list(dict.fromkeys(h.symbol for h in holdings)))
     for h in holdings:
-        pct = quote_provider.get_pct_change(h.symbol)
+        pct = quotes.get(h.symbol)
         if pct is None:
             pct = 0.0
             missing_symbols.append(h.symbol)
@@ -58,6 +82,69 @@ def estimate_fund(code: str, holdings_provider: HoldingsProvider, quote_provider
     }
 
 
+def _frozen_estimate(code: str) -> Optional[dict]:
+    """所涉市场都已收盘且收盘批次未变时，直接返回入库的估值，不访问上游。"""
+    if not SESSION_AWARE_QUOTES:
+        return None
+    from app.db import get_estimate_snapshot
+
+    try:
+        snapshot = get_estimate_snapshot(code)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("读取估值快照失败 %s: %s", code, exc)
+        return None
+    if snapshot is None:
+        return None
+    stored_key, payload = snapshot
+    markets = {part.split(":", 1)[0] for part in stored_key.split("|") if part}
+    if session_key(markets) != stored_key:
+        return None
+    return payload
+
+
+def _freeze_if_closed(result: dict) -> None:
+    if not SESSION_AWARE_QUOTES:
+        return
+    if result.get("missing_symbols"):
+        # 有成分股缺行情的降级结果不冻结，下次请求重新回源
+        return
+    markets = {classify_symbol(d["symbol"]) for d in result.get("details", [])}
+    key = session_key({m for m in markets if m})
+    if key is None:
+        return
+    from app.db import save_estimate_snapshot
+
+    try:
+        save_estimate_snapshot(result["code"], key, result)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("写入估值快照失败 %s: %s", result.get("code"), exc)
+
+
+def _estimate_with_fallback(
+    code: str,
+    holdings_provider: HoldingsProvider,
+    quote_provider: QuoteProvider,
+    quote_cache: Dict[str, Optional[float]],
+) -> dict:
+    frozen = _frozen_estimate(code)
+    if frozen is not None:
+        return frozen
+
+    try:
+        result = estimate_fund(code, holdings_provider, quote_provider)
+    except ProviderError as exc:
+        if HOLDINGS_PROVIDER == "auto" and "akshare" in str(exc).lower():
+            result = estimate_fund(code, load_holdings_provider("eastmoney"), quote_provider)
+        elif QUOTE_PROVIDER == "auto":
+            # mock 行情回退的结果不冻结
+            return estimate_fund(code, holdings_provider, load_quote_provider("mock", quote_cache))
+        else:
+            raise
+
+    _freeze_if_closed(result)
+    return result
+
+
 def estimate_codes(codes: List[str]) -> dict:
     quote_cache: Dict[str, Optional[float]] = {}
 
@@ -68,17 +155,7 @@ def estimate_codes(codes: List[str]) -> dict:
     failures = []
     for code in codes:
         try:
-            try:
-                results.append(estimate_fund(code, holdings_provider, quote_provider))
-            except ProviderError as exc:
-                if HOLDINGS_PROVIDER == "auto" and "akshare" in str(exc).lower():
-                    fallback_holdings = EastmoneyHoldingsProvider()
-                    results.append(estimate_fund(code, fallback_holdings, quote_provider))
-                elif QUOTE_PROVIDER == "auto":
-                    fallback_quote = MockQuoteProvider(quote_cache)
-                    results.append(estimate_fund(code, holdings_provider, fallback_quote))
-                else:
-                    raise
+            results.append(_estimate_with_fallback(code, holdings_provider, quote_provider, quote_cache))
         except Exception as exc:  # noqa: BLE001
             failures.append(f"{code}:{exc}")
 
@@ -89,16 +166,16 @@ def build_fund_detail(code: str) -> dict:
     quote_cache: Dict[str, Optional[float]] = {}
     holdings_provider = get_holdings_provider()
     quote_provider = get_quote_provider(quote_cache)
+    return _build_fund_detail(code, holdings_provider, quote_provider, quote_cache)
 
-    try:
-        estimated = estimate_fund(code, holdings_provider, quote_provider)
-    except ProviderError as exc:
-        if HOLDINGS_PROVIDER == "auto" and "akshare" in str(exc).lower():
-            estimated = estimate_fund(code, EastmoneyHoldingsProvider(), quote_provider)
-        elif QUOTE_PROVIDER == "auto":
-            estimated = estimate_fund(code, holdings_provider, MockQuoteProvider(quote_cache))
-        else:
-            raise
+
+def _build_fund_detail(
+    code: str,
+    holdings_provider: HoldingsProvider,
+    quote_provider: QuoteProvider,
+    quote_cache: Dict[str, Optional[float]],
+) -> dict:
+    estimated = _estimate_with_fallback(code, holdings_provider, quote_provider, quote_cache)
 
     periods = ["近1月", "近3月", "近6月", "近1年", "近3年"]
     stage_performance = []
@@ -118,24 +195,6 @@ def build_fund_detail(code: str) -> dict:
             }
         )
 
-    nav_history = []
-    today = dt.date.today()
-    base_nav = _stable(f"{code}-base-nav", 0.8, 2.5, 4)
-    accum = _stable(f"{code}-base-acc", 1.5, 6.0, 4)
-    for idx in range(30):
-        day = today - dt.timedelta(days=(29 - idx))
-        delta_pct = _stable(f"{code}-nav-{idx}", -1.5, 1.5, 4)
-        base_nav = round(max(0.2, base_nav * (1 + delta_pct / 100)), 4)
-        accum = round(accum + max(-0.02, base_nav * 0.01), 4)
-        nav_history.append(
-            {
-                "date": day.isoformat(),
-                "nav": base_nav,
-                "accum_nav": accum,
-                "change_percent": delta_pct,
-            }
-        )
-
     return {
         "code": estimated["code"],
         "name": estimated["name"],
@@ -145,5 +204,75 @@ def build_fund_detail(code: str) -> dict:
         "source": estimated["source"],
         "holdings": estimated["details"],
         "stage_performance": stage_performance,
-        "nav_history": nav_history,
+        "nav_history": recent_nav_history(code),
     }
+
+
+def _with_freshness(data: dict, as_of: float, stale: bool) -> dict:
+    return {**data, "as_of": int(as_of), "stale": stale}
+
+
+def _estimate_keeping_last_good(key: Tuple[str, ...]) -> dict:
+    """重算一组基金；失败的基金沿用缓存中上次的结果（不超过硬 TTL），
+    这些结果带 stale=true 与各自的 as_of，失败原因仍列在 failures 中。"""
+    data = estimate_codes(list(key))
+    previous = _ESTIMATE_CACHE.peek(key) if data["failures"] else None
+    if previous is None:
+        return data
+    previous_as_of, previous_data = previous
+    fresh = {r["code"]: r for r in data["results"]}
+    last_good = {r["code"]: r for r in previous_data["results"]}
+    results = []
+    for code in key:
+        if code in fresh:
+            results.append(fresh[code])
+            continue
+        old = last_good.get(code)
+        if old is None:
+            continue
+        as_of = old.get("as_of", int(previous_as_of))
+        if time.time() - as_of < RESPONSE_HARD_TTL:
+            results.append({**old, "stale": True, "as_of": as_of})
+    return {"results": results, "failures": data["failures"]}
+
+
+def cached_estimate_codes(codes: List[str]) -> dict:
+    """estimate_codes 的 stale-while-revalidate 版本，附带 as_of/stale。"""
+    key = tuple(codes)
+    data, as_of, stale = _ESTIMATE_CACHE.get(key, lambda: _estimate_keeping_last_good(key))
+    return _with_freshness(data, as_of, stale)
+
+
+def cached_fund_detail(code: str) -> dict:
+    data, as_of, stale = _DETAIL_CACHE.get(code, lambda: build_fund_detail(code))
+    return _with_freshness(data, as_of, stale)
+
+
+def iter_fund_details(codes: List[str]) -> Iterator[dict]:
+    """批量基金详情：逐只产出，未命中缓存的基金共用同一组 provider 与 quote_cache，
+    相同成分股的行情在整批内只取一次。失败的基金产出 {"code", "error"}。"""
+    quote_cache: Dict[str, Optional[float]] = {}
+    holdings_provider = get_holdings_provider()
+    quote_provider = get_quote_provider(quote_cache)
+
+    for code in dict.fromkeys(codes):
+        try:
+            data, as_of, stale = _DETAIL_CACHE.get(
+                code,
+                lambda code=code: _build_fund_detail(code, holdings_provider, quote_provider, quote_cache),
+            )
+        except Exception as exc:  # noqa: BLE001
+            yield {"code": code, "error": str(exc)}
+            continue
+        yield _with_freshness(data, as_of, stale)
+
+
+def build_fund_details(codes: List[str]) -> dict:
+    details = []
+    failures = []
+    for item in iter_fund_details(codes):
+        if "error" in item:
+            failures.append(f"{item['code']}:{item['error']}")
+        else:
+            details.append(item)
+    return {"details": details, "failures": failures}
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from app.config import (
+    MARKET_FETCH_TIMEOUT,
+    MARKET_GOLD_TTL,
+    MARKET_HARD_TTL,
+    MARKET_HUB_WORKERS,
+    MARKET_INDEX_TTL,
+    get_gold_adapters,
+    get_index_adapters,
+)
+from app.providers.base import GoldProvider, GoldQuote, IndexProvider, IndexQuote
+from app.services.response_cache import StaleWhileRevalidateCache
+
+# 整体拉取（适配器未提供 platforms()）时的平台占位
+ALL_PLATFORMS = "*"
+
+
+class MarketDataHub:
+    """指数与黄金的行情中心：每次请求并发拉取全部适配器 × 市场/平台，按来源分别缓存。
+
+    - 每个来源 (适配器, 市场/平台) 一份 stale-while-revalidate 缓存，TTL 按指数/黄金区分
+    - 同一来源同一时刻最多一个拉取在进行；超过 timeout 未返回的来源标记为 timeout，
+      拉取继续在后台完成并写入缓存，下一次请求即可命中
+    - 返回全部已到达的数据与逐来源状态，任一来源非 ok/stale 时 partial=true
+    """
+
+    def __init__(
+        self,
+        index_adapters: Dict[str, IndexProvider],
+        gold_adapters: Dict[str, GoldProvider],
+        *,
+        index_ttl: float = MARKET_INDEX_TTL,
+        gold_ttl: float = MARKET_GOLD_TTL,
+        hard_ttl: float = MARKET_HARD_TTL,
+        timeout: float = MARKET_FETCH_TIMEOUT,
+        max_workers: int = MARKET_HUB_WORKERS,
+    ) -> None:
+        self.index_adapters = index_adapters
+        self.gold_adapters = gold_adapters
+        self.timeout = timeout
+        self._index_cache = StaleWhileRevalidateCache(index_ttl, hard_ttl)
+        self._gold_cache = StaleWhileRevalidateCache(gold_ttl, hard_ttl)
+        self._pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="market-hub")
+        self._lock = threading.Lock()
+        self._pending: Dict[Hashable, Tuple[Future, float]] = {}
+
+    def _submit(self, key: Hashable, fetch: Callable[[], Tuple[list, float, bool]]) -> Tuple[Future, float]:
+        """返回 (future, 本次请求对它还能等待的秒数)。
+
+        慢来源仍在拉取时复用同一个 future，避免卡住的上游占满线程池；已经超时过的拉取不再等待。
+        """
+        now = time.monotonic()
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is None or pending[0].done():
+                pending = self._pending[key] = (self._pool.submit(fetch), now)
+        future, started_at = pending
+        return future, max(0.0, started_at + self.timeout - now)
+
+    def _fan_out(
+        self, tasks: List[Tuple[str, str, Hashable, Callable[[], Tuple[list, float, bool]]]]
+    ) -> Tuple[List[list], List[dict]]:
+        submitted = [self._submit(key, fetch) for _, _, key, fetch in tasks]
+        futures = [future for future, _ in submitted]
+        waitable = [future for future, budget in submitted if budget > 0]
+        if waitable:
+            wait(waitable, timeout=max(budget for _, budget in submitted))
+
+        results: List[list] = []
+        sources: List[dict] = []
+        for (adapter, unit, _, _), future in zip(tasks, futures):
+            source: dict = {"adapter": adapter, "source": unit}
+            rows: list = []
+            if not future.done():
+                source.update(status="timeout", error=f"超过 {self.timeout:g} 秒未返回")
+            else:
+                try:
+                    rows, as_of, stale = future.result()
+                except Exception as exc:  # noqa: BLE001
+                    source.update(status="error", error=str(exc))
+                else:
+                    source.update(status="stale" if stale else "ok", as_of=int(as_of), count=len(rows))
+            results.append(rows)
+            sources.append(source)
+        return results, sources
+
+    def index_markets(self) -> List[str]:
+        """全部指数适配器支持的市场，按配置顺序去重。"""
+        return list(dict.fromkeys(m for adapter in self.index_adapters.values() for m in adapter.markets()))
+
+    def get_indexes(self, markets: List[str]) -> dict:
+        tasks = []
+        for market in markets:
+            for name, adapter in self.index_adapters.items():
+                if market not in adapter.markets():
+                    # 不支持的市场不拉取、不占用缓存与 pending 槽位
+                    continue
+                key = (name, market)
+                fetch = lambda adapter=adapter, market=market, key=key: self._index_cache.get(  # noqa: E731
+                    key, lambda: adapter.get_indexes(market)
+                )
+                tasks.append((name, market, key, fetch))
+        results, sources = self._fan_out(tasks)
+
+        # 同一市场同一指数以配置靠前的适配器为准
+        seen = set()
+        quotes: List[IndexQuote] = []
+        for rows in results:
+            for quote in rows:
+                if (quote.market, quote.code) not in seen:
+                    seen.add((quote.market, quote.code))
+                    quotes.append(quote)
+        return {"quotes": quotes, "sources": sources, "partial": _is_partial(sources)}
+
+    def get_gold_quotes(self, platforms: Optional[List[str]] = None) -> dict:
+        tasks = []
+        for name, adapter in self.gold_adapters.items():
+            units = adapter.platforms() or [ALL_PLATFORMS]
+            for platform in units:
+                if platforms and platform != ALL_PLATFORMS and platform not in platforms:
+                    continue
+                key = (name, platform)
+                if platform == ALL_PLATFORMS:
+                    compute = adapter.get_gold_quotes
+                else:
+                    compute = lambda adapter=adapter, platform=platform: adapter.get_platform_quotes(platform)  # noqa: E731
+                fetch = lambda key=key, compute=compute: self._gold_cache.get(key, compute)  # noqa: E731
+                tasks.append((name, platform, key, fetch))
+        results, sources = self._fan_out(tasks)
+
+        seen = set()
+        quotes: List[GoldQuote] = []
+        for rows in results:
+            for quote in rows:
+                if quote.platform not in seen and (not platforms or quote.platform in platforms):
+                    seen.add(quote.platform)
+                    quotes.append(quote)
+        return {"quotes": quotes, "sources": sources, "partial": _is_partial(sources)}
+
+
+def _is_partial(sources: List[dict]) -> bool:
+    return any(source["status"] not in {"ok", "stale"} for source in sources)
+
+
+def parse_markets(raw: str, supported: Iterable[str]) -> List[str]:
+    """"cn,hk" -> ["cn", "hk"]，去重保序，空串视为 cn；不在 supported 中的市场直接丢弃。"""
+    allowed = set(supported)
+    requested = list(dict.fromkeys(m.strip().lower() for m in (raw or "").split(",") if m.strip())) or ["cn"]
+    return [m for m in requested if m in allowed]
+
+
+_HUB: Optional[MarketDataHub] = None
+_HUB_LOCK = threading.Lock()
+
+
+def get_market_hub() -> MarketDataHub:
+    global _HUB
+    if _HUB is None:
+        with _HUB_LOCK:
+            if _HUB is None:
+                _HUB = MarketDataHub(get_index_adapters(), get_gold_adapters())
+    return _HUB
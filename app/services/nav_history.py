@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import datetime as dt
+import logging
+from typing import Dict, List, Optional, Sequence
+
+from app.config import HOLDINGS_PROVIDER, NAV_DEFAULT_POINTS, NAV_MAX_POINTS
+from app.db import NavRow, query_nav_history
+
+logger = logging.getLogger(__name__)
+
+# 详情弹窗默认展示近一年，降采样到 120 个点
+DETAIL_NAV_DAYS = 365
+DETAIL_NAV_POINTS = 120
+
+
+def lttb(rows: Sequence[NavRow], threshold: int) -> List[NavRow]:
+    """Largest-Triangle-Three-Buckets 降采样：保留首尾点，每个桶选与相邻桶构成面积最大的点，
+    折线的峰谷形态基本不变。横轴用序号（交易日等距）。"""
+    n = len(rows)
+    if threshold >= n:
+        return list(rows)
+    if threshold < 3:
+        return [rows[0], rows[-1]]
+
+    sampled = [rows[0]]
+    bucket = (n - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * bucket) + 1
+        end = int((i + 1) * bucket) + 1
+        next_start = end
+        next_end = min(int((i + 2) * bucket) + 1, n)
+        if next_start >= next_end:
+            avg_x, avg_y = float(n - 1), rows[-1][1]
+        else:
+            avg_x = (next_start + next_end - 1) / 2
+            avg_y = sum(rows[j][1] for j in range(next_start, next_end)) / (next_end - next_start)
+
+        ax, ay = a, rows[a][1]
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            area = abs((ax - avg_x) * (rows[j][1] - ay) - (ax - j) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        sampled.append(rows[best])
+        a = best
+    sampled.append(rows[-1])
+    return sampled
+
+
+def _synthetic_nav_rows(code: str, start: dt.date, end: dt.date) -> List[NavRow]:
+    """mock 模式下按代码生成稳定的工作日净值序列。"""
+    from app.services.estimate import _stable
+
+    rows: List[NavRow] = []
+    base_nav = _stable(f"{code}-base-nav", 0.8, 2.5, 4)
+    accum = _stable(f"{code}-base-acc", 1.5, 6.0, 4)
+    day = start
+    while day <= end:
+        if day.weekday() < 5:
+            delta_pct = _stable(f"{code}-nav-{day.isoformat()}", -1.5, 1.5, 4)
+            base_nav = round(max(0.2, base_nav * (1 + delta_pct / 100)), 4)
+            accum = round(accum + max(-0.02, base_nav * 0.01), 4)
+            rows.append((day.isoformat(), base_nav, accum, delta_pct))
+        day += dt.timedelta(days=1)
+    return rows
+
+
+def _parse_day(raw: str, name: str) -> Optional[dt.date]:
+    if not raw:
+        return None
+    try:
+        return dt.date.fromisoformat(raw)
+    except ValueError as exc:
+        raise ValueError(f"{name} 需为 YYYY-MM-DD") from exc
+
+
+def _load_rows(code: str, start: Optional[dt.date], end: Optional[dt.date]) -> List[NavRow]:
+    if HOLDINGS_PROVIDER == "mock":
+        # 固定生成近三年再截取，不同区间看到的是同一条曲线
+        today = dt.date.today()
+        rows = _synthetic_nav_rows(code, today - dt.timedelta(days=3 * 365), today)
+        return [r for r in rows if (start is None or r[0] >= start.isoformat()) and (end is None or r[0] <= end.isoformat())]
+
+    from app.providers.eastmoney import sync_fund_data
+
+    try:
+        # 数据未过期时不访问上游；详情已经下载过的基金这里直接读库
+        sync_fund_data(code)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("刷新净值失败，使用库中已有数据 %s: %s", code, exc)
+    return query_nav_history(code, start.isoformat() if start else "", end.isoformat() if end else "")
+
+
+def get_nav_history(code: str, start: str = "", end: str = "", points: int = 0) -> Dict[str, object]:
+    """区间净值查询；原始点数超过 points 时降采样。日期格式非法抛 ValueError。"""
+    start_day = _parse_day(start, "start")
+    end_day = _parse_day(end, "end")
+    limit = NAV_DEFAULT_POINTS if points <= 0 else min(max(points, 2), NAV_MAX_POINTS)
+
+    rows = _load_rows(code, start_day, end_day)
+    sampled = lttb(rows, limit)
+    return {
+        "code": code,
+        "start": rows[0][0] if rows else start,
+        "end": rows[-1][0] if rows else end,
+        "total": len(rows),
+        "nav_history": [
+            {"date": d, "nav": nav, "accum_nav": accum_nav, "change_percent": change}
+            for d, nav, accum_nav, change in sampled
+        ],
+    }
+
+
+def recent_nav_history(code: str) -> List[Dict[str, object]]:
+    start = (dt.date.today() - dt.timedelta(days=DETAIL_NAV_DAYS)).isoformat()
+    return get_nav_history(code, start=start, points=DETAIL_NAV_POINTS)["nav_history"]
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+
+from app.providers.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+class StaleWhileRevalidateCache:
+    """响应级缓存：软 TTL 内直接返回；软/硬 TTL 之间先返回旧值并在后台刷新；
+    超过硬 TTL 才同步重算。后台刷新失败时保留旧值，直到硬 TTL 为止。
+
+    `is_good` 用于判定一次计算结果是否值得覆盖已有的旧值（例如全部失败的估值）。
+    """
+
+    def __init__(
+        self,
+        soft_ttl: float,
+        hard_ttl: float,
+        *,
+        max_entries: int = 256,
+        is_good: Optional[Callable[[Any], bool]] = None,
+    ) -> None:
+        self.soft_ttl = soft_ttl
+        self.hard_ttl = max(hard_ttl, soft_ttl)
+        self.max_entries = max_entries
+        self.is_good = is_good or (lambda _value: True)
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._refreshing: Set[Hashable] = set()
+        self._flight = SingleFlight()
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Tuple[Any, float, bool]:
+        """返回 (value, as_of, stale)。"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is not None:
+            as_of, value = entry
+            age = now - as_of
+            if age < self.soft_ttl:
+                return value, as_of, False
+            if age < self.hard_ttl:
+                self._refresh_in_background(key, compute)
+                return value, as_of, True
+
+        value, as_of = self._flight.do(key, lambda: self._compute(key, compute))
+        return value, as_of, False
+
+    def peek(self, key: Hashable) -> Optional[Tuple[float, Any]]:
+        """当前缓存的 (as_of, value)，不论是否过期，不触发刷新。"""
+        with self._lock:
+            return self._entries.get(key)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "refreshing": len(self._refreshing)}
+
+    def _compute(self, key: Hashable, compute: Callable[[], Any]) -> Tuple[Any, float]:
+        value = compute()
+        as_of = time.time()
+        if self.is_good(value):
+            self._store(key, as_of, value)
+        return value, as_of
+
+    def _store(self, key: Hashable, as_of: float, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (as_of, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _refresh_in_background(self, key: Hashable, compute: Callable[[], Any]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def _run() -> None:
+            try:
+                self._flight.do(key, lambda: self._compute(key, compute))
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("后台刷新失败，继续提供旧数据 key=%s: %s", key, exc)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=_run, name="swr-refresh", daemon=True).start()
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import csv
+import heapq
+import logging
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+from app.config import (
+    DEFAULT_FUND_CODES,
+    QUOTE_PROVIDER,
+    RESPONSE_HARD_TTL,
+    RESPONSE_SOFT_TTL,
+    UNIVERSE_HOLDINGS_FILE,
+    UNIVERSE_TTL,
+    get_holdings_provider,
+    get_quote_provider,
+    load_quote_provider,
+)
+from app.services.response_cache import StaleWhileRevalidateCache
+
+logger = logging.getLogger(__name__)
+
+TOP_FIELDS = ("estimated_pct", "matched_weight")
+MAX_TOP_N = 500
+
+
+class HoldingsUniverse:
+    """全市场持仓的 CSR 存储：第 i 只基金的持仓为 [offsets[i], offsets[i+1]) 区间，
+    symbol 驻留为 int32 id，权重为 float32（%）。每条持仓 8 字节，每只基金 8 字节偏移。
+    """
+
+    def __init__(self) -> None:
+        self.codes: List[str] = []
+        self.names: List[str] = []
+        self.symbols: List[str] = []
+        self._symbol_ids: Dict[str, int] = {}
+        self.offsets = array("q", [0])
+        self.symbol_idx = array("i")
+        self.weights = array("f")
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def add_fund(self, code: str, name: str, holdings: Iterable[Tuple[str, float]]) -> None:
+        ids = self._symbol_ids
+        for symbol, weight in holdings:
+            sid = ids.get(symbol)
+            if sid is None:
+                sid = ids[symbol] = len(self.symbols)
+                self.symbols.append(symbol)
+            self.symbol_idx.append(sid)
+            self.weights.append(weight)
+        self.codes.append(code)
+        self.names.append(name)
+        self.offsets.append(len(self.weights))
+
+    def nbytes(self) -> Dict[str, int]:
+        arrays = sum(a.itemsize * len(a) for a in (self.offsets, self.symbol_idx, self.weights))
+        return {
+            "funds": len(self.codes),
+            "symbols": len(self.symbols),
+            "entries": len(self.weights),
+            "array_bytes": arrays,
+        }
+
+    def compute(self, pcts: Dict[str, Optional[float]]) -> Tuple[List[float], List[float]]:
+        """按一份行情快照重算全部基金，返回 (estimated_pct, matched_weight)，与 estimate_fund 口径一致。"""
+        pct_by_id = [pcts.get(symbol) for symbol in self.symbols]
+        try:
+            import numpy as np
+        except ImportError:
+            return self._compute_python(pct_by_id)
+
+        pct = np.array(pct_by_id, dtype=np.float64) if pct_by_id else np.zeros(0)
+        idx = np.frombuffer(self.symbol_idx, dtype=np.int32)
+        weights = np.frombuffer(self.weights, dtype=np.float32).astype(np.float64)
+        offsets = np.frombuffer(self.offsets, dtype=np.int64)
+
+        entry_pct = pct[idx]
+        hit = ~np.isnan(entry_pct)
+        # 前缀和相减求每段之和，持仓为空的基金自然为 0
+        contrib = np.concatenate(([0.0], np.cumsum(np.where(hit, weights * entry_pct / 100.0, 0.0))))
+        matched = np.concatenate(([0.0], np.cumsum(np.where(hit, weights, 0.0))))
+        estimated = contrib[offsets[1:]] - contrib[offsets[:-1]]
+        matched_weight = matched[offsets[1:]] - matched[offsets[:-1]]
+        return estimated.tolist(), matched_weight.tolist()
+
+    def _compute_python(self, pct_by_id: List[Optional[float]]) -> Tuple[List[float], List[float]]:
+        estimated: List[float] = []
+        matched_weight: List[float] = []
+        idx, weights, offsets = self.symbol_idx, self.weights, self.offsets
+        for f in range(len(self.codes)):
+            total = matched = 0.0
+            for k in range(offsets[f], offsets[f + 1]):
+                p = pct_by_id[idx[k]]
+                if p is not None:
+                    total += weights[k] * p / 100.0
+                    matched += weights[k]
+            estimated.append(total)
+            matched_weight.append(matched)
+        return estimated, matched_weight
+
+
+def load_universe_csv(path: Path) -> HoldingsUniverse:
+    """CSV 列 fund_code,fund_name,symbol,weight；同一基金的行需连续。"""
+    universe = HoldingsUniverse()
+    with path.open("r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        if not {"fund_code", "symbol", "weight"}.issubset(reader.fieldnames or []):
+            raise ValueError("全市场持仓 CSV 必须包含列：fund_code,symbol,weight")
+        code = name = ""
+        rows: List[Tuple[str, float]] = []
+        for row in reader:
+            row_code = row["fund_code"].strip()
+            if row_code != code:
+                if code:
+                    universe.add_fund(code, name, rows)
+                code, name, rows = row_code, (row.get("fund_name") or "").strip() or row_code, []
+            rows.append((row["symbol"].strip(), float(row["weight"] or 0)))
+        if code:
+            universe.add_fund(code, name, rows)
+    return universe
+
+
+def build_universe_from_provider(codes: List[str]) -> HoldingsUniverse:
+    universe = HoldingsUniverse()
+    provider = get_holdings_provider()
+    for code in dict.fromkeys(codes):
+        try:
+            holdings, _, _ = provider.get_latest_holdings(code)
+            name = provider.get_fund_name(code)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("全市场持仓构建跳过 %s: %s", code, exc)
+            continue
+        universe.add_fund(code, name, ((h.symbol, h.weight) for h in holdings))
+    return universe
+
+
+_UNIVERSE: Optional[HoldingsUniverse] = None
+# (构建时的数据源版本, 构建时间)
+_UNIVERSE_STAMP: Tuple[Hashable, float] = (None, 0.0)
+_UNIVERSE_LOCK = threading.Lock()
+
+
+def _source_version() -> Hashable:
+    """CSV 用文件修改时间，在线构建用持仓变更版本号；变化即需要重建。"""
+    if UNIVERSE_HOLDINGS_FILE:
+        try:
+            return Path(UNIVERSE_HOLDINGS_FILE).stat().st_mtime_ns
+        except OSError:
+            return None
+    from app.db import position_version
+
+    return position_version()
+
+
+def _build_universe() -> HoldingsUniverse:
+    if UNIVERSE_HOLDINGS_FILE:
+        return load_universe_csv(Path(UNIVERSE_HOLDINGS_FILE))
+    from app.db import active_position_codes
+
+    return build_universe_from_provider(DEFAULT_FUND_CODES + active_position_codes())
+
+
+def _is_fresh(version: Hashable) -> bool:
+    built_version, built_at = _UNIVERSE_STAMP
+    return _UNIVERSE is not None and built_version == version and time.time() - built_at < UNIVERSE_TTL
+
+
+def get_universe() -> HoldingsUniverse:
+    global _UNIVERSE, _UNIVERSE_STAMP
+    version = _source_version()
+    if _is_fresh(version):
+        return _UNIVERSE
+    with _UNIVERSE_LOCK:
+        if not _is_fresh(version):
+            # 构建期间的新变更会让版本号继续增大，下次请求再重建
+            _UNIVERSE = _build_universe()
+            _UNIVERSE_STAMP = (version, time.time())
+        return _UNIVERSE
+
+
+def snapshot_pct_changes(symbols: List[str]) -> Dict[str, Optional[float]]:
+    """全部成分股的一份行情快照；eastmoney 走批量接口，auto 失败时回退 mock。"""
+    if QUOTE_PROVIDER in {"eastmoney", "auto"}:
+        from app.providers.eastmoney import fetch_pct_changes
+
+        try:
+            return fetch_pct_changes(symbols)
+        except Exception as exc:  # noqa: BLE001
+            if QUOTE_PROVIDER != "auto":
+                raise
+            logger.warning("批量行情失败，回退 mock: %s", exc)
+            provider = load_quote_provider("mock", {})
+    else:
+        provider = get_quote_provider({})
+    return provider.get_pct_changes(symbols)
+
+
+# 一次重算的结果：(estimated_pct, matched_weight)；软 TTL 内复用，之后后台按新快照重算；只保留当前全集的一份
+_RECOMPUTE_CACHE = StaleWhileRevalidateCache(RESPONSE_SOFT_TTL, RESPONSE_HARD_TTL, max_entries=1)
+
+
+def _recompute(universe: HoldingsUniverse) -> Dict[str, List[float]]:
+    estimated, matched_weight = universe.compute(snapshot_pct_changes(universe.symbols))
+    return {"estimated_pct": estimated, "matched_weight": matched_weight}
+
+
+def top_funds(by: str = "estimated_pct", n: int = 20, ascending: bool = False) -> dict:
+    """按 by 排序取前 n 只基金（堆选择，O(F log n)）。by 不支持时抛 ValueError。"""
+    if by not in TOP_FIELDS:
+        raise ValueError(f"by 仅支持 {','.join(TOP_FIELDS)}")
+    n = max(1, min(int(n), MAX_TOP_N))
+    universe = get_universe()
+    # 以持仓全集对象为 key：重建后结果按新全集重算，下标始终与 universe 对齐
+    columns, as_of, stale = _RECOMPUTE_CACHE.get(universe, lambda: _recompute(universe))
+
+    values = columns[by]
+    pick = heapq.nsmallest if ascending else heapq.nlargest
+    funds = [
+        {
+            "rank": rank,
+            "code": universe.codes[i],
+            "name": universe.names[i],
+            "estimated_pct": round(columns["estimated_pct"][i], 4),
+            "matched_weight": round(columns["matched_weight"][i], 4),
+        }
+        for rank, i in enumerate(pick(n, range(len(values)), key=values.__getitem__), start=1)
+    ]
+    return {"by": by, "n": n, "funds": funds, "universe": universe.nbytes(), "as_of": int(as_of), "stale": stale}
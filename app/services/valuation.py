@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Optional
+
+from app.db import active_position_codes, backfill_position_names, position_valuation
+from app.services.estimate import cached_estimate_codes
+
+# 合并进每条持仓的估值字段；details 体积最大，可按需省略
+_ESTIMATE_FIELDS = ("report_period", "source", "matched_weight", "missing_symbols")
+
+
+def value_portfolio(
+    estimate: Callable[[List[str]], dict] = cached_estimate_codes,
+    include_details: bool = True,
+) -> dict:
+    """读取活跃持仓，只估算这些基金，并返回逐条预估盈亏与组合合计。
+
+    名称补全在同一轮内批量完成，不再逐只回查持仓表。
+    """
+    codes = active_position_codes()
+    data = estimate(codes) if codes else {"results": [], "failures": []}
+    results: Dict[str, dict] = {r["code"]: r for r in data.get("results", [])}
+
+    backfill_position_names({code: r.get("name", "") for code, r in results.items()})
+    pcts: Dict[str, Optional[float]] = {code: r.get("estimated_pct") for code, r in results.items()}
+    valuation = position_valuation(pcts)
+
+    for position in valuation["positions"]:
+        r = results.get(position["code"])
+        if r is None:
+            continue
+        position["name"] = position["name"] or r.get("name")
+        for field in _ESTIMATE_FIELDS:
+            position[field] = r.get(field)
+        if include_details:
+            position["details"] = r.get("details", [])
+
+    valuation["failures"] = data.get("failures", [])
+    for key in ("as_of", "stale"):
+        if key in data:
+            valuation[key] = data[key]
+    return valuation
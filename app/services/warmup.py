@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from app.config import DEFAULT_FUND_CODES, QUOTE_PROVIDER, WARMUP_CONCURRENCY, get_holdings_provider
+
+logger = logging.getLogger(__name__)
+
+
+class CacheWarmup:
+    """启动预热：持仓与名称 → 成分股 secid，依次写入各级缓存。
+
+    不预热行情：涨跌幅只缓存 QUOTE_CACHE_TTL 秒，预热结果通常在第一个估值请求前就已过期，
+    估值时整只基金的成分股本来就是一次批量请求。
+
+    在后台线程中运行，服务启动后立即可接受请求；status() 给出 /api/health 的 warmup 字段。
+    state: idle → running（stage 为当前阶段）→ ready；任何阶段的单项失败只计数，不中断预热。
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._status: Dict[str, object] = {"state": "idle", "ready": False}
+        self._began = 0.0
+
+    def _update(self, **fields: object) -> None:
+        with self._lock:
+            self._status.update(fields)
+
+    def status(self) -> Dict[str, object]:
+        with self._lock:
+            status = dict(self._status)
+        if status.get("state") == "running":
+            status["elapsed_ms"] = int((time.monotonic() - self._began) * 1000)
+        return status
+
+    def start(self, concurrency: int = WARMUP_CONCURRENCY) -> bool:
+        """已在运行时返回 False。基金代码在后台线程里收集，不占用启动路径。"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return False
+            self._status = {"state": "running", "ready": False, "stage": "codes", "started_at": int(time.time())}
+            self._began = time.monotonic()
+            self._thread = threading.Thread(target=self._run, args=(max(1, concurrency),), name="cache-warmup", daemon=True)
+            self._thread.start()
+            return True
+
+    def _run(self, concurrency: int) -> None:
+        try:
+            codes = _warmup_codes()
+            self._update(stage="holdings", funds=len(codes))
+            symbols = self._warm_holdings(codes, concurrency)
+            self._update(stage="secids", symbols=len(symbols))
+            self._warm_secids(symbols)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("启动预热中断: %s", exc)
+            self._update(error=str(exc))
+        # 预热只是加速，失败时也标记为 ready：请求照常回源
+        self._update(
+            state="ready",
+            ready=True,
+            stage=None,
+            finished_at=int(time.time()),
+            elapsed_ms=int((time.monotonic() - self._began) * 1000),
+        )
+
+    def _warm_holdings(self, codes: List[str], concurrency: int) -> List[str]:
+        provider = get_holdings_provider()
+        symbols: Dict[str, None] = {}
+        failed = 0
+
+        def _fetch(code: str) -> List[str]:
+            provider.get_fund_name(code)
+            holdings, _, _ = provider.get_latest_holdings(code)
+            return [h.symbol for h in holdings]
+
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="warmup") as pool:
+            futures = [(code, pool.submit(_fetch, code)) for code in codes]
+            for done, (code, future) in enumerate(futures, start=1):
+                try:
+                    symbols.update(dict.fromkeys(future.result()))
+                except Exception as exc:  # noqa: BLE001
+                    failed += 1
+                    logger.warning("预热持仓失败 %s: %s", code, exc)
+                self._update(funds_done=done, funds_failed=failed)
+        return list(symbols)
+
+    def _warm_secids(self, symbols: List[str]) -> None:
+        if QUOTE_PROVIDER not in {"eastmoney", "auto"} or not symbols:
+            return
+        from app.providers.eastmoney import resolve_secids
+
+        self._update(secids=len(resolve_secids(symbols)))
+
+
+def _warmup_codes() -> List[str]:
+    from app.db import active_position_codes
+
+    try:
+        active = active_position_codes()
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("预热读取持仓失败，仅预热默认代码: %s", exc)
+        active = []
+    return list(dict.fromkeys(active + DEFAULT_FUND_CODES))
+
+
+WARMUP = CacheWarmup()
+
+
+def start_cache_warmup() -> bool:
+    return WARMUP.start()
+
+
+def warmup_status() -> Dict[str, object]:
+    return WARMUP.status()
@@ -9,6 +9,7 @@ let isMarketRefreshing = false;
 let previousIndexMap = {};
 let previousGoldMap = {};
 let marketLoadedOnce = false;
+let fundDetailCache = {};
 
 function asNumber(v) {
   const n = Number(v);
@@ -141,6 +142,7 @@ async function bootstrap() {
   await loadHealthStatus();
   await loadPortfolio();
   renderAssetsSummary();
+  initFundSearch();
 
   const initialView = normalizeViewFromHash(location.hash);
   switchView(initialView || 'holdings', { updateHash: true });
@@ -197,9 +199,10 @@ async function loadDefaultCodes() {
   }
 }
 
-async function fetchPortfolio(activeOnly = 1) {
+async function fetchPortfolio(activeOnly = 1, fields = '') {
   try {
-    const resp = await fetch(`/api/portfolio?active_only=${activeOnly}`);
+    const fieldsQuery = fields ? `&fields=${encodeURIComponent(fields)}` : '';
+    const resp = await fetch(`/api/portfolio?active_only=${activeOnly}${fieldsQuery}`);
     return await resp.json();
   } catch (_) {
     return { positions: [], updated_at: 0 };
@@ -213,7 +216,7 @@ function initPortfolio(codes) {
 
 function positionRowHtml(p) {
   const isActive = asNumber(p.is_active || 1) === 1;
-  return `<td><input class='code' value='${p.code || ''}'/></td>
+  return `<td><input class='code' list='fundSearchList' autocomplete='off' value='${p.code || ''}'/></td>
     <td><input class='name' value='${p.name || ''}'/></td>
     <td><input type='number' class='share t-right' step='0.01' value='${asNumber(p.share)}'/></td>
     <td><input type='number' class='cost t-right' step='0.0001' value='${asNumber(p.cost)}'/></td>
@@ -225,6 +228,49 @@ function positionRowHtml(p) {
     </td>`;
 }
 
+// ---- 基金代码输入联想：/api/funds/search（代码/名称/拼音缩写前缀），选中后补全空的名称 ----
+
+const FUND_SEARCH_DELAY = 150;
+let fundSearchTimer = 0;
+let fundSearchSeq = 0;
+let fundSearchNames = {};
+
+async function searchFunds(q) {
+  const seq = ++fundSearchSeq;
+  try {
+    const resp = await fetch(`/api/funds/search?q=${encodeURIComponent(q)}&limit=10`);
+    const data = await resp.json();
+    if (seq !== fundSearchSeq) return;
+    const list = document.getElementById('fundSearchList');
+    list.innerHTML = '';
+    (data.results || []).forEach(item => {
+      fundSearchNames[item.code] = item.name;
+      const option = document.createElement('option');
+      option.value = item.code;
+      option.label = `${item.name} ${item.abbr}`;
+      list.appendChild(option);
+    });
+  } catch (_) {
+    // 联想失败不影响手工输入
+  }
+}
+
+function initFundSearch() {
+  const tbody = document.querySelector('#portfolio tbody');
+  tbody.addEventListener('input', e => {
+    if (!e.target.classList.contains('code')) return;
+    const q = e.target.value.trim();
+    clearTimeout(fundSearchTimer);
+    if (q) fundSearchTimer = setTimeout(() => searchFunds(q), FUND_SEARCH_DELAY);
+  });
+  tbody.addEventListener('change', e => {
+    if (!e.target.classList.contains('code')) return;
+    const nameInput = e.target.closest('tr').querySelector('.name');
+    const name = fundSearchNames[e.target.value.trim()];
+    if (name && !nameInput.value.trim()) nameInput.value = name;
+  });
+}
+
 function addPositionRow() {
   const tb = document.querySelector('#portfolio tbody');
   const tr = document.createElement('tr');
@@ -311,6 +357,31 @@ async function savePortfolio() {
   await refreshPortfolioUI(data.ok ? `保存完成：${data.count} 条` : '保存失败');
 }
 
+// 文件直接作为请求体上传，服务端边读边写库；格式按扩展名判断
+async function importPositionsFile(input) {
+  const file = input.files && input.files[0];
+  input.value = '';
+  if (!file) return;
+  const format = /\.(ndjson|jsonl)$/i.test(file.name) ? 'ndjson' : 'csv';
+  try {
+    const resp = await fetch(`/api/portfolio/positions/import?format=${format}`, { method: 'POST', body: file });
+    const data = await resp.json();
+    if (!data.ok) {
+      showToast(`导入失败：${data.error || resp.status}`);
+      return;
+    }
+    const firstError = (data.errors || [])[0];
+    const detail = firstError ? `，首个错误：第 ${firstError.line ?? '?'} 行 ${firstError.error}` : '';
+    await refreshPortfolioUI(`文件导入完成：成功 ${data.imported} 条，失败 ${data.failed} 条${detail}`);
+  } catch (_) {
+    showToast('导入失败，请稍后重试');
+  }
+}
+
+function exportPositions() {
+  window.location.href = '/api/portfolio/positions/export?format=csv';
+}
+
 async function toggleArchiveRow(btn) {
   const tr = btn.closest('tr');
   const code = tr?.querySelector('.code')?.value?.trim() || '';
@@ -427,6 +498,15 @@ function closePlaceholderModal(event) {
   document.getElementById('placeholderModalMask').style.display = 'none';
 }
 
+// 行情中心返回 partial 时，列出超时或失败的来源
+function describeMissingSources(data) {
+  if (!data || !data.partial) return '';
+  return (data.sources || [])
+    .filter(s => s.status !== 'ok' && s.status !== 'stale')
+    .map(s => `${s.source}(${s.status === 'timeout' ? '超时' : '失败'})`)
+    .join('、');
+}
+
 async function loadIndexes(market) {
   const container = document.getElementById('indexCards');
   container.innerHTML = '<div class="muted">加载中...</div>';
@@ -451,6 +531,13 @@ async function loadIndexes(market) {
       nextMap[q.code] = { current: q.current, change_percent: q.change_percent, change_value: q.change_value };
     });
     previousIndexMap = nextMap;
+    const missing = describeMissingSources(data);
+    if (missing) {
+      const note = document.createElement('div');
+      note.className = 'muted';
+      note.textContent = `部分来源暂未返回：${missing}`;
+      container.appendChild(note);
+    }
   } catch (_) {
     container.innerHTML = '<div class="muted">指数加载失败</div>';
     showToast('指数加载失败，请稍后重试');
@@ -480,25 +567,244 @@ async function loadGoldQuotes() {
       nextMap[q.platform] = { price: q.price, change: q.change, change_percent: q.change_percent };
     });
     previousGoldMap = nextMap;
+    const missing = describeMissingSources(data);
+    if (missing) {
+      const tr = document.createElement('tr');
+      tr.innerHTML = `<td colspan="4" class="muted">部分平台暂未返回：${missing}</td>`;
+      container.appendChild(tr);
+    }
   } catch (_) {
     container.innerHTML = '<tr><td colspan="4" class="muted">黄金报价加载失败</td></tr>';
     showToast('黄金报价加载失败，请稍后重试');
   }
 }
 
-async function runEstimate() {
-  const portfolioResp = await fetchPortfolio(1);
-  const codes = (portfolioResp.positions || []).map(p => p.code).filter(Boolean);
-  const portfolioMap = {};
-  portfolioResp.positions.forEach(p => { portfolioMap[p.code] = p; });
+// ---- 估值表格：按 key 做行级 diff，只改动值变化的单元格 ----
+
+function setCell(td, value, cls = '', prevValue, nextValue) {
+  const text = value == null ? '' : String(value);
+  if (td.textContent === text && td.dataset.cls === cls) return;
+  td.textContent = text;
+  td.dataset.cls = cls;
+  const flash = getFlashClass(prevValue, nextValue);
+  td.className = cls;
+  if (flash) {
+    // 强制回流以便同一单元格连续变化时重新播放动画
+    void td.offsetWidth;
+    td.classList.add(flash);
+  }
+}
+
+function diffRows(tbody, items, keyOf, rowMap, createRow, updateRow) {
+  const nextKeys = new Set(items.map(keyOf));
+  rowMap.forEach((row, key) => {
+    if (!nextKeys.has(key)) {
+      row.tr.remove();
+      rowMap.delete(key);
+    }
+  });
+  let cursor = tbody.firstChild;
+  items.forEach(item => {
+    const key = keyOf(item);
+    let row = rowMap.get(key);
+    if (!row) {
+      row = createRow(item);
+      rowMap.set(key, row);
+    }
+    updateRow(row, item);
+    if (row.tr !== cursor) tbody.insertBefore(row.tr, cursor);
+    else cursor = cursor.nextSibling;
+  });
+}
+
+function createCells(tr, count) {
+  const cells = [];
+  for (let i = 0; i < count; i += 1) {
+    const td = document.createElement('td');
+    tr.appendChild(td);
+    cells.push(td);
+  }
+  return cells;
+}
+
+const summaryRowMap = new Map();
+
+function ensureTable(container, headers) {
+  let tbody = container.querySelector('tbody');
+  if (tbody) return tbody;
+  const table = document.createElement('table');
+  table.innerHTML = `<thead><tr>${headers.map(([text, cls]) => `<th class="${cls}">${text}</th>`).join('')}</tr></thead>`;
+  tbody = document.createElement('tbody');
+  table.appendChild(tbody);
+  container.innerHTML = '';
+  container.appendChild(table);
+  return tbody;
+}
+
+function renderSummaryTable(results) {
+  const tbody = ensureTable(document.getElementById('summary'), [
+    ['基金代码', 't-left'], ['基金名称', 't-left'], ['披露期', 't-left'], ['持仓源', 't-left'],
+    ['预估涨跌', 't-right'], ['行情覆盖权重', 't-right'], ['当前持有收益', 't-right'], ['预估当日盈亏', 't-right'], ['操作', 't-left'],
+  ]);
+  diffRows(tbody, results, r => r.code, summaryRowMap, r => {
+    const tr = document.createElement('tr');
+    tr.className = 'clickable-row';
+    tr.onclick = () => openFundDetail(r.code);
+    // 悬停时才预取详情，刷新估值不再一次性拉取全部基金
+    tr.onmouseenter = () => scheduleDetailPrefetch(r.code);
+    const cells = createCells(tr, 8);
+    const actionTd = document.createElement('td');
+    const btn = document.createElement('button');
+    btn.textContent = '详情';
+    btn.onclick = event => { event.stopPropagation(); openFundDetail(r.code); };
+    actionTd.appendChild(btn);
+    tr.appendChild(actionTd);
+    return { tr, cells, prev: {} };
+  }, (row, r) => {
+    const [code, name, period, source, pct, weight, profit, pnl] = row.cells;
+    const prev = row.prev;
+    setCell(code, r.code, 't-left');
+    setCell(name, r.name, 't-left');
+    setCell(period, r.report_period, 't-left');
+    setCell(source, r.source, 't-left');
+    setCell(pct, formatPercent(r.estimated_pct), `t-right ${numberClass(r.estimated_pct)}`, prev.estimated_pct, r.estimated_pct);
+    setCell(weight, formatPercent(r.matched_weight), 't-right', prev.matched_weight, r.matched_weight);
+    setCell(profit, formatAmount(r.currentProfit), 't-right', prev.currentProfit, r.currentProfit);
+    setCell(pnl, formatAmount(r.estimatePnL), `t-right ${numberClass(r.estimatePnL)}`, prev.estimatePnL, r.estimatePnL);
+    row.prev = { estimated_pct: r.estimated_pct, matched_weight: r.matched_weight, currentProfit: r.currentProfit, estimatePnL: r.estimatePnL };
+  });
+}
+
+// ---- 成分股明细：<details> 展开时才渲染，只渲染可视区域内的行 ----
+
+const HOLDING_ROW_HEIGHT = 34;
+const HOLDING_VIEWPORT_ROWS = 12;
+const HOLDING_OVERSCAN = 6;
+const detailBlockMap = new Map();
+
+function createSpacerRow(colspan) {
+  const tr = document.createElement('tr');
+  const td = document.createElement('td');
+  td.colSpan = colspan;
+  td.className = 'virtual-spacer';
+  tr.appendChild(td);
+  return tr;
+}
 
-  document.getElementById('codes').value = codes.join(' ');
+function createDetailBlock(code) {
+  const el = document.createElement('details');
+  const summary = document.createElement('summary');
+  const missing = document.createElement('p');
+  missing.className = 'muted';
+  const scroller = document.createElement('div');
+  scroller.className = 'virtual-scroll';
+  scroller.style.maxHeight = `${HOLDING_ROW_HEIGHT * HOLDING_VIEWPORT_ROWS}px`;
+  const tbody = ensureTable(scroller, [['代码', 't-left'], ['名称', 't-left'], ['权重', 't-right'], ['实时涨跌', 't-right'], ['贡献', 't-right']]);
+  const topSpacer = createSpacerRow(5);
+  const bottomSpacer = createSpacerRow(5);
+  tbody.appendChild(topSpacer);
+  tbody.appendChild(bottomSpacer);
+  el.appendChild(summary);
+  el.appendChild(missing);
+  el.appendChild(scroller);
+
+  const block = { code, el, summary, missing, scroller, tbody, topSpacer, bottomSpacer, rows: new Map(), prev: {}, result: null, frame: 0 };
+  el.addEventListener('toggle', () => { if (el.open) renderHoldingWindow(block); });
+  scroller.addEventListener('scroll', () => {
+    if (block.frame) return;
+    block.frame = requestAnimationFrame(() => {
+      block.frame = 0;
+      renderHoldingWindow(block);
+    });
+  });
+  return block;
+}
+
+function renderHoldingWindow(block) {
+  const items = (block.result && block.result.details) || [];
+  const first = Math.max(0, Math.floor(block.scroller.scrollTop / HOLDING_ROW_HEIGHT) - HOLDING_OVERSCAN);
+  const last = Math.min(items.length, first + HOLDING_VIEWPORT_ROWS + HOLDING_OVERSCAN * 2);
+  const visible = items.slice(first, last);
+
+  block.topSpacer.firstChild.style.height = `${first * HOLDING_ROW_HEIGHT}px`;
+  block.bottomSpacer.firstChild.style.height = `${(items.length - last) * HOLDING_ROW_HEIGHT}px`;
+  block.tbody.removeChild(block.topSpacer);
+  diffRows(block.tbody, visible, x => x.symbol, block.rows, () => {
+    const tr = document.createElement('tr');
+    tr.style.height = `${HOLDING_ROW_HEIGHT}px`;
+    return { tr, cells: createCells(tr, 5) };
+  }, (row, x) => {
+    const [symbol, name, weight, change, contribution] = row.cells;
+    const prev = block.prev[x.symbol] || {};
+    setCell(symbol, x.symbol);
+    setCell(name, x.name);
+    setCell(weight, `${asNumber(x.weight).toFixed(2)}%`, 't-right');
+    setCell(change, formatPercent(x.change), `t-right ${numberClass(x.change)}`, prev.change, x.change);
+    setCell(contribution, formatPercent(x.contribution), `t-right ${numberClass(x.contribution)}`, prev.contribution, x.contribution);
+  });
+  block.tbody.insertBefore(block.topSpacer, block.tbody.firstChild);
+  block.tbody.appendChild(block.bottomSpacer);
+}
+
+function renderDetailBlocks(results) {
+  const container = document.getElementById('details');
+  const nextCodes = new Set(results.map(r => r.code));
+  detailBlockMap.forEach((block, code) => {
+    if (!nextCodes.has(code)) {
+      block.el.remove();
+      detailBlockMap.delete(code);
+    }
+  });
+  let cursor = container.firstChild;
+  results.forEach(r => {
+    let block = detailBlockMap.get(r.code);
+    if (!block) {
+      block = createDetailBlock(r.code);
+      detailBlockMap.set(r.code, block);
+    }
+    if (block.result) {
+      // 上一轮的值作为闪烁对比基准
+      block.prev = {};
+      (block.result.details || []).forEach(x => { block.prev[x.symbol] = x; });
+    }
+    block.result = r;
+    const summaryText = `${r.name}（${r.code}） | 预估 ${formatPercent(r.estimated_pct)} | 披露期: ${r.report_period} | 源: ${r.source}`;
+    if (block.summary.textContent !== summaryText) block.summary.textContent = summaryText;
+    const missingText = (r.missing_symbols || []).length ? `以下成分未匹配行情，按 0% 处理：${r.missing_symbols.join(', ')}` : '';
+    if (block.missing.textContent !== missingText) block.missing.textContent = missingText;
+    block.missing.style.display = missingText ? '' : 'none';
+    if (block.el.open) renderHoldingWindow(block);
+
+    if (block.el !== cursor) container.insertBefore(block.el, cursor);
+    else cursor = cursor.nextSibling;
+  });
+}
+
+// format=columnar：明细为平行数组 columns，名称在顶层 symbols 字典，还原成逐行对象供渲染
+function expandColumns(item, symbols) {
+  const cols = item.columns;
+  if (!cols) return item;
+  const details = (cols.symbol || []).map((symbol, i) => ({
+    symbol,
+    name: (symbols || {})[symbol] || '',
+    weight: cols.weight[i],
+    change: cols.change[i],
+    contribution: cols.contribution[i],
+  }));
+  const { columns, ...rest } = item;
+  return { ...rest, details };
+}
+
+async function runEstimate() {
   document.getElementById('msg').innerText = '抓取中，请稍候...';
   setLoading('estimateBtn', true, '估值抓取中...');
 
   try {
-    const resp = await fetch(`/api/estimate?codes=${encodeURIComponent(codes.join(','))}`);
+    // 一次请求拿到活跃持仓、估值与组合合计，盈亏在服务端计算
+    const resp = await fetch('/api/portfolio/valuation?format=columnar');
     const data = await resp.json();
+    const positions = (data.positions || []).map(p => expandColumns(p, data.symbols));
+    document.getElementById('codes').value = positions.map(p => p.code).join(' ');
 
     if ((data.failures || []).length) {
       const text = `部分失败: ${data.failures.join(' | ')}`;
@@ -507,55 +813,28 @@ async function runEstimate() {
     } else {
       document.getElementById('msg').innerText = '抓取完成';
     }
+    if (data.stale) {
+      document.getElementById('msg').innerText += `（缓存数据，截至 ${new Date(asNumber(data.as_of) * 1000).toLocaleTimeString()}，后台刷新中）`;
+    }
 
-    const summaryDiv = document.getElementById('summary');
-    summaryDiv.innerHTML = '';
-    let html = '<table><thead><tr><th class="t-left">基金代码</th><th class="t-left">基金名称</th><th class="t-left">披露期</th><th class="t-left">持仓源</th><th class="t-right">预估涨跌</th><th class="t-right">行情覆盖权重</th><th class="t-right">当前持有收益</th><th class="t-right">预估当日盈亏</th><th class="t-left">操作</th></tr></thead><tbody>';
-
-    latestEstimateResults = (data.results || []).map(r => {
-      const p = portfolioMap[r.code] || { share: 0, cost: 0, current_profit: 0 };
-      const estimatePnL = asNumber(p.share) * asNumber(p.cost) * (asNumber(r.estimated_pct) / 100);
-      return { ...r, estimatePnL };
-    });
-
-    latestEstimateResults.forEach(r => {
-      const pnlClass = numberClass(r.estimatePnL);
-      const pctClass = numberClass(r.estimated_pct);
-      html += `<tr onclick="openFundDetail('${r.code}')" class='clickable-row'><td class='t-left'>${r.code}</td><td class='t-left'>${r.name}</td><td class='t-left'>${r.report_period}</td><td class='t-left'>${r.source}</td>
-      <td class='t-right ${pctClass}'>${formatPercent(r.estimated_pct)}</td><td class='t-right'>${formatPercent(r.matched_weight)}</td>
-      <td class='t-right'>${formatAmount((portfolioMap[r.code] || {}).current_profit || 0)}</td><td class='t-right ${pnlClass}'>${formatAmount(r.estimatePnL)}</td>
-      <td><button onclick="event.stopPropagation();openFundDetail('${r.code}')">详情</button></td></tr>`;
-    });
+    latestEstimateResults = positions
+      .filter(p => p.estimated_pct !== null && p.estimated_pct !== undefined)
+      .map(p => ({ ...p, estimatePnL: p.estimate_pnl, currentProfit: asNumber(p.current_profit) }));
 
-    html += '</tbody></table>';
-    summaryDiv.innerHTML = html;
-
-    const detailDiv = document.getElementById('details');
-    detailDiv.innerHTML = '';
-    latestEstimateResults.forEach(r => {
-      let inner = '';
-      if ((r.missing_symbols || []).length) {
-        inner += `<p class='muted'>以下成分未匹配行情，按 0% 处理：${r.missing_symbols.join(', ')}</p>`;
-      }
-      inner += '<table><thead><tr><th class="t-left">代码</th><th class="t-left">名称</th><th class="t-right">权重</th><th class="t-right">实时涨跌</th><th class="t-right">贡献</th></tr></thead><tbody>';
-      (r.details || []).forEach(x => {
-        inner += `<tr><td>${x.symbol}</td><td>${x.name}</td><td class='t-right'>${asNumber(x.weight).toFixed(2)}%</td><td class='t-right ${numberClass(x.change)}'>${formatPercent(x.change)}</td><td class='t-right ${numberClass(x.contribution)}'>${formatPercent(x.contribution)}</td></tr>`;
-      });
-      inner += '</tbody></table>';
-
-      const d = document.createElement('details');
-      d.innerHTML = `<summary>${r.name}（${r.code}） | 预估 ${formatPercent(r.estimated_pct)} | 披露期: ${r.report_period} | 源: ${r.source}</summary>${inner}`;
-      detailDiv.appendChild(d);
-    });
+    renderSummaryTable(latestEstimateResults);
+    renderDetailBlocks(latestEstimateResults);
 
-    const totalPnl = latestEstimateResults.reduce((acc, x) => acc + asNumber(x.estimatePnL), 0);
+    const totals = data.totals || {};
     renderKpi({
-      estimatePnl: totalPnl,
-      totalAsset: null,
-      positions: portfolioResp.positions.length,
+      estimatePnl: asNumber(totals.estimate_pnl),
+      totalAsset: positions.length ? asNumber(totals.market_value) : null,
+      positions: positions.length,
       timeText: new Date().toLocaleTimeString(),
     });
     renderAssetsSummary();
+    fundDetailCache = {};
+    detailPrefetching.clear();
+    detailGeneration += 1;
   } catch (_) {
     showToast('估值抓取失败，请稍后重试');
   } finally {
@@ -563,6 +842,55 @@ async function runEstimate() {
   }
 }
 
+const DETAIL_PREFETCH_DELAY_MS = 150;
+const detailPrefetching = new Set();
+let detailPrefetchQueue = [];
+let detailPrefetchTimer = null;
+// 估值刷新后递增，刷新前发出的预取结果不再写入缓存
+let detailGeneration = 0;
+
+function scheduleDetailPrefetch(code) {
+  if (fundDetailCache[code] || detailPrefetching.has(code)) return;
+  detailPrefetching.add(code);
+  detailPrefetchQueue.push(code);
+  // 短时间内划过的几行合并为一次批量请求
+  if (detailPrefetchTimer) return;
+  detailPrefetchTimer = setTimeout(() => {
+    const codes = detailPrefetchQueue;
+    detailPrefetchQueue = [];
+    detailPrefetchTimer = null;
+    prefetchFundDetails(codes).finally(() => codes.forEach(c => detailPrefetching.delete(c)));
+  }, DETAIL_PREFETCH_DELAY_MS);
+}
+
+async function prefetchFundDetails(codes) {
+  if (!codes.length) return;
+  const generation = detailGeneration;
+  try {
+    const resp = await fetch(`/api/funds/details?format=ndjson&codes=${encodeURIComponent(codes.join(','))}`);
+    if (!resp.ok || !resp.body) return;
+    const reader = resp.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    const consume = line => {
+      if (!line.trim()) return;
+      const item = JSON.parse(line);
+      if (!item.error && generation === detailGeneration) fundDetailCache[item.code] = item;
+    };
+    while (true) {
+      const { value, done } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+      const lines = buffer.split('\n');
+      buffer = lines.pop();
+      lines.forEach(consume);
+    }
+    consume(buffer + decoder.decode());
+  } catch (_) {
+    // 预取失败不影响详情弹窗按需单独加载
+  }
+}
+
 function switchDetailTab(tab) {
   ['history', 'stage', 'nav', 'holding'].forEach(t => {
     const el = document.getElementById(`tab-${t}`);
@@ -572,7 +900,7 @@ function switchDetailTab(tab) {
     });
   });
   if (tab === 'nav' && currentFundDetail) {
-    renderNavCanvas(currentFundDetail.nav_history || []);
+    loadNavRange('1y');
   }
 }
 
@@ -587,12 +915,16 @@ async function openFundDetail(code) {
   document.getElementById('detailTitle').innerText = `基金详情 ${code}`;
   document.getElementById('detailMeta').innerText = '加载中...';
 
-  const resp = await fetch(`/api/funds/${encodeURIComponent(code)}/detail`);
-  const data = await resp.json();
+  let data = fundDetailCache[code];
+  if (!data) {
+    const resp = await fetch(`/api/funds/${encodeURIComponent(code)}/detail`);
+    data = await resp.json();
+  }
   currentFundDetail = data;
 
   document.getElementById('detailTitle').innerText = `${data.code} · ${data.name}`;
-  document.getElementById('detailMeta').innerText = `预估 ${formatPercent(data.estimated_pct)} | 覆盖权重 ${formatPercent(data.matched_weight)} | ${data.report_period} | ${data.source}`;
+  const staleText = data.stale ? ` | 缓存截至 ${new Date(asNumber(data.as_of) * 1000).toLocaleTimeString()}` : '';
+  document.getElementById('detailMeta').innerText = `预估 ${formatPercent(data.estimated_pct)} | 覆盖权重 ${formatPercent(data.matched_weight)} | ${data.report_period} | ${data.source}${staleText}`;
 
   document.getElementById('tab-history').innerHTML = `
     <p>基金代码：${data.code}</p>
@@ -617,6 +949,36 @@ async function openFundDetail(code) {
   switchDetailTab('history');
 }
 
+const NAV_RANGE_DAYS = { '3m': 92, '1y': 365, '3y': 3 * 365, all: 0 };
+
+async function loadNavRange(range) {
+  if (!currentFundDetail) return;
+  document.querySelectorAll('[data-nav-range]').forEach(btn => {
+    btn.classList.toggle('active', btn.dataset.navRange === range);
+  });
+  if (range === '1y') {
+    renderNavCanvas(currentFundDetail.nav_history || []);
+    return;
+  }
+  const code = currentFundDetail.code;
+  const params = new URLSearchParams();
+  const days = NAV_RANGE_DAYS[range] || 0;
+  if (days) {
+    const start = new Date(Date.now() - days * 86400000);
+    params.set('start', start.toISOString().slice(0, 10));
+  }
+  // 服务端按画布宽度降采样，十年日线也只传回几百个点
+  const canvas = document.getElementById('navCanvas');
+  params.set('points', String(Math.max(60, Math.floor(((canvas && canvas.clientWidth) || 940) / 2))));
+  try {
+    const resp = await fetch(`/api/funds/${encodeURIComponent(code)}/nav?${params.toString()}`);
+    const data = await resp.json();
+    if (currentFundDetail && currentFundDetail.code === code) renderNavCanvas(data.nav_history || []);
+  } catch (_) {
+    // 请求失败时保留当前曲线
+  }
+}
+
 function renderNavCanvas(rows) {
   const canvas = document.getElementById('navCanvas');
   if (!canvas) return;
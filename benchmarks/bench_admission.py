@@ -0,0 +1,125 @@
+"""入站准入基准：--clients 个线程同时请求一个耗时 --service-ms 的昂贵接口，
+对比不设闸门与 AdmissionGate（并发上限 + 有界队列）下被接纳请求的延迟分布与拒绝数，
+并测量过载期间廉价接口（不经过闸门）的响应时间。
+
+用法：python benchmarks/bench_admission.py [--clients 64 --requests 8 --limit 4 --queue 16 --service-ms 20]
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.services.admission import AdmissionGate, AdmissionRejected
+
+
+class FakeBackend:
+    """同时处理的请求越多越慢（共享 CPU / 上游），模拟过载时的排队放大。"""
+
+    def __init__(self, service: float) -> None:
+        self.service = service
+        self.lock = threading.Lock()
+        self.active = 0
+
+    def expensive(self) -> None:
+        with self.lock:
+            self.active += 1
+            active = self.active
+        try:
+            time.sleep(self.service * max(1.0, active / 4))
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    def cheap(self) -> None:
+        with self.lock:
+            active = self.active
+        time.sleep(self.service / 20 * max(1.0, active / 4))
+
+
+def _pct(values: list, q: float) -> float:
+    return sorted(values)[min(len(values) - 1, int(len(values) * q))] * 1000 if values else 0.0
+
+
+def _run(label: str, args: argparse.Namespace, gate: AdmissionGate = None) -> None:
+    backend = FakeBackend(args.service_ms / 1000)
+    latencies: list = []
+    cheap_latencies: list = []
+    rejected = {429: 0, 503: 0}
+    lock = threading.Lock()
+    done = threading.Event()
+
+    def client(_: int) -> None:
+        for _ in range(args.requests):
+            begin = time.perf_counter()
+            try:
+                if gate is None:
+                    backend.expensive()
+                else:
+                    entered_at = gate.enter()
+                    try:
+                        backend.expensive()
+                    finally:
+                        gate.release(entered_at)
+            except AdmissionRejected as exc:
+                with lock:
+                    rejected[exc.status] += 1
+                continue
+            with lock:
+                latencies.append(time.perf_counter() - begin)
+
+    def prober() -> None:
+        while not done.is_set():
+            begin = time.perf_counter()
+            backend.cheap()
+            cheap_latencies.append(time.perf_counter() - begin)
+            time.sleep(0.005)
+
+    probe = threading.Thread(target=prober, daemon=True)
+    probe.start()
+    begin = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.clients) as pool:
+        list(pool.map(client, range(args.clients)))
+    elapsed = time.perf_counter() - begin
+    done.set()
+    probe.join()
+
+    print(
+        f"{label}: {elapsed * 1000:.0f} ms | 接纳 {len(latencies)} 拒绝 429={rejected[429]} 503={rejected[503]} | "
+        f"昂贵接口 p50 {_pct(latencies, 0.5):.0f} ms p99 {_pct(latencies, 0.99):.0f} ms | "
+        f"廉价接口 p50 {_pct(cheap_latencies, 0.5):.1f} ms 最大 {max(cheap_latencies, default=0) * 1000:.1f} ms"
+    )
+    if gate is not None:
+        print(f"  闸门状态: {gate.stats()}")
+    if latencies:
+        print(f"  平均 {statistics.mean(latencies) * 1000:.0f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="入站准入与削峰基准")
+    parser.add_argument("--clients", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=8)
+    parser.add_argument("--limit", type=int, default=4)
+    parser.add_argument("--queue", type=int, default=16)
+    parser.add_argument("--service-ms", type=float, default=20.0)
+    parser.add_argument("--queue-timeout", type=float, default=5.0)
+    args = parser.parse_args()
+
+    _run("不设闸门", args)
+    _run(
+        f"AdmissionGate（并发 {args.limit}，队列 {args.queue}）",
+        args,
+        AdmissionGate("bench", args.limit, args.queue, args.queue_timeout),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""akshare 持仓抓取基准：逐行 iterrows vs 按列转换，以及披露年份记忆对冷启动的影响。
+
+不依赖网络与 akshare 本身：用一个模拟 `fund_portfolio_hold_em` 的桩替换模块里的 `ak`，
+每次调用固定休眠 --latency-ms 模拟下载耗时，当年数据为空（模拟年初尚未披露）。
+
+用法：python benchmarks/bench_akshare_holdings.py [--funds 50 --rows 200 --latency-ms 30]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+import pandas as pd
+
+from app.providers import akshare_provider
+from app.providers.base import Holding
+
+
+class _StubAkshare:
+    def __init__(self, rows: int, latency: float) -> None:
+        self.latency = latency
+        self.calls = 0
+        this_year = time.localtime().tm_year
+        self.frames = {
+            str(this_year): pd.DataFrame(),
+            str(this_year - 1): _make_frame(rows, this_year - 1),
+        }
+
+    def fund_portfolio_hold_em(self, symbol: str, date: str) -> pd.DataFrame:
+        self.calls += 1
+        time.sleep(self.latency)
+        return self.frames.get(date, pd.DataFrame())
+
+
+def _make_frame(rows: int, year: int) -> pd.DataFrame:
+    records = []
+    for quarter in (4, 3, 2, 1):
+        for i in range(rows):
+            records.append(
+                {
+                    "序号": i + 1,
+                    "股票代码": f"{600000 + i:06d}",
+                    "股票名称": f"股票{i}",
+                    "占净值比例": round(0.05 + (i % 50) / 10, 2),
+                    "持股数": 100.0 + i,
+                    "持仓市值": 1000.0 + i,
+                    "季度": f"{year}年{quarter}季度股票投资明细",
+                }
+            )
+    return pd.DataFrame.from_records(records)
+
+
+def _iterrows_to_holdings(df: pd.DataFrame) -> List[Holding]:
+    holdings: List[Holding] = []
+    for _, row in df.iterrows():
+        symbol = str(row["股票代码"]).strip()
+        name = str(row["股票名称"]).strip()
+        weight_txt = str(row["占净值比例"]).replace("%", "").strip() or "0"
+        try:
+            weight = float(weight_txt)
+        except ValueError:
+            continue
+        if symbol and symbol.lower() != "nan":
+            holdings.append(Holding(symbol=symbol, name=name, weight=weight))
+    return holdings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="akshare 持仓抓取基准")
+    parser.add_argument("--funds", type=int, default=50)
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=30.0)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    stub = _StubAkshare(args.rows, args.latency_ms / 1000)
+    akshare_provider.ak = stub
+    akshare_provider.pd = pd
+
+    frame = stub.frames[str(time.localtime().tm_year - 1)]
+    periods = frame["季度"].astype(str)
+    sub_df = frame[periods == periods.iloc[0]]
+    fast = akshare_provider._frame_to_holdings(sub_df, "股票代码", "股票名称", "占净值比例")
+    if fast != _iterrows_to_holdings(sub_df):
+        raise SystemExit("按列转换结果与 iterrows 不一致")
+
+    begin = time.perf_counter()
+    for _ in range(args.rounds):
+        _iterrows_to_holdings(sub_df)
+    iter_ms = (time.perf_counter() - begin) / args.rounds * 1000
+    begin = time.perf_counter()
+    for _ in range(args.rounds):
+        akshare_provider._frame_to_holdings(sub_df, "股票代码", "股票名称", "占净值比例")
+    column_ms = (time.perf_counter() - begin) / args.rounds * 1000
+    print(f"行转换（{len(sub_df)} 行）: iterrows {iter_ms:.3f} ms | 按列 {column_ms:.3f} ms")
+
+    provider = akshare_provider.AkshareHoldingsProvider()
+    codes = [f"{i:06d}" for i in range(args.funds)]
+    for label in ("首轮（无记忆）", "次轮（记忆年份）"):
+        stub.calls = 0
+        begin = time.perf_counter()
+        for code in codes:
+            provider.get_latest_holdings(code)
+        elapsed = (time.perf_counter() - begin) * 1000
+        print(f"{label}: {args.funds} 只基金 {elapsed:.1f} ms | 上游调用 {stub.calls} 次")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""持仓批量导入/导出：流式 CSV 导入 + 分页导出 对比 整体 JSON 数组 + bulk_upsert_positions。
+
+在临时目录的独立 SQLite 库中导入 rows 条合成持仓，用 tracemalloc 记录 Python 堆峰值：
+流式路径按 64KB 块喂入请求体，内存与行数无关；整体路径需先把全部 JSON 读入并逐行查库，
+bulk_upsert 接口还要对每行做 pydantic 校验。
+
+用法：python benchmarks/bench_bulk_io.py [--rows 300000 --chunk-size 1000]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Iterator, Tuple
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app import db
+from app.services.bulk_io import export_positions, import_positions
+
+CHUNK = 64 * 1024
+
+
+def _csv_chunks(rows: int) -> Iterator[bytes]:
+    """逐块生成 CSV 请求体，模拟边上传边读取。"""
+    buffer = ["code,name,share,cost,current_profit,is_active\n"]
+    size = len(buffer[0])
+    for i in range(rows):
+        line = f"{i:06d},示例基金{i},{i % 1000}.5,1.{i % 97:04d},{i % 13},1\n"
+        buffer.append(line)
+        size += len(line)
+        if size >= CHUNK:
+            yield "".join(buffer).encode("utf-8")
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer).encode("utf-8")
+
+
+def _json_body(rows: int) -> bytes:
+    return json.dumps(
+        {
+            "positions": [
+                {"code": f"{i:06d}", "name": f"示例基金{i}", "share": i % 1000 + 0.5, "cost": 1.0, "current_profit": i % 13}
+                for i in range(rows)
+            ]
+        },
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def _measure(setup: Callable[[], None], run: Callable[[], object]) -> Tuple[object, float, float]:
+    """计时与堆峰值分两次运行（tracemalloc 会显著拖慢分配密集的代码），每次运行前调用 setup。"""
+    setup()
+    begin = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - begin
+    setup()
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 1024 / 1024
+
+
+def _fresh_db(path: Path) -> None:
+    if path.exists():
+        path.unlink()
+    db.DB_PATH = path
+    db.ensure_tables()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=300000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stream_db = Path(tmp) / "stream.db"
+        bulk_db = Path(tmp) / "bulk.db"
+        print(f"{args.rows} 行持仓")
+
+        result, elapsed, peak = _measure(
+            lambda: _fresh_db(stream_db),
+            lambda: import_positions(_csv_chunks(args.rows), "csv", chunk_size=args.chunk_size),
+        )
+        print(f"流式 CSV 导入      {elapsed:>7.2f} s  峰值 {peak:>7.1f} MiB  imported={result['imported']}")
+
+        # 已有数据上再导一遍：upsert 走冲突更新分支
+        result, elapsed, peak = _measure(
+            lambda: None,
+            lambda: import_positions(_csv_chunks(args.rows), "csv", chunk_size=args.chunk_size),
+        )
+        print(f"流式 CSV 重复导入  {elapsed:>7.2f} s  峰值 {peak:>7.1f} MiB  imported={result['imported']}")
+
+        size, elapsed, peak = _measure(
+            lambda: None, lambda: sum(len(text.encode("utf-8")) for text in export_positions("csv"))
+        )
+        print(f"分页 CSV 导出      {elapsed:>7.2f} s  峰值 {peak:>7.1f} MiB  {size / 1024 / 1024:.1f} MiB")
+
+        body = _json_body(args.rows)
+        count, elapsed, peak = _measure(
+            lambda: _fresh_db(bulk_db),
+            lambda: db.bulk_upsert_positions(json.loads(body.decode("utf-8"))["positions"]),
+        )
+        print(f"JSON + bulk_upsert {elapsed:>7.2f} s  峰值 {peak:>7.1f} MiB  count={count}（不含 pydantic 校验）")
+
+        # /api/portfolio/positions/bulk_upsert 的实际路径：整个请求体经 pydantic 校验后再写库
+        from app.schemas import PortfolioBulkUpsertRequest
+
+        def _validated() -> int:
+            payload = PortfolioBulkUpsertRequest.model_validate_json(body)
+            return db.bulk_upsert_positions([item.model_dump() for item in payload.positions])
+
+        count, elapsed, peak = _measure(lambda: _fresh_db(bulk_db), _validated)
+        print(f"bulk_upsert 接口   {elapsed:>7.2f} s  峰值 {peak:>7.1f} MiB  count={count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""/api/estimate 响应体积与序列化耗时：默认逐行 details 与 format=columnar / top=N 对比。
+
+合成 funds 只基金、每只 holdings 条成分股（股票池有重叠）的估值结果，计时包含
+shape_estimate 改写与 json.dumps，与两个服务端的序列化路径一致。
+
+用法：python benchmarks/bench_columnar.py [--funds 40 --holdings 200 --top 20]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.services.columnar import shape_estimate
+
+
+def _fake_estimate(funds: int, holdings: int, seed: int = 7) -> dict:
+    rng = random.Random(seed)
+    pool = [(f"{600000 + i:06d}", f"示例股票{i:04d}") for i in range(holdings * 4)]
+    results = []
+    for f in range(funds):
+        details = []
+        for symbol, name in rng.sample(pool, holdings):
+            weight = round(rng.uniform(0.01, 8.0), 4)
+            change = round(rng.uniform(-10.0, 10.0), 4)
+            details.append(
+                {
+                    "symbol": symbol,
+                    "name": name,
+                    "weight": weight,
+                    "change": change,
+                    "contribution": round(weight * change / 100.0, 4),
+                }
+            )
+        details.sort(key=lambda x: x["contribution"], reverse=True)
+        results.append(
+            {
+                "code": f"{100000 + f:06d}",
+                "name": f"示例基金{f}",
+                "report_period": "2024Q4",
+                "estimated_pct": round(sum(d["contribution"] for d in details), 4),
+                "matched_weight": round(sum(d["weight"] for d in details), 4),
+                "missing_symbols": [],
+                "details": details,
+                "source": "bench",
+            }
+        )
+    return {"results": results, "failures": [], "as_of": int(time.time()), "stale": False}
+
+
+def _measure(render: Callable[[], bytes], rounds: int) -> tuple:
+    body = render()
+    begin = time.perf_counter()
+    for _ in range(rounds):
+        render()
+    return len(body), (time.perf_counter() - begin) / rounds * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--funds", type=int, default=40)
+    parser.add_argument("--holdings", type=int, default=200)
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    data = _fake_estimate(args.funds, args.holdings)
+    variants = [
+        ("json", {}),
+        ("columnar", {"columnar": True}),
+        (f"json top={args.top}", {"top": args.top}),
+        (f"columnar top={args.top}", {"columnar": True, "top": args.top}),
+    ]
+    print(f"{args.funds} 只基金 × {args.holdings} 条成分股，每种格式 {args.rounds} 轮")
+    baseline = None
+    for label, kwargs in variants:
+        render = lambda kwargs=kwargs: json.dumps(shape_estimate(data, **kwargs), ensure_ascii=False).encode("utf-8")  # noqa: E731
+        size, ms = _measure(render, args.rounds)
+        baseline = baseline or (size, ms)
+        print(
+            f"{label:<18} {size / 1024:>9.1f} KiB ({size / baseline[0]:>5.1%})"
+            f"  {ms:>7.2f} ms ({ms / baseline[1]:>5.1%})"
+        )
+
+
+if __name__ == "__main__":
+    main()
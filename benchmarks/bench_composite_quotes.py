@@ -0,0 +1,102 @@
+"""组合行情基准：两个替身后端 fast（只覆盖 A 股港股，第 --flaky-from 批之后间歇失败）与 slow（全市场）。
+每批耗时 = 固定开销 + 每个代码的开销。对比固定使用单一后端与 CompositeQuoteProvider（按市场路由 + 滚动耗时/成功率排序 + 只重试未命中代码）
+的总耗时、缺失代码数，以及各后端被调用的代码数。
+
+用法：python benchmarks/bench_composite_quotes.py [--batches 60 --batch-size 40 --flaky-from 20]
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.providers import composite
+from app.providers.base import ProviderError, QuoteProvider
+from app.providers.composite import CompositeQuoteProvider
+
+
+class StandInBackend(QuoteProvider):
+    def __init__(self, name: str, latency: float, per_symbol: float, markets: set, fail_rate: float = 0.0) -> None:
+        self.name = name
+        self.latency = latency
+        self.per_symbol = per_symbol
+        self.markets = markets
+        self.fail_rate = fail_rate
+        self.requested = 0
+        self.rng = random.Random(name)
+
+    def get_pct_change(self, symbol: str) -> Optional[float]:
+        return self.get_pct_changes([symbol])[symbol]
+
+    def get_pct_changes(self, symbols: List[str]) -> Dict[str, Optional[float]]:
+        self.requested += len(symbols)
+        time.sleep(self.latency + self.per_symbol * len(symbols))
+        if self.rng.random() < self.fail_rate:
+            raise ProviderError(f"{self.name} 503")
+        return {s: (1.0 if ("cn" if s.isdigit() and len(s) == 6 else "hk" if s.isdigit() else "us") in self.markets else None) for s in symbols}
+
+
+def _batches(args: argparse.Namespace) -> List[List[str]]:
+    rng = random.Random(3)
+    universe = [f"{600000 + i}" for i in range(300)] + [f"{i:05d}" for i in range(700, 800)] + ["AAPL", "MSFT", "NVDA", "TSLA"] * 3
+    return [rng.sample(universe, args.batch_size) for _ in range(args.batches)]
+
+
+def _run(label: str, args: argparse.Namespace, make_provider) -> None:  # noqa: ANN001
+    composite._STATS.clear()
+    fast = StandInBackend("fast", 0.002, 0.0001, {"cn", "hk"})
+    slow = StandInBackend("slow", 0.005, 0.001, {"cn", "hk", "us"})
+    provider = make_provider(fast, slow)
+    missing = 0
+    begin = time.perf_counter()
+    for i, batch in enumerate(_batches(args)):
+        if i == args.flaky_from:
+            fast.fail_rate = 0.7
+        # 线上每个请求新建 provider，请求级缓存不跨批
+        getattr(provider, "quote_cache", {}).clear()
+        try:
+            quotes = provider.get_pct_changes(batch)
+        except ProviderError:
+            missing += len(batch)
+            continue
+        missing += sum(1 for value in quotes.values() if value is None)
+    elapsed = (time.perf_counter() - begin) * 1000
+    print(f"{label}: {elapsed:.0f} ms | 缺失 {missing} 个 | fast 请求 {fast.requested} 个代码, slow 请求 {slow.requested} 个代码")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="按市场路由的组合行情基准")
+    parser.add_argument("--batches", type=int, default=60)
+    parser.add_argument("--batch-size", type=int, default=40)
+    parser.add_argument("--flaky-from", type=int, default=20)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    _run("仅 fast", args, lambda fast, slow: fast)
+    _run("仅 slow", args, lambda fast, slow: slow)
+    _run(
+        "composite（cn/hk=fast|slow, 其他=slow）",
+        args,
+        lambda fast, slow: CompositeQuoteProvider(
+            routes={"cn": ["fast", "slow"], "hk": ["fast", "slow"], "default": ["slow"]}, backends={"fast": fast, "slow": slow}
+        ),
+    )
+    _run(
+        "composite（所有市场 fast|slow）",
+        args,
+        lambda fast, slow: CompositeQuoteProvider(routes={"default": ["fast", "slow"]}, backends={"fast": fast, "slow": slow}),
+    )
+    for item in composite.quote_backend_stats():
+        print(f"  {item}")
+
+
+if __name__ == "__main__":
+    main()
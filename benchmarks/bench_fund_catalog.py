@@ -0,0 +1,89 @@
+"""基金目录：构建耗时与前缀搜索延迟，对照逐条扫描。
+
+合成与 fundcode_search.js 同结构的目录（默认 26000 只），分别用代码、拼音缩写、名称前缀查询；
+也可用 --file 指定本地 fundcode_search.js 副本。
+
+用法：python benchmarks/bench_fund_catalog.py [--funds 26000 --queries 2000 --file data/fundcode_search.js]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.providers.fund_catalog import FundCatalog, parse_catalog_text
+
+COMPANIES = ["易方达", "华夏", "南方", "广发", "招商", "富国", "汇添富", "嘉实", "博时", "工银瑞信"]
+THEMES = ["消费", "医疗", "科技", "新能源", "蓝筹", "成长", "价值", "红利", "中证500", "沪深300"]
+KINDS = [("混合", "HH", "混合型-偏股"), ("股票", "GP", "股票型"), ("债券", "ZQ", "债券型-长债"), ("指数", "ZS", "指数型-股票")]
+
+
+def _fake_rows(n: int, seed: int = 7) -> List[list]:
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        company, theme = rng.choice(COMPANIES), rng.choice(THEMES)
+        kind, kind_abbr, kind_type = rng.choice(KINDS)
+        share = rng.choice("AC")
+        abbr = "".join(rng.choice(string.ascii_uppercase) for _ in range(4)) + kind_abbr + share
+        rows.append([f"{i:06d}", abbr, f"{company}{theme}{kind}{share}", kind_type, abbr.lower() * 2])
+    return rows
+
+
+def _scan(rows: List[list], prefix: str, limit: int) -> list:
+    found = []
+    for row in rows:
+        if any(str(value).lower().startswith(prefix) for value in (row[0], row[1], row[2], row[4])):
+            found.append(row[0])
+            if len(found) >= limit:
+                break
+    return found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--funds", type=int, default=26000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--file", default="")
+    args = parser.parse_args()
+
+    rows = parse_catalog_text(Path(args.file).read_text(encoding="utf-8")) if args.file else _fake_rows(args.funds)
+    begin = time.perf_counter()
+    catalog = FundCatalog(rows)
+    print(f"目录 {len(catalog)} 只，构建 {(time.perf_counter() - begin) * 1000:.1f} ms")
+
+    rng = random.Random(11)
+    samples = {
+        "代码": [row[0][: rng.randint(3, 6)] for row in rng.sample(rows, args.queries)],
+        "拼音缩写": [row[1][: rng.randint(2, 4)].lower() for row in rng.sample(rows, args.queries)],
+        "名称": [row[2][: rng.randint(2, 5)] for row in rng.sample(rows, args.queries)],
+        "无结果": ["zzzzzz"] * args.queries,
+    }
+    for label, queries in samples.items():
+        begin = time.perf_counter()
+        hits = sum(len(catalog.search(q, args.limit)) for q in queries)
+        index_us = (time.perf_counter() - begin) / len(queries) * 1e6
+        scan_queries = queries[:200]
+        begin = time.perf_counter()
+        for q in scan_queries:
+            _scan(rows, q, args.limit)
+        scan_us = (time.perf_counter() - begin) / len(scan_queries) * 1e6
+        print(f"{label:<6} 索引 {index_us:>8.1f} µs/次  逐条扫描 {scan_us:>9.1f} µs/次  平均命中 {hits / len(queries):.1f}")
+
+    codes = [row[0] for row in rng.sample(rows, min(len(rows), 1000))]
+    begin = time.perf_counter()
+    names = catalog.names_for(codes)
+    print(f"批量名称 {len(names)} 个 {(time.perf_counter() - begin) * 1000:.2f} ms（无网络请求）")
+
+
+if __name__ == "__main__":
+    main()
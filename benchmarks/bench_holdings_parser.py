@@ -0,0 +1,128 @@
+"""对比 Eastmoney 持仓页解析：旧版 HTMLParser + 整段反转义 vs 单遍扫描。
+
+用法：python benchmarks/bench_holdings_parser.py [--rounds 200]
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import List
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.providers.base import Holding
+from app.providers.eastmoney import _parse_latest_table
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+class _LegacyTableParser(HTMLParser):
+    """旧版 app/providers/eastmoney.py::_SimpleTableParser 原样保留，作为对照组。"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.in_tr = False
+        self.in_cell = False
+        self.cell_text: List[str] = []
+        self.current_row: List[str] = []
+        self.rows: List[List[str]] = []
+
+    def handle_starttag(self, tag: str, attrs) -> None:  # noqa: ANN001
+        if tag == "tr":
+            self.in_tr = True
+            self.current_row = []
+        elif self.in_tr and tag in {"td", "th"}:
+            self.in_cell = True
+            self.cell_text = []
+
+    def handle_data(self, data: str) -> None:
+        if self.in_cell:
+            self.cell_text.append(data)
+
+    def handle_endtag(self, tag: str) -> None:
+        if self.in_tr and tag in {"td", "th"} and self.in_cell:
+            txt = "".join(self.cell_text).strip()
+            self.current_row.append(re.sub(r"\s+", " ", txt))
+            self.in_cell = False
+        elif tag == "tr" and self.in_tr:
+            if self.current_row:
+                self.rows.append(self.current_row)
+            self.in_tr = False
+
+
+def legacy_parse(text: str, first_table_only: bool = False) -> List[Holding]:
+    html_match = re.search(r"content:\"(.*)\",arryear", text, flags=re.S)
+    assert html_match is not None
+    table_html = html_match.group(1).replace('\\"', '"').replace("\\n", "").replace("\\/", "/")
+    if first_table_only:
+        table_html = table_html[: table_html.find("</table>") + len("</table>")]
+    parser = _LegacyTableParser()
+    parser.feed(table_html)
+
+    header = parser.rows[0]
+    idx_code = idx_name = idx_weight = -1
+    for i, col in enumerate(header):
+        if "股票代码" in col:
+            idx_code = i
+        elif "股票名称" in col:
+            idx_name = i
+        elif "占净值" in col:
+            idx_weight = i
+
+    holdings: List[Holding] = []
+    for row in parser.rows[1:]:
+        if max(idx_code, idx_name, idx_weight) >= len(row):
+            continue
+        symbol = row[idx_code].strip()
+        name = row[idx_name].strip()
+        weight_txt = row[idx_weight].replace("%", "").replace("--", "0").strip() or "0"
+        try:
+            weight = float(weight_txt)
+        except ValueError:
+            continue
+        if symbol:
+            holdings.append(Holding(symbol=symbol, name=name, weight=weight))
+    return holdings
+
+
+def fast_parse(text: str) -> List[Holding]:
+    start = text.find('content:"') + len('content:"')
+    return _parse_latest_table(text, start, text.rfind('",arryear'))
+
+
+def _timeit(fn, text: str, rounds: int) -> float:  # noqa: ANN001
+    begin = time.perf_counter()
+    for _ in range(rounds):
+        fn(text)
+    return (time.perf_counter() - begin) / rounds * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Eastmoney 持仓页解析基准")
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    for path in sorted(FIXTURES_DIR.glob("eastmoney_jjcc_*.js")):
+        text = path.read_text(encoding="utf-8")
+        fast = fast_parse(text)
+        # 旧解析器会把后续季度表的行也拼进结果，这里只与其第一张表的结果比对
+        expected = legacy_parse(text, first_table_only=True)
+        if fast != expected:
+            raise SystemExit(f"{path.name}: 解析结果不一致")
+
+        legacy_ms = _timeit(legacy_parse, text, args.rounds)
+        fast_ms = _timeit(fast_parse, text, args.rounds)
+        print(
+            f"{path.name}: {len(fast)} 条持仓 | legacy {legacy_ms:.3f} ms | "
+            f"single-pass {fast_ms:.3f} ms | x{legacy_ms / max(fast_ms, 1e-9):.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
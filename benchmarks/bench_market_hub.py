@@ -0,0 +1,92 @@
+"""行情中心基准：用本地替身适配器（每个市场/平台固定耗时，其中一个平台极慢、一个适配器报错），
+对比逐个串行拉取与 MarketDataHub 并发拉取的耗时，以及缓存命中、部分返回时的响应。
+
+用法：python benchmarks/bench_market_hub.py [--latency-ms 80 --slow-ms 3000 --timeout 0.5]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.providers.base import GoldQuote, IndexProvider, IndexQuote
+from app.providers.mock import MockGoldProvider, MockIndexProvider
+from app.services.market_hub import MarketDataHub
+
+MARKETS = ["cn", "hk", "us"]
+
+
+class SlowPlatformGold(MockGoldProvider):
+    """某一个平台（如民生）明显慢于其他平台。"""
+
+    def __init__(self, latency: float, slow_platform: str, slow_latency: float) -> None:
+        super().__init__(latency=latency)
+        self.slow_platform = slow_platform
+        self.slow_latency = slow_latency
+
+    def get_platform_quotes(self, platform: str) -> List[GoldQuote]:
+        if platform == self.slow_platform:
+            time.sleep(self.slow_latency)
+        return super().get_platform_quotes(platform)
+
+
+class BrokenIndexProvider(IndexProvider):
+    def get_indexes(self, market: str) -> List[IndexQuote]:
+        time.sleep(0.01)
+        raise RuntimeError("upstream 502")
+
+
+def _timed(label: str, fn) -> dict:  # noqa: ANN001
+    begin = time.perf_counter()
+    result = fn()
+    elapsed = (time.perf_counter() - begin) * 1000
+    statuses = ", ".join(f"{s['adapter']}:{s['source']}={s['status']}" for s in result.get("sources", []))
+    print(f"{label}: {elapsed:.0f} ms | {len(result['quotes'])} 条 | partial={result.get('partial')} | {statuses}")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="指数/黄金行情中心并发与缓存基准")
+    parser.add_argument("--latency-ms", type=float, default=80.0)
+    parser.add_argument("--slow-ms", type=float, default=3000.0)
+    parser.add_argument("--timeout", type=float, default=0.5)
+    args = parser.parse_args()
+    latency = args.latency_ms / 1000
+
+    primary = MockIndexProvider(latency=latency)
+    secondary = MockIndexProvider(latency=latency, status_tag="mirror")
+    gold = SlowPlatformGold(latency, "民生", args.slow_ms / 1000)
+
+    def serial_indexes() -> dict:
+        return {"quotes": [q for m in MARKETS for adapter in (primary, secondary) for q in adapter.get_indexes(m)]}
+
+    def serial_gold() -> dict:
+        return {"quotes": gold.get_gold_quotes()}
+
+    _timed("串行 指数 3 市场 × 2 适配器", serial_indexes)
+    _timed("串行 黄金 3 平台（民生慢）", serial_gold)
+
+    hub = MarketDataHub(
+        {"primary": primary, "mirror": secondary, "broken": BrokenIndexProvider()},
+        {"mock": gold},
+        index_ttl=10,
+        gold_ttl=5,
+        hard_ttl=300,
+        timeout=args.timeout,
+    )
+    _timed("行情中心 指数（冷）", lambda: hub.get_indexes(MARKETS))
+    _timed("行情中心 指数（缓存）", lambda: hub.get_indexes(MARKETS))
+    _timed("行情中心 黄金（冷，民生超时）", hub.get_gold_quotes)
+    _timed("行情中心 黄金（民生仍在拉取）", hub.get_gold_quotes)
+    time.sleep(args.slow_ms / 1000)
+    _timed("行情中心 黄金（民生后台完成后）", hub.get_gold_quotes)
+
+
+if __name__ == "__main__":
+    main()
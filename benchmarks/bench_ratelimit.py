@@ -0,0 +1,91 @@
+"""出站限流基准：模拟一个并发超过 --capacity 就返回 429、且延迟随并发上升的上游，
+对比 串行 / 无限制并发 / HostLimiter（令牌桶 + AIMD）三种方式拉取 --requests 个行情。
+
+用法：python benchmarks/bench_ratelimit.py [--requests 400 --workers 32 --capacity 6 --latency-ms 20]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import threading
+import time
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.providers.ratelimit import OutboundLimiter
+
+
+class FakeUpstream:
+    def __init__(self, capacity: int, latency: float) -> None:
+        self.capacity = capacity
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.active = 0
+        self.throttled = 0
+
+    def get(self) -> None:
+        with self.lock:
+            self.active += 1
+            active = self.active
+        try:
+            if active > self.capacity:
+                with self.lock:
+                    self.throttled += 1
+                time.sleep(self.latency / 4)
+                raise urllib.error.HTTPError("http://fake", 429, "Too Many Requests", None, None)  # type: ignore[arg-type]
+            time.sleep(self.latency * (1 + active / self.capacity))
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def _run(label: str, upstream: FakeUpstream, requests: int, workers: int, limiter: OutboundLimiter = None) -> None:
+    failed = 0
+    lock = threading.Lock()
+
+    def fetch(_: int) -> None:
+        nonlocal failed
+        for _attempt in range(5):
+            try:
+                if limiter is None:
+                    upstream.get()
+                else:
+                    with limiter.request("push2.eastmoney.com"):
+                        upstream.get()
+                return
+            except urllib.error.HTTPError:
+                continue
+        with lock:
+            failed += 1
+
+    begin = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(fetch, range(requests)))
+    elapsed = (time.perf_counter() - begin) * 1000
+    print(f"{label}: {elapsed:.0f} ms | 收到 429 {upstream.throttled} 次 | 重试 5 次仍失败 {failed} 个")
+    if limiter is not None:
+        print(f"  限流器状态: {limiter.stats()[0]}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="出站限流 AIMD 基准")
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument("--capacity", type=int, default=6)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+    latency = args.latency_ms / 1000
+
+    _run("串行", FakeUpstream(args.capacity, latency), args.requests, 1)
+    _run(f"无限制 {args.workers} 并发", FakeUpstream(args.capacity, latency), args.requests, args.workers)
+    limiter = OutboundLimiter({"push2.eastmoney.com": (1000.0, 16)}, queue_timeout=30)
+    _run(f"HostLimiter（{args.workers} 线程，并发上限 16 起步 8）", FakeUpstream(args.capacity, latency), args.requests, args.workers, limiter)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""跨 worker 共享缓存基准：起 --workers 个进程（模拟 uvicorn --workers），每个进程 --threads 个线程
+同时查询同一批 --symbols 个代码的行情，上游每次调用耗时 --latency-ms。
+对比各进程独立的 memory 后端与共享的 sqlite（WAL）后端的上游调用次数与耗时。
+
+用法：python benchmarks/bench_shared_cache.py [--workers 4 --threads 8 --symbols 200 --latency-ms 5]
+"""
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.providers.shared_cache import MemoryBackend, SharedCache, SqliteBackend
+
+
+def _worker(backend_name: str, db_path: str, threads: int, symbols: int, latency: float, calls, start) -> None:  # noqa: ANN001
+    backend = SqliteBackend(Path(db_path)) if backend_name == "sqlite" else MemoryBackend()
+    cache = SharedCache(backend, lock_ttl=5)
+
+    def upstream(symbol: str) -> float:
+        time.sleep(latency)
+        with calls.get_lock():
+            calls.value += 1
+        return float(len(symbol))
+
+    def query(offset: int) -> None:
+        # 各线程从不同位置开始遍历，制造同一 key 的并发未命中
+        for i in range(symbols):
+            symbol = f"{600000 + (i + offset) % symbols}"
+            cache.get_or_compute(f"quote:bench:{symbol}", 60, lambda s=symbol: upstream(s))
+
+    start.wait()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(query, range(0, symbols, max(1, symbols // threads))[:threads]))
+
+
+def _run(backend_name: str, args: argparse.Namespace) -> None:
+    ctx = mp.get_context("spawn")
+    calls = ctx.Value("i", 0)
+    start = ctx.Event()
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "cache.db")
+        if backend_name == "sqlite":
+            SqliteBackend(Path(db_path))  # 先建表，避免各进程同时建表
+        procs = [
+            ctx.Process(target=_worker, args=(backend_name, db_path, args.threads, args.symbols, args.latency_ms / 1000, calls, start))
+            for _ in range(args.workers)
+        ]
+        for proc in procs:
+            proc.start()
+        time.sleep(1.0)  # 等各进程完成 import
+        begin = time.perf_counter()
+        start.set()
+        for proc in procs:
+            proc.join()
+        elapsed = (time.perf_counter() - begin) * 1000
+    print(
+        f"{backend_name:>6}: {args.workers} 进程 × {args.threads} 线程 × {args.symbols} 代码 | "
+        f"上游调用 {calls.value} 次（理想 {args.symbols}）| {elapsed:.0f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="跨 worker 共享缓存基准")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--symbols", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    args = parser.parse_args()
+    _run("memory", args)
+    _run("sqlite", args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""惊群场景下的上游调用次数：N 个并发 /api/estimate 等价调用 estimate_codes。
+
+用登记到 provider 注册表的慢速桩 provider 统计真实上游调用次数，分别在
+关闭/开启 single-flight 时运行同一组并发请求。
+
+用法：python benchmarks/bench_singleflight.py [--clients 10 --latency-ms 50]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+os.environ["HOLDINGS_PROVIDER"] = "bench"
+os.environ["QUOTE_PROVIDER"] = "bench"
+
+from app import config
+from app.providers.base import Holding, HoldingsProvider, QuoteProvider
+from app.providers.singleflight import UPSTREAM_FLIGHT
+from app.services.estimate import estimate_codes
+
+CALLS: Counter = Counter()
+CALLS_LOCK = threading.Lock()
+LATENCY = 0.05
+CODES = ["270042", "006479", "005698", "161128"]
+
+
+def _upstream(kind: str) -> None:
+    with CALLS_LOCK:
+        CALLS[kind] += 1
+    time.sleep(LATENCY)
+
+
+class SlowHoldingsProvider(HoldingsProvider):
+    def get_fund_name(self, code: str) -> str:
+        _upstream("name")
+        return f"基金{code}"
+
+    def get_latest_holdings(self, code: str) -> Tuple[List[Holding], str, str]:
+        _upstream("holdings")
+        return [Holding(symbol=f"60000{i}", name=f"股票{i}", weight=5.0) for i in range(8)], "2024年4季度", "bench"
+
+
+class SlowQuoteProvider(QuoteProvider):
+    def __init__(self, quote_cache: Optional[Dict[str, Optional[float]]] = None) -> None:
+        self.quote_cache = quote_cache if quote_cache is not None else {}
+
+    def get_pct_change(self, symbol: str) -> Optional[float]:
+        if symbol in self.quote_cache:
+            return self.quote_cache[symbol]
+        _upstream("quote")
+        self.quote_cache[symbol] = 1.0
+        return 1.0
+
+
+def _herd(clients: int) -> float:
+    CALLS.clear()
+    threads = [threading.Thread(target=estimate_codes, args=(CODES,)) for _ in range(clients)]
+    begin = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return (time.perf_counter() - begin) * 1000
+
+
+def main() -> None:
+    global LATENCY
+    parser = argparse.ArgumentParser(description="single-flight 惊群基准")
+    parser.add_argument("--clients", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    args = parser.parse_args()
+    LATENCY = args.latency_ms / 1000
+
+    config.HOLDINGS_PROVIDERS["bench"] = (__name__, "SlowHoldingsProvider")
+    config.QUOTE_PROVIDERS["bench"] = (__name__, "SlowQuoteProvider")
+
+    original_do = UPSTREAM_FLIGHT.do
+    UPSTREAM_FLIGHT.do = lambda key, fn: fn()  # type: ignore[method-assign]
+    elapsed = _herd(args.clients)
+    print(f"关闭 single-flight: {args.clients} 个并发请求 {elapsed:.0f} ms | 上游调用 {dict(CALLS)}")
+
+    UPSTREAM_FLIGHT.do = original_do  # type: ignore[method-assign]
+    elapsed = _herd(args.clients)
+    print(f"开启 single-flight: {args.clients} 个并发请求 {elapsed:.0f} ms | 上游调用 {dict(CALLS)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""启动耗时报告：用 `python -X importtime` 统计入口模块的 import 开销。
+
+每个入口在全新子进程里 import，汇总累计耗时与最重的若干模块，并检查 mock 模式下
+不应被加载的重依赖。超过 --max-ms 或出现禁止模块时以非零码退出，可用作回归守护。
+
+用法：python benchmarks/bench_startup.py [--max-ms 300] [--top 8]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+ENTRYPOINTS = ["app.config", "app.services.estimate", "app.serve_stdlib", "app.main"]
+# mock provider 下不应出现在 import 链中的模块
+FORBIDDEN_MODULES = {"akshare", "pandas", "numpy"}
+
+
+def _import_profile(module: str) -> Tuple[int, List[Tuple[int, int, str]]]:
+    env = dict(os.environ)
+    for key in ("HOLDINGS_PROVIDER", "QUOTE_PROVIDER", "INDEX_PROVIDER", "GOLD_PROVIDER"):
+        env[key] = "mock"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f"import {module} 失败")
+
+    rows: List[Tuple[int, int, str]] = []
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        depth = len(name) - len(name.lstrip())
+        rows.append((int(self_us), int(cumulative_us), name.strip()))
+        if depth == 1:
+            total_us += int(cumulative_us)
+    return total_us, rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="入口模块 import 耗时报告")
+    parser.add_argument("--max-ms", type=float, default=0.0, help="任一入口超过该值即失败（0 表示不检查）")
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args()
+
+    failed = False
+    report: Dict[str, float] = {}
+    for module in ENTRYPOINTS:
+        try:
+            total_us, rows = _import_profile(module)
+        except RuntimeError as exc:
+            print(f"{module}: 跳过（{exc}）")
+            continue
+
+        report[module] = total_us / 1000
+        loaded = {name.split(".")[0] for _, _, name in rows}
+        forbidden = sorted(FORBIDDEN_MODULES & loaded)
+        print(f"{module}: {total_us / 1000:.1f} ms, {len(rows)} 个模块")
+        for self_us, cumulative_us, name in sorted(rows, key=lambda r: r[0], reverse=True)[: args.top]:
+            print(f"    self {self_us / 1000:7.1f} ms | cumulative {cumulative_us / 1000:7.1f} ms | {name}")
+        if forbidden:
+            print(f"    !! mock 模式下加载了重依赖: {', '.join(forbidden)}")
+            failed = True
+        if args.max_ms and total_us / 1000 > args.max_ms:
+            print(f"    !! 超过阈值 {args.max_ms:.0f} ms")
+            failed = True
+
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
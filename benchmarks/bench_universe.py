@@ -0,0 +1,88 @@
+"""全市场估值基准：合成 --funds 只基金 × --holdings 只持仓的 CSR 持仓全集，
+统计一次全量重算（按一份行情快照）与 top-k 选择的耗时，以及内存占用。
+
+对照组为按基金逐只构造 Holding 列表、逐条累加的 dict 实现。
+
+用法：python benchmarks/bench_universe.py [--funds 10000 --holdings 200 --symbols 5000 --rounds 5]
+"""
+from __future__ import annotations
+
+import argparse
+import heapq
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.providers.base import Holding
+from app.services.universe import HoldingsUniverse
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="全市场 CSR 持仓重算基准")
+    parser.add_argument("--funds", type=int, default=10000)
+    parser.add_argument("--holdings", type=int, default=200)
+    parser.add_argument("--symbols", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    symbols = [f"{600000 + i}" for i in range(args.symbols)]
+    plan = [
+        (f"{100000 + f}", [(symbols[j], rng.uniform(0.05, 0.9)) for j in rng.sample(range(args.symbols), args.holdings)])
+        for f in range(args.funds)
+    ]
+    pcts = {s: (None if rng.random() < 0.02 else rng.gauss(0, 2)) for s in symbols}
+
+    tracemalloc.start()
+    universe = HoldingsUniverse()
+    for code, rows in plan:
+        universe.add_fund(code, f"基金{code}", rows)
+    csr_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    dict_store = {code: [Holding(symbol=s, name=s, weight=w) for s, w in rows] for code, rows in plan}
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    info = universe.nbytes()
+    print(
+        f"{info['funds']} 只基金 / {info['entries']} 条持仓 / {info['symbols']} 只成分 | "
+        f"CSR 数组 {info['array_bytes'] / 1e6:.1f} MB，含代码名称等 {csr_bytes / 1e6:.1f} MB | "
+        f"Holding 列表 {dict_bytes / 1e6:.1f} MB"
+    )
+
+    universe.compute(pcts)  # 预热 numpy import
+    begin = time.perf_counter()
+    for _ in range(args.rounds):
+        estimated, _ = universe.compute(pcts)
+    csr_ms = (time.perf_counter() - begin) * 1000 / args.rounds
+
+    begin = time.perf_counter()
+    heapq.nlargest(20, range(len(estimated)), key=estimated.__getitem__)
+    topk_ms = (time.perf_counter() - begin) * 1000
+
+    begin = time.perf_counter()
+    baseline = {}
+    for code, holdings in dict_store.items():
+        total = 0.0
+        for h in holdings:
+            pct = pcts.get(h.symbol)
+            if pct is not None:
+                total += h.weight * pct / 100.0
+        baseline[code] = total
+    dict_ms = (time.perf_counter() - begin) * 1000
+
+    drift = max(abs(baseline[code] - estimated[i]) for i, code in enumerate(universe.codes))
+    print(f"CSR 全量重算: {csr_ms:.1f} ms/次 | top-20 堆选择: {topk_ms:.1f} ms | 逐只 dict 累加: {dict_ms:.1f} ms")
+    print(f"与逐只累加结果最大偏差（float32 权重）: {drift:.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+var apidata={ content:"<div class='box'><div class='boxitem w790'><h4 class='t'><label class='left'><a href='http:\/\/fund.eastmoney.com\/006479.html'>广发纳斯达克100ETF联接人民币(QDII)C<\/a>&nbsp;&nbsp;2024年4季度股票投资明细<\/label><label class='right lab2 xq505'>&nbsp;&nbsp;&nbsp;&nbsp;来源：<a href='http:\/\/fund.eastmoney.com\/f10\/jjgg.html'>2024年4季度报告<\/a>&nbsp;&nbsp;&nbsp;&nbsp;截止至：<font class='px12'>2024-12-31<\/font><\/label><\/h4><div class='space0'><\/div><table class='w782 comm tzxq'><thead><tr><th>序号<\/th><th>股票代码<\/th><th>股票名称<\/th><th>最新价<\/th><th>涨跌幅<\/th><th class='xglj'>相关资讯<\/th><th>占净值<br \/>比例<\/th><th class='cgs'>持股数<br \/>（万股）<\/th><th class='cgs'>持仓市值<br \/>（万元）<\/th><\/tr><\/thead><tbody><tr><td>1<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/1.600519'>600519<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/1.600519'>贵州茅台<\/a><\/td><td class='tor'><span id='dq1.600519'><\/span><\/td><td class='tor'><span id='zd1.600519'><\/span><\/td><td class='xglj'><a href='ccbdxq_600519.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,600519.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/1.600519'>行情<\/a><\/td><td class='tor'>8.86%<\/td><td class='tor'>398.27<\/td><td class='tor'>77,477.16<\/td><\/tr><tr><td>2<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/0.000858'>000858<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/0.000858'>五粮液<\/a><\/td><td class='tor'><span id='dq0.000858'><\/span><\/td><td class='tor'><span id='zd0.000858'><\/span><\/td><td class='xglj'><a href='ccbdxq_000858.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,000858.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/0.000858'>行情<\/a><\/td><td class='tor'>9.04%<\/td><td class='tor'>449.56<\/td><td class='tor'>18,985.88<\/td><\/tr><tr><td>3<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/0.300750'>300750<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/0.300750'>宁德时代<\/a><\/td><td class='tor'><span id='dq0.300750'><\/span><\/td><td class='tor'><span id='zd0.300750'><\/span><\/td><td class='xglj'><a href='ccbdxq_300750.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,300750.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/0.300750'>行情<\/a><\/td><td class='tor'>5.86%<\/td><td class='tor'>125.52<\/td><td class='tor'>9,341.15<\/td><\/tr><tr><td>4<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/1.601318'>601318<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/1.601318'>中国平安<\/a><\/td><td class='tor'><span id='dq1.601318'><\/span><\/td><td class='tor'><span id='zd1.601318'><\/span><\/td><td class='xglj'><a href='ccbdxq_601318.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,601318.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/1.601318'>行情<\/a><\/td><td class='tor'>8.43%<\/td><td class='tor'>390.28<\/td><td class='tor'>79,583.71<\/td><\/tr><tr><td>5<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/0.000333'>000333<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/0.000333'>美的集团<\/a><\/td><td class='tor'><span id='dq0.000333'><\/span><\/td><td class='tor'><span id='zd0.000333'><\/span><\/td><td class='xglj'><a href='ccbdxq_000333.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,000333.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/0.000333'>行情<\/a><\/td><td class='tor'>6.18%<\/td><td class='tor'>203.78<\/td><td class='tor'>55,897.47<\/td><\/tr><tr><td>6<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/1.600036'>600036<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/1.600036'>招商银行<\/a><\/td><td class='tor'><span id='dq1.600036'><\/span><\/td><td class='tor'><span id='zd1.600036'><\/span><\/td><td class='xglj'><a href='ccbdxq_600036.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,600036.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/1.600036'>行情<\/a><\/td><td class='tor'>2.32%<\/td><td class='tor'>78.12<\/td><td class='tor'>83,696.30<\/td><\/tr><tr><td>7<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/0.002594'>002594<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/0.002594'>比亚迪<\/a><\/td><td class='tor'><span id='dq0.002594'><\/span><\/td><td class='tor'><span id='zd0.002594'><\/span><\/td><td class='xglj'><a href='ccbdxq_002594.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,002594.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/0.002594'>行情<\/a><\/td><td class='tor'>2.13%<\/td><td class='tor'>432.44<\/td><td class='tor'>87,860.92<\/td><\/tr><tr><td>8<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/1.688981'>688981<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/1.688981'>中芯国际<\/a><\/td><td class='tor'><span id='dq1.688981'><\/span><\/td><td class='tor'><span id='zd1.688981'><\/span><\/td><td class='xglj'><a href='ccbdxq_688981.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,688981.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/1.688981'>行情<\/a><\/td><td class='tor'>--<\/td><td class='tor'>405.58<\/td><td class='tor'>79,339.32<\/td><\/tr><tr><td>9<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/116.00700'>00700<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/116.00700'>腾讯控股<\/a><\/td><td class='tor'><span id='dq116.00700'><\/span><\/td><td class='tor'><span id='zd116.00700'><\/span><\/td><td class='xglj'><a href='ccbdxq_00700.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,00700.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/116.00700'>行情<\/a><\/td><td class='tor'>3.74%<\/td><td class='tor'>13.37<\/td><td class='tor'>66,317.15<\/td><\/tr><tr><td>10<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/0.300059'>300059<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/0.300059'>东方财富<\/a><\/td><td class='tor'><span id='dq0.300059'><\/span><\/td><td class='tor'><span id='zd0.300059'><\/span><\/td><td class='xglj'><a href='ccbdxq_300059.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,300059.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/0.300059'>行情<\/a><\/td><td class='tor'>9.00%<\/td><td class='tor'>166.76<\/td><td class='tor'>83,780.35<\/td><\/tr><\/tbody><\/table><\/div><\/div><div class='box'><div class='boxitem w790'><h4 class='t'><label class='left'><a href='http:\/\/fund.eastmoney.com\/006479.html'>广发纳斯达克100ETF联接人民币(QDII)C<\/a>&nbsp;&nbsp;2024年3季度股票投资明细<\/label><label class='right lab2 xq505'>&nbsp;&nbsp;&nbsp;&nbsp;来源：<a href='http:\/\/fund.eastmoney.com\/f10\/jjgg.html'>2024年3季度报告<\/a>&nbsp;&nbsp;&nbsp;&nbsp;截止至：<font class='px12'>2024-12-31<\/font><\/label><\/h4><div class='space0'><\/div><table class='w782 comm tzxq'><thead><tr><th>序号<\/th><th>股票代码<\/th><th>股票名称<\/th><th class='xglj'>相关资讯<\/th><th>占净值<br \/>比例<\/th><th class='cgs'>持股数<br \/>（万股）<\/th><th class='cgs'>持仓市值<br \/>（万元）<\/th><\/tr><\/thead><tbody><tr><td>1<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/1.600519'>600519<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/1.600519'>贵州茅台<\/a><\/td><td class='xglj'><a href='ccbdxq_600519.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,600519.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/1.600519'>行情<\/a><\/td><td class='tor'>8.14%<\/td><td class='tor'>408.48<\/td><td class='tor'>41,481.26<\/td><\/tr><tr><td>2<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/0.000858'>000858<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/0.000858'>五粮液<\/a><\/td><td class='xglj'><a href='ccbdxq_000858.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,000858.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/0.000858'>行情<\/a><\/td><td class='tor'>8.69%<\/td><td class='tor'>153.29<\/td><td class='tor'>71,601.56<\/td><\/tr><tr><td>3<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/0.300750'>300750<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/0.300750'>宁德时代<\/a><\/td><td class='xglj'><a href='ccbdxq_300750.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,300750.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/0.300750'>行情<\/a><\/td><td class='tor'>8.22%<\/td><td class='tor'>114.57<\/td><td class='tor'>2,227.43<\/td><\/tr><tr><td>4<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/1.601318'>601318<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/1.601318'>中国平安<\/a><\/td><td class='xglj'><a href='ccbdxq_601318.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,601318.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/1.601318'>行情<\/a><\/td><td class='tor'>3.37%<\/td><td class='tor'>97.37<\/td><td class='tor'>29,610.75<\/td><\/tr><tr><td>5<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/0.000333'>000333<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/0.000333'>美的集团<\/a><\/td><td class='xglj'><a href='ccbdxq_000333.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,000333.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/0.000333'>行情<\/a><\/td><td class='tor'>8.01%<\/td><td class='tor'>432.31<\/td><td class='tor'>87,023.33<\/td><\/tr><tr><td>6<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/1.600036'>600036<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/1.600036'>招商银行<\/a><\/td><td class='xglj'><a href='ccbdxq_600036.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,600036.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/1.600036'>行情<\/a><\/td><td class='tor'>1.96%<\/td><td class='tor'>140.28<\/td><td class='tor'>57,769.21<\/td><\/tr><tr><td>7<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/0.002594'>002594<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/0.002594'>比亚迪<\/a><\/td><td class='xglj'><a href='ccbdxq_002594.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,002594.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/0.002594'>行情<\/a><\/td><td class='tor'>8.76%<\/td><td class='tor'>200.44<\/td><td class='tor'>88,305.36<\/td><\/tr><tr><td>8<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/1.688981'>688981<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/1.688981'>中芯国际<\/a><\/td><td class='xglj'><a href='ccbdxq_688981.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,688981.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/1.688981'>行情<\/a><\/td><td class='tor'>--<\/td><td class='tor'>268.57<\/td><td class='tor'>84,537.42<\/td><\/tr><tr><td>9<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/116.00700'>00700<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/116.00700'>腾讯控股<\/a><\/td><td class='xglj'><a href='ccbdxq_00700.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,00700.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/116.00700'>行情<\/a><\/td><td class='tor'>8.64%<\/td><td class='tor'>58.56<\/td><td class='tor'>87,339.01<\/td><\/tr><tr><td>10<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/0.300059'>300059<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/0.300059'>东方财富<\/a><\/td><td class='xglj'><a href='ccbdxq_300059.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,300059.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/0.300059'>行情<\/a><\/td><td class='tor'>2.98%<\/td><td class='tor'>90.11<\/td><td class='tor'>86,631.83<\/td><\/tr><\/tbody><\/table><\/div><\/div><div class='box'><div class='boxitem w790'><h4 class='t'><label class='left'><a href='http:\/\/fund.eastmoney.com\/006479.html'>广发纳斯达克100ETF联接人民币(QDII)C<\/a>&nbsp;&nbsp;2024年2季度股票投资明细<\/label><label class='right lab2 xq505'>&nbsp;&nbsp;&nbsp;&nbsp;来源：<a href='http:\/\/fund.eastmoney.com\/f10\/jjgg.html'>2024年2季度报告<\/a>&nbsp;&nbsp;&nbsp;&nbsp;截止至：<font class='px12'>2024-12-31<\/font><\/label><\/h4><div class='space0'><\/div><table class='w782 comm tzxq'><thead><tr><th>序号<\/th><th>股票代码<\/th><th>股票名称<\/th><th class='xglj'>相关资讯<\/th><th>占净值<br \/>比例<\/th><th class='cgs'>持股数<br \/>（万股）<\/th><th class='cgs'>持仓市值<br \/>（万元）<\/th><\/tr><\/thead><tbody><tr><td>1<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/1.600519'>600519<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/1.600519'>贵州茅台<\/a><\/td><td class='xglj'><a href='ccbdxq_600519.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,600519.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/1.600519'>行情<\/a><\/td><td class='tor'>3.36%<\/td><td class='tor'>128.11<\/td><td class='tor'>63,819.80<\/td><\/tr><tr><td>2<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/0.000858'>000858<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/0.000858'>五粮液<\/a><\/td><td class='xglj'><a href='ccbdxq_000858.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,000858.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/0.000858'>行情<\/a><\/td><td class='tor'>1.96%<\/td><td class='tor'>1.84<\/td><td class='tor'>83,309.21<\/td><\/tr><tr><td>3<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/0.300750'>300750<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/0.300750'>宁德时代<\/a><\/td><td class='xglj'><a href='ccbdxq_300750.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,300750.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/0.300750'>行情<\/a><\/td><td class='tor'>4.87%<\/td><td class='tor'>269.69<\/td><td class='tor'>64,776.76<\/td><\/tr><tr><td>4<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/1.601318'>601318<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/1.601318'>中国平安<\/a><\/td><td class='xglj'><a href='ccbdxq_601318.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,601318.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/1.601318'>行情<\/a><\/td><td class='tor'>7.48%<\/td><td class='tor'>371.23<\/td><td class='tor'>60,389.50<\/td><\/tr><tr><td>5<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/0.000333'>000333<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/0.000333'>美的集团<\/a><\/td><td class='xglj'><a href='ccbdxq_000333.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,000333.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/0.000333'>行情<\/a><\/td><td class='tor'>3.79%<\/td><td class='tor'>182.75<\/td><td class='tor'>6,390.65<\/td><\/tr><tr><td>6<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/1.600036'>600036<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/1.600036'>招商银行<\/a><\/td><td class='xglj'><a href='ccbdxq_600036.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,600036.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/1.600036'>行情<\/a><\/td><td class='tor'>6.40%<\/td><td class='tor'>332.45<\/td><td class='tor'>29,784.98<\/td><\/tr><tr><td>7<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/0.002594'>002594<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/0.002594'>比亚迪<\/a><\/td><td class='xglj'><a href='ccbdxq_002594.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,002594.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/0.002594'>行情<\/a><\/td><td class='tor'>5.55%<\/td><td class='tor'>157.64<\/td><td class='tor'>76,336.57<\/td><\/tr><tr><td>8<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/1.688981'>688981<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/1.688981'>中芯国际<\/a><\/td><td class='xglj'><a href='ccbdxq_688981.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,688981.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/1.688981'>行情<\/a><\/td><td class='tor'>--<\/td><td class='tor'>360.16<\/td><td class='tor'>27,098.97<\/td><\/tr><tr><td>9<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/116.00700'>00700<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/116.00700'>腾讯控股<\/a><\/td><td class='xglj'><a href='ccbdxq_00700.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,00700.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/116.00700'>行情<\/a><\/td><td class='tor'>4.43%<\/td><td class='tor'>155.33<\/td><td class='tor'>36,814.52<\/td><\/tr><tr><td>10<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/0.300059'>300059<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/0.300059'>东方财富<\/a><\/td><td class='xglj'><a href='ccbdxq_300059.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,300059.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/0.300059'>行情<\/a><\/td><td class='tor'>6.13%<\/td><td class='tor'>201.80<\/td><td class='tor'>26,679.40<\/td><\/tr><\/tbody><\/table><\/div><\/div><div class='box'><div class='boxitem w790'><h4 class='t'><label class='left'><a href='http:\/\/fund.eastmoney.com\/006479.html'>广发纳斯达克100ETF联接人民币(QDII)C<\/a>&nbsp;&nbsp;2024年1季度股票投资明细<\/label><label class='right lab2 xq505'>&nbsp;&nbsp;&nbsp;&nbsp;来源：<a href='http:\/\/fund.eastmoney.com\/f10\/jjgg.html'>2024年1季度报告<\/a>&nbsp;&nbsp;&nbsp;&nbsp;截止至：<font class='px12'>2024-12-31<\/font><\/label><\/h4><div class='space0'><\/div><table class='w782 comm tzxq'><thead><tr><th>序号<\/th><th>股票代码<\/th><th>股票名称<\/th><th class='xglj'>相关资讯<\/th><th>占净值<br \/>比例<\/th><th class='cgs'>持股数<br \/>（万股）<\/th><th class='cgs'>持仓市值<br \/>（万元）<\/th><\/tr><\/thead><tbody><tr><td>1<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/1.600519'>600519<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/1.600519'>贵州茅台<\/a><\/td><td class='xglj'><a href='ccbdxq_600519.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,600519.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/1.600519'>行情<\/a><\/td><td class='tor'>2.13%<\/td><td class='tor'>144.17<\/td><td class='tor'>38,746.94<\/td><\/tr><tr><td>2<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/0.000858'>000858<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/0.000858'>五粮液<\/a><\/td><td class='xglj'><a href='ccbdxq_000858.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,000858.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/0.000858'>行情<\/a><\/td><td class='tor'>4.74%<\/td><td class='tor'>290.41<\/td><td class='tor'>58,958.04<\/td><\/tr><tr><td>3<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/0.300750'>300750<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/0.300750'>宁德时代<\/a><\/td><td class='xglj'><a href='ccbdxq_300750.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,300750.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/0.300750'>行情<\/a><\/td><td class='tor'>9.37%<\/td><td class='tor'>233.03<\/td><td class='tor'>39,850.17<\/td><\/tr><tr><td>4<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/1.601318'>601318<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/1.601318'>中国平安<\/a><\/td><td class='xglj'><a href='ccbdxq_601318.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,601318.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/1.601318'>行情<\/a><\/td><td class='tor'>7.03%<\/td><td class='tor'>107.64<\/td><td class='tor'>42,639.44<\/td><\/tr><tr><td>5<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/0.000333'>000333<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/0.000333'>美的集团<\/a><\/td><td class='xglj'><a href='ccbdxq_000333.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,000333.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/0.000333'>行情<\/a><\/td><td class='tor'>9.03%<\/td><td class='tor'>450.69<\/td><td class='tor'>71,662.63<\/td><\/tr><tr><td>6<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/1.600036'>600036<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/1.600036'>招商银行<\/a><\/td><td class='xglj'><a href='ccbdxq_600036.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,600036.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/1.600036'>行情<\/a><\/td><td class='tor'>6.48%<\/td><td class='tor'>85.68<\/td><td class='tor'>7,723.12<\/td><\/tr><tr><td>7<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/0.002594'>002594<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/0.002594'>比亚迪<\/a><\/td><td class='xglj'><a href='ccbdxq_002594.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,002594.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/0.002594'>行情<\/a><\/td><td class='tor'>3.68%<\/td><td class='tor'>258.21<\/td><td class='tor'>57,001.38<\/td><\/tr><tr><td>8<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/1.688981'>688981<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/1.688981'>中芯国际<\/a><\/td><td class='xglj'><a href='ccbdxq_688981.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,688981.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/1.688981'>行情<\/a><\/td><td class='tor'>--<\/td><td class='tor'>168.26<\/td><td class='tor'>73,676.27<\/td><\/tr><tr><td>9<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/116.00700'>00700<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/116.00700'>腾讯控股<\/a><\/td><td class='xglj'><a href='ccbdxq_00700.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,00700.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/116.00700'>行情<\/a><\/td><td class='tor'>5.88%<\/td><td class='tor'>375.82<\/td><td class='tor'>60,584.33<\/td><\/tr><tr><td>10<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/0.300059'>300059<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/0.300059'>东方财富<\/a><\/td><td class='xglj'><a href='ccbdxq_300059.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,300059.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/0.300059'>行情<\/a><\/td><td class='tor'>1.00%<\/td><td class='tor'>113.10<\/td><td class='tor'>18,001.78<\/td><\/tr><\/tbody><\/table><\/div><\/div>",arryear:[2024,2023],curyear:2024};
\ No newline at end of file
@@ -0,0 +1 @@
+var apidata={ content:"<div class='box'><div class='boxitem w790'><h4 class='t'><label class='left'><a href='http:\/\/fund.eastmoney.com\/270042.html'>广发纳斯达克100ETF联接人民币(QDII)A<\/a>&nbsp;&nbsp;2024年4季度股票投资明细<\/label><label class='right lab2 xq505'>&nbsp;&nbsp;&nbsp;&nbsp;来源：<a href='http:\/\/fund.eastmoney.com\/f10\/jjgg.html'>2024年4季度报告<\/a>&nbsp;&nbsp;&nbsp;&nbsp;截止至：<font class='px12'>2024-12-31<\/font><\/label><\/h4><div class='space0'><\/div><table class='w782 comm tzxq'><thead><tr><th>序号<\/th><th>股票代码<\/th><th>股票名称<\/th><th>最新价<\/th><th>涨跌幅<\/th><th class='xglj'>相关资讯<\/th><th>占净值<br \/>比例<\/th><th class='cgs'>持股数<br \/>（万股）<\/th><th class='cgs'>持仓市值<br \/>（万元）<\/th><\/tr><\/thead><tbody><tr><td>1<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.AAPL'>AAPL<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.AAPL'>Aapl公司<\/a><\/td><td class='tor'><span id='dq105.AAPL'><\/span><\/td><td class='tor'><span id='zd105.AAPL'><\/span><\/td><td class='xglj'><a href='ccbdxq_AAPL.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,AAPL.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.AAPL'>行情<\/a><\/td><td class='tor'>8.87%<\/td><td class='tor'>430.53<\/td><td class='tor'>1,132.14<\/td><\/tr><tr><td>2<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.MSFT'>MSFT<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.MSFT'>Msft公司<\/a><\/td><td class='tor'><span id='dq105.MSFT'><\/span><\/td><td class='tor'><span id='zd105.MSFT'><\/span><\/td><td class='xglj'><a href='ccbdxq_MSFT.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,MSFT.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.MSFT'>行情<\/a><\/td><td class='tor'>1.04%<\/td><td class='tor'>360.64<\/td><td class='tor'>61,385.76<\/td><\/tr><tr><td>3<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.NVDA'>NVDA<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.NVDA'>Nvda公司<\/a><\/td><td class='tor'><span id='dq105.NVDA'><\/span><\/td><td class='tor'><span id='zd105.NVDA'><\/span><\/td><td class='xglj'><a href='ccbdxq_NVDA.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,NVDA.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.NVDA'>行情<\/a><\/td><td class='tor'>0.09%<\/td><td class='tor'>268.95<\/td><td class='tor'>24,087.58<\/td><\/tr><tr><td>4<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.AMZN'>AMZN<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.AMZN'>Amzn公司<\/a><\/td><td class='tor'><span id='dq105.AMZN'><\/span><\/td><td class='tor'><span id='zd105.AMZN'><\/span><\/td><td class='xglj'><a href='ccbdxq_AMZN.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,AMZN.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.AMZN'>行情<\/a><\/td><td class='tor'>0.48%<\/td><td class='tor'>320.84<\/td><td class='tor'>10,128.54<\/td><\/tr><tr><td>5<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.META'>META<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.META'>Meta公司<\/a><\/td><td class='tor'><span id='dq105.META'><\/span><\/td><td class='tor'><span id='zd105.META'><\/span><\/td><td class='xglj'><a href='ccbdxq_META.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,META.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.META'>行情<\/a><\/td><td class='tor'>0.40%<\/td><td class='tor'>217.95<\/td><td class='tor'>40,889.76<\/td><\/tr><tr><td>6<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.AVGO'>AVGO<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.AVGO'>Avgo公司<\/a><\/td><td class='tor'><span id='dq105.AVGO'><\/span><\/td><td class='tor'><span id='zd105.AVGO'><\/span><\/td><td class='xglj'><a href='ccbdxq_AVGO.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,AVGO.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.AVGO'>行情<\/a><\/td><td class='tor'>1.19%<\/td><td class='tor'>476.95<\/td><td class='tor'>78,839.18<\/td><\/tr><tr><td>7<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.GOOGL'>GOOGL<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.GOOGL'>Googl公司<\/a><\/td><td class='tor'><span id='dq105.GOOGL'><\/span><\/td><td class='tor'><span id='zd105.GOOGL'><\/span><\/td><td class='xglj'><a href='ccbdxq_GOOGL.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,GOOGL.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.GOOGL'>行情<\/a><\/td><td class='tor'>1.10%<\/td><td class='tor'>132.43<\/td><td class='tor'>45,102.69<\/td><\/tr><tr><td>8<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.GOOG'>GOOG<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.GOOG'>Goog公司<\/a><\/td><td class='tor'><span id='dq105.GOOG'><\/span><\/td><td class='tor'><span id='zd105.GOOG'><\/span><\/td><td class='xglj'><a href='ccbdxq_GOOG.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,GOOG.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.GOOG'>行情<\/a><\/td><td class='tor'>1.43%<\/td><td class='tor'>90.15<\/td><td class='tor'>82,145.24<\/td><\/tr><tr><td>9<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.TSLA'>TSLA<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.TSLA'>Tsla公司<\/a><\/td><td class='tor'><span id='dq105.TSLA'><\/span><\/td><td class='tor'><span id='zd105.TSLA'><\/span><\/td><td class='xglj'><a href='ccbdxq_TSLA.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,TSLA.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.TSLA'>行情<\/a><\/td><td class='tor'>0.18%<\/td><td class='tor'>435.39<\/td><td class='tor'>26,930.19<\/td><\/tr><tr><td>10<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.COST'>COST<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.COST'>Cost公司<\/a><\/td><td class='tor'><span id='dq105.COST'><\/span><\/td><td class='tor'><span id='zd105.COST'><\/span><\/td><td class='xglj'><a href='ccbdxq_COST.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,COST.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.COST'>行情<\/a><\/td><td class='tor'>0.70%<\/td><td class='tor'>319.84<\/td><td class='tor'>54,846.42<\/td><\/tr><tr><td>11<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.NFLX'>NFLX<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.NFLX'>Nflx公司<\/a><\/td><td class='tor'><span id='dq105.NFLX'><\/span><\/td><td class='tor'><span id='zd105.NFLX'><\/span><\/td><td class='xglj'><a href='ccbdxq_NFLX.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,NFLX.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.NFLX'>行情<\/a><\/td><td class='tor'>0.10%<\/td><td class='tor'>77.27<\/td><td class='tor'>68,649.72<\/td><\/tr><tr><td>12<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.TMUS'>TMUS<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.TMUS'>Tmus公司<\/a><\/td><td class='tor'><span id='dq105.TMUS'><\/span><\/td><td class='tor'><span id='zd105.TMUS'><\/span><\/td><td class='xglj'><a href='ccbdxq_TMUS.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,TMUS.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.TMUS'>行情<\/a><\/td><td class='tor'>0.39%<\/td><td class='tor'>270.15<\/td><td class='tor'>70,098.52<\/td><\/tr><tr><td>13<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.AMD'>AMD<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.AMD'>Amd公司<\/a><\/td><td class='tor'><span id='dq105.AMD'><\/span><\/td><td class='tor'><span id='zd105.AMD'><\/span><\/td><td class='xglj'><a href='ccbdxq_AMD.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,AMD.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.AMD'>行情<\/a><\/td><td class='tor'>0.83%<\/td><td class='tor'>265.65<\/td><td class='tor'>151.41<\/td><\/tr><tr><td>14<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.PEP'>PEP<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.PEP'>百事可乐&amp;食品<\/a><\/td><td class='tor'><span id='dq105.PEP'><\/span><\/td><td class='tor'><span id='zd105.PEP'><\/span><\/td><td class='xglj'><a href='ccbdxq_PEP.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,PEP.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.PEP'>行情<\/a><\/td><td class='tor'>0.09%<\/td><td class='tor'>162.75<\/td><td class='tor'>1,850.96<\/td><\/tr><tr><td>15<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ADBE'>ADBE<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ADBE'>Adbe公司<\/a><\/td><td class='tor'><span id='dq105.ADBE'><\/span><\/td><td class='tor'><span id='zd105.ADBE'><\/span><\/td><td class='xglj'><a href='ccbdxq_ADBE.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,ADBE.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ADBE'>行情<\/a><\/td><td class='tor'>0.36%<\/td><td class='tor'>464.62<\/td><td class='tor'>79,097.10<\/td><\/tr><tr><td>16<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.LIN'>LIN<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.LIN'>Lin公司<\/a><\/td><td class='tor'><span id='dq105.LIN'><\/span><\/td><td class='tor'><span id='zd105.LIN'><\/span><\/td><td class='xglj'><a href='ccbdxq_LIN.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,LIN.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.LIN'>行情<\/a><\/td><td class='tor'>1.06%<\/td><td class='tor'>416.00<\/td><td class='tor'>27,745.52<\/td><\/tr><tr><td>17<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CSCO'>CSCO<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CSCO'>Csco公司<\/a><\/td><td class='tor'><span id='dq105.CSCO'><\/span><\/td><td class='tor'><span id='zd105.CSCO'><\/span><\/td><td class='xglj'><a href='ccbdxq_CSCO.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,CSCO.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CSCO'>行情<\/a><\/td><td class='tor'>0.89%<\/td><td class='tor'>29.90<\/td><td class='tor'>79,033.06<\/td><\/tr><tr><td>18<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.QCOM'>QCOM<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.QCOM'>Qcom公司<\/a><\/td><td class='tor'><span id='dq105.QCOM'><\/span><\/td><td class='tor'><span id='zd105.QCOM'><\/span><\/td><td class='xglj'><a href='ccbdxq_QCOM.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,QCOM.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.QCOM'>行情<\/a><\/td><td class='tor'>0.39%<\/td><td class='tor'>473.53<\/td><td class='tor'>7,800.25<\/td><\/tr><tr><td>19<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ISRG'>ISRG<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ISRG'>Isrg公司<\/a><\/td><td class='tor'><span id='dq105.ISRG'><\/span><\/td><td class='tor'><span id='zd105.ISRG'><\/span><\/td><td class='xglj'><a href='ccbdxq_ISRG.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,ISRG.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ISRG'>行情<\/a><\/td><td class='tor'>0.96%<\/td><td class='tor'>243.51<\/td><td class='tor'>6,322.21<\/td><\/tr><tr><td>20<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.INTU'>INTU<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.INTU'>Intu公司<\/a><\/td><td class='tor'><span id='dq105.INTU'><\/span><\/td><td class='tor'><span id='zd105.INTU'><\/span><\/td><td class='xglj'><a href='ccbdxq_INTU.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,INTU.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.INTU'>行情<\/a><\/td><td class='tor'>1.30%<\/td><td class='tor'>380.54<\/td><td class='tor'>68,948.52<\/td><\/tr><tr><td>21<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.TXN'>TXN<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.TXN'>Txn公司<\/a><\/td><td class='tor'><span id='dq105.TXN'><\/span><\/td><td class='tor'><span id='zd105.TXN'><\/span><\/td><td class='xglj'><a href='ccbdxq_TXN.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,TXN.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.TXN'>行情<\/a><\/td><td class='tor'>0.06%<\/td><td class='tor'>65.07<\/td><td class='tor'>42,827.89<\/td><\/tr><tr><td>22<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.BKNG'>BKNG<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.BKNG'>Bkng公司<\/a><\/td><td class='tor'><span id='dq105.BKNG'><\/span><\/td><td class='tor'><span id='zd105.BKNG'><\/span><\/td><td class='xglj'><a href='ccbdxq_BKNG.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,BKNG.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.BKNG'>行情<\/a><\/td><td class='tor'>1.30%<\/td><td class='tor'>275.35<\/td><td class='tor'>23,928.59<\/td><\/tr><tr><td>23<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.AMGN'>AMGN<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.AMGN'>Amgn公司<\/a><\/td><td class='tor'><span id='dq105.AMGN'><\/span><\/td><td class='tor'><span id='zd105.AMGN'><\/span><\/td><td class='xglj'><a href='ccbdxq_AMGN.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,AMGN.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.AMGN'>行情<\/a><\/td><td class='tor'>1.13%<\/td><td class='tor'>436.34<\/td><td class='tor'>38,140.10<\/td><\/tr><tr><td>24<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CMCSA'>CMCSA<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CMCSA'>Cmcsa公司<\/a><\/td><td class='tor'><span id='dq105.CMCSA'><\/span><\/td><td class='tor'><span id='zd105.CMCSA'><\/span><\/td><td class='xglj'><a href='ccbdxq_CMCSA.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,CMCSA.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CMCSA'>行情<\/a><\/td><td class='tor'>0.58%<\/td><td class='tor'>106.69<\/td><td class='tor'>48,582.72<\/td><\/tr><tr><td>25<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.HON'>HON<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.HON'>Hon公司<\/a><\/td><td class='tor'><span id='dq105.HON'><\/span><\/td><td class='tor'><span id='zd105.HON'><\/span><\/td><td class='xglj'><a href='ccbdxq_HON.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,HON.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.HON'>行情<\/a><\/td><td class='tor'>0.29%<\/td><td class='tor'>365.24<\/td><td class='tor'>18,183.48<\/td><\/tr><tr><td>26<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.AMAT'>AMAT<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.AMAT'>Amat公司<\/a><\/td><td class='tor'><span id='dq105.AMAT'><\/span><\/td><td class='tor'><span id='zd105.AMAT'><\/span><\/td><td class='xglj'><a href='ccbdxq_AMAT.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,AMAT.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.AMAT'>行情<\/a><\/td><td class='tor'>1.53%<\/td><td class='tor'>156.55<\/td><td class='tor'>89,563.93<\/td><\/tr><tr><td>27<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.PDD'>PDD<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.PDD'>Pdd公司<\/a><\/td><td class='tor'><span id='dq105.PDD'><\/span><\/td><td class='tor'><span id='zd105.PDD'><\/span><\/td><td class='xglj'><a href='ccbdxq_PDD.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,PDD.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.PDD'>行情<\/a><\/td><td class='tor'>0.57%<\/td><td class='tor'>325.29<\/td><td class='tor'>39,485.20<\/td><\/tr><tr><td>28<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ARM'>ARM<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ARM'>Arm公司<\/a><\/td><td class='tor'><span id='dq105.ARM'><\/span><\/td><td class='tor'><span id='zd105.ARM'><\/span><\/td><td class='xglj'><a href='ccbdxq_ARM.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,ARM.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ARM'>行情<\/a><\/td><td class='tor'>0.19%<\/td><td class='tor'>259.27<\/td><td class='tor'>10,978.28<\/td><\/tr><tr><td>29<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.VRTX'>VRTX<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.VRTX'>Vrtx公司<\/a><\/td><td class='tor'><span id='dq105.VRTX'><\/span><\/td><td class='tor'><span id='zd105.VRTX'><\/span><\/td><td class='xglj'><a href='ccbdxq_VRTX.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,VRTX.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.VRTX'>行情<\/a><\/td><td class='tor'>0.20%<\/td><td class='tor'>113.12<\/td><td class='tor'>30,493.89<\/td><\/tr><tr><td>30<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ADP'>ADP<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ADP'>Adp公司<\/a><\/td><td class='tor'><span id='dq105.ADP'><\/span><\/td><td class='tor'><span id='zd105.ADP'><\/span><\/td><td class='xglj'><a href='ccbdxq_ADP.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,ADP.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ADP'>行情<\/a><\/td><td class='tor'>1.36%<\/td><td class='tor'>294.57<\/td><td class='tor'>20,787.31<\/td><\/tr><tr><td>31<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.PANW'>PANW<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.PANW'>Panw公司<\/a><\/td><td class='tor'><span id='dq105.PANW'><\/span><\/td><td class='tor'><span id='zd105.PANW'><\/span><\/td><td class='xglj'><a href='ccbdxq_PANW.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,PANW.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.PANW'>行情<\/a><\/td><td class='tor'>0.99%<\/td><td class='tor'>110.89<\/td><td class='tor'>6,482.28<\/td><\/tr><tr><td>32<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.MU'>MU<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.MU'>Mu公司<\/a><\/td><td class='tor'><span id='dq105.MU'><\/span><\/td><td class='tor'><span id='zd105.MU'><\/span><\/td><td class='xglj'><a href='ccbdxq_MU.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,MU.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.MU'>行情<\/a><\/td><td class='tor'>1.30%<\/td><td class='tor'>315.92<\/td><td class='tor'>20,681.87<\/td><\/tr><tr><td>33<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.GILD'>GILD<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.GILD'>Gild公司<\/a><\/td><td class='tor'><span id='dq105.GILD'><\/span><\/td><td class='tor'><span id='zd105.GILD'><\/span><\/td><td class='xglj'><a href='ccbdxq_GILD.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,GILD.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.GILD'>行情<\/a><\/td><td class='tor'>1.18%<\/td><td class='tor'>452.80<\/td><td class='tor'>77,381.22<\/td><\/tr><tr><td>34<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.SBUX'>SBUX<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.SBUX'>Sbux公司<\/a><\/td><td class='tor'><span id='dq105.SBUX'><\/span><\/td><td class='tor'><span id='zd105.SBUX'><\/span><\/td><td class='xglj'><a href='ccbdxq_SBUX.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,SBUX.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.SBUX'>行情<\/a><\/td><td class='tor'>0.88%<\/td><td class='tor'>36.36<\/td><td class='tor'>21,496.62<\/td><\/tr><tr><td>35<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ADI'>ADI<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ADI'>Adi公司<\/a><\/td><td class='tor'><span id='dq105.ADI'><\/span><\/td><td class='tor'><span id='zd105.ADI'><\/span><\/td><td class='xglj'><a href='ccbdxq_ADI.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,ADI.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ADI'>行情<\/a><\/td><td class='tor'>1.56%<\/td><td class='tor'>334.82<\/td><td class='tor'>19,359.89<\/td><\/tr><tr><td>36<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.MELI'>MELI<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.MELI'>Meli公司<\/a><\/td><td class='tor'><span id='dq105.MELI'><\/span><\/td><td class='tor'><span id='zd105.MELI'><\/span><\/td><td class='xglj'><a href='ccbdxq_MELI.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,MELI.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.MELI'>行情<\/a><\/td><td class='tor'>0.64%<\/td><td class='tor'>67.02<\/td><td class='tor'>84,202.73<\/td><\/tr><tr><td>37<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.LRCX'>LRCX<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.LRCX'>Lrcx公司<\/a><\/td><td class='tor'><span id='dq105.LRCX'><\/span><\/td><td class='tor'><span id='zd105.LRCX'><\/span><\/td><td class='xglj'><a href='ccbdxq_LRCX.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,LRCX.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.LRCX'>行情<\/a><\/td><td class='tor'>0.91%<\/td><td class='tor'>285.95<\/td><td class='tor'>42,593.13<\/td><\/tr><tr><td>38<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.MDLZ'>MDLZ<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.MDLZ'>Mdlz公司<\/a><\/td><td class='tor'><span id='dq105.MDLZ'><\/span><\/td><td class='tor'><span id='zd105.MDLZ'><\/span><\/td><td class='xglj'><a href='ccbdxq_MDLZ.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,MDLZ.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.MDLZ'>行情<\/a><\/td><td class='tor'>1.34%<\/td><td class='tor'>392.53<\/td><td class='tor'>72,693.98<\/td><\/tr><tr><td>39<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.INTC'>INTC<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.INTC'>Intc公司<\/a><\/td><td class='tor'><span id='dq105.INTC'><\/span><\/td><td class='tor'><span id='zd105.INTC'><\/span><\/td><td class='xglj'><a href='ccbdxq_INTC.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,INTC.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.INTC'>行情<\/a><\/td><td class='tor'>1.01%<\/td><td class='tor'>96.01<\/td><td class='tor'>8,814.08<\/td><\/tr><tr><td>40<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CTAS'>CTAS<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CTAS'>Ctas公司<\/a><\/td><td class='tor'><span id='dq105.CTAS'><\/span><\/td><td class='tor'><span id='zd105.CTAS'><\/span><\/td><td class='xglj'><a href='ccbdxq_CTAS.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,CTAS.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CTAS'>行情<\/a><\/td><td class='tor'>1.39%<\/td><td class='tor'>216.09<\/td><td class='tor'>38,179.72<\/td><\/tr><tr><td>41<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.KLAC'>KLAC<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.KLAC'>Klac公司<\/a><\/td><td class='tor'><span id='dq105.KLAC'><\/span><\/td><td class='tor'><span id='zd105.KLAC'><\/span><\/td><td class='xglj'><a href='ccbdxq_KLAC.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,KLAC.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.KLAC'>行情<\/a><\/td><td class='tor'>0.94%<\/td><td class='tor'>234.05<\/td><td class='tor'>65,643.92<\/td><\/tr><tr><td>42<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.REGN'>REGN<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.REGN'>Regn公司<\/a><\/td><td class='tor'><span id='dq105.REGN'><\/span><\/td><td class='tor'><span id='zd105.REGN'><\/span><\/td><td class='xglj'><a href='ccbdxq_REGN.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,REGN.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.REGN'>行情<\/a><\/td><td class='tor'>1.14%<\/td><td class='tor'>337.01<\/td><td class='tor'>88,576.45<\/td><\/tr><tr><td>43<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.PYPL'>PYPL<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.PYPL'>Pypl公司<\/a><\/td><td class='tor'><span id='dq105.PYPL'><\/span><\/td><td class='tor'><span id='zd105.PYPL'><\/span><\/td><td class='xglj'><a href='ccbdxq_PYPL.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,PYPL.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.PYPL'>行情<\/a><\/td><td class='tor'>0.12%<\/td><td class='tor'>50.11<\/td><td class='tor'>36,295.65<\/td><\/tr><tr><td>44<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.SNPS'>SNPS<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.SNPS'>Snps公司<\/a><\/td><td class='tor'><span id='dq105.SNPS'><\/span><\/td><td class='tor'><span id='zd105.SNPS'><\/span><\/td><td class='xglj'><a href='ccbdxq_SNPS.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,SNPS.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.SNPS'>行情<\/a><\/td><td class='tor'>0.40%<\/td><td class='tor'>170.31<\/td><td class='tor'>77,564.36<\/td><\/tr><tr><td>45<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CDNS'>CDNS<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CDNS'>Cdns公司<\/a><\/td><td class='tor'><span id='dq105.CDNS'><\/span><\/td><td class='tor'><span id='zd105.CDNS'><\/span><\/td><td class='xglj'><a href='ccbdxq_CDNS.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,CDNS.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CDNS'>行情<\/a><\/td><td class='tor'>0.50%<\/td><td class='tor'>125.08<\/td><td class='tor'>17,199.78<\/td><\/tr><tr><td>46<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CRWD'>CRWD<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CRWD'>Crwd公司<\/a><\/td><td class='tor'><span id='dq105.CRWD'><\/span><\/td><td class='tor'><span id='zd105.CRWD'><\/span><\/td><td class='xglj'><a href='ccbdxq_CRWD.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,CRWD.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CRWD'>行情<\/a><\/td><td class='tor'>0.17%<\/td><td class='tor'>224.86<\/td><td class='tor'>38,027.16<\/td><\/tr><tr><td>47<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.MAR'>MAR<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.MAR'>Mar公司<\/a><\/td><td class='tor'><span id='dq105.MAR'><\/span><\/td><td class='tor'><span id='zd105.MAR'><\/span><\/td><td class='xglj'><a href='ccbdxq_MAR.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,MAR.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.MAR'>行情<\/a><\/td><td class='tor'>0.41%<\/td><td class='tor'>139.99<\/td><td class='tor'>22,557.60<\/td><\/tr><tr><td>48<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.MRVL'>MRVL<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.MRVL'>Mrvl公司<\/a><\/td><td class='tor'><span id='dq105.MRVL'><\/span><\/td><td class='tor'><span id='zd105.MRVL'><\/span><\/td><td class='xglj'><a href='ccbdxq_MRVL.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,MRVL.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.MRVL'>行情<\/a><\/td><td class='tor'>0.21%<\/td><td class='tor'>461.71<\/td><td class='tor'>39,937.45<\/td><\/tr><tr><td>49<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CEG'>CEG<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CEG'>Ceg公司<\/a><\/td><td class='tor'><span id='dq105.CEG'><\/span><\/td><td class='tor'><span id='zd105.CEG'><\/span><\/td><td class='xglj'><a href='ccbdxq_CEG.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,CEG.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CEG'>行情<\/a><\/td><td class='tor'>0.48%<\/td><td class='tor'>430.81<\/td><td class='tor'>49,574.25<\/td><\/tr><tr><td>50<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ORLY'>ORLY<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ORLY'>Orly公司<\/a><\/td><td class='tor'><span id='dq105.ORLY'><\/span><\/td><td class='tor'><span id='zd105.ORLY'><\/span><\/td><td class='xglj'><a href='ccbdxq_ORLY.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,ORLY.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ORLY'>行情<\/a><\/td><td class='tor'>1.04%<\/td><td class='tor'>26.24<\/td><td class='tor'>89,935.49<\/td><\/tr><tr><td>51<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CSX'>CSX<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CSX'>Csx公司<\/a><\/td><td class='tor'><span id='dq105.CSX'><\/span><\/td><td class='tor'><span id='zd105.CSX'><\/span><\/td><td class='xglj'><a href='ccbdxq_CSX.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,CSX.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CSX'>行情<\/a><\/td><td class='tor'>0.62%<\/td><td class='tor'>418.18<\/td><td class='tor'>87,212.76<\/td><\/tr><tr><td>52<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ASML'>ASML<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ASML'>Asml公司<\/a><\/td><td class='tor'><span id='dq105.ASML'><\/span><\/td><td class='tor'><span id='zd105.ASML'><\/span><\/td><td class='xglj'><a href='ccbdxq_ASML.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,ASML.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ASML'>行情<\/a><\/td><td class='tor'>0.62%<\/td><td class='tor'>463.26<\/td><td class='tor'>76,397.75<\/td><\/tr><tr><td>53<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.FTNT'>FTNT<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.FTNT'>Ftnt公司<\/a><\/td><td class='tor'><span id='dq105.FTNT'><\/span><\/td><td class='tor'><span id='zd105.FTNT'><\/span><\/td><td class='xglj'><a href='ccbdxq_FTNT.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,FTNT.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.FTNT'>行情<\/a><\/td><td class='tor'>0.37%<\/td><td class='tor'>83.99<\/td><td class='tor'>43,759.14<\/td><\/tr><tr><td>54<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.DASH'>DASH<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.DASH'>Dash公司<\/a><\/td><td class='tor'><span id='dq105.DASH'><\/span><\/td><td class='tor'><span id='zd105.DASH'><\/span><\/td><td class='xglj'><a href='ccbdxq_DASH.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,DASH.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.DASH'>行情<\/a><\/td><td class='tor'>0.46%<\/td><td class='tor'>107.66<\/td><td class='tor'>36,153.52<\/td><\/tr><tr><td>55<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ADSK'>ADSK<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ADSK'>Adsk公司<\/a><\/td><td class='tor'><span id='dq105.ADSK'><\/span><\/td><td class='tor'><span id='zd105.ADSK'><\/span><\/td><td class='xglj'><a href='ccbdxq_ADSK.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,ADSK.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ADSK'>行情<\/a><\/td><td class='tor'>1.50%<\/td><td class='tor'>30.26<\/td><td class='tor'>34,169.68<\/td><\/tr><tr><td>56<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ROP'>ROP<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ROP'>Rop公司<\/a><\/td><td class='tor'><span id='dq105.ROP'><\/span><\/td><td class='tor'><span id='zd105.ROP'><\/span><\/td><td class='xglj'><a href='ccbdxq_ROP.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,ROP.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ROP'>行情<\/a><\/td><td class='tor'>1.05%<\/td><td class='tor'>492.67<\/td><td class='tor'>23,941.75<\/td><\/tr><tr><td>57<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.NXPI'>NXPI<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.NXPI'>Nxpi公司<\/a><\/td><td class='tor'><span id='dq105.NXPI'><\/span><\/td><td class='tor'><span id='zd105.NXPI'><\/span><\/td><td class='xglj'><a href='ccbdxq_NXPI.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,NXPI.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.NXPI'>行情<\/a><\/td><td class='tor'>0.99%<\/td><td class='tor'>392.25<\/td><td class='tor'>41,005.25<\/td><\/tr><tr><td>58<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.PCAR'>PCAR<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.PCAR'>Pcar公司<\/a><\/td><td class='tor'><span id='dq105.PCAR'><\/span><\/td><td class='tor'><span id='zd105.PCAR'><\/span><\/td><td class='xglj'><a href='ccbdxq_PCAR.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,PCAR.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.PCAR'>行情<\/a><\/td><td class='tor'>0.32%<\/td><td class='tor'>212.08<\/td><td class='tor'>86,162.86<\/td><\/tr><tr><td>59<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.TTD'>TTD<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.TTD'>Ttd公司<\/a><\/td><td class='tor'><span id='dq105.TTD'><\/span><\/td><td class='tor'><span id='zd105.TTD'><\/span><\/td><td class='xglj'><a href='ccbdxq_TTD.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,TTD.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.TTD'>行情<\/a><\/td><td class='tor'>1.18%<\/td><td class='tor'>497.72<\/td><td class='tor'>50,063.57<\/td><\/tr><tr><td>60<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.MNST'>MNST<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.MNST'>Mnst公司<\/a><\/td><td class='tor'><span id='dq105.MNST'><\/span><\/td><td class='tor'><span id='zd105.MNST'><\/span><\/td><td class='xglj'><a href='ccbdxq_MNST.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,MNST.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.MNST'>行情<\/a><\/td><td class='tor'>0.30%<\/td><td class='tor'>359.49<\/td><td class='tor'>14,016.23<\/td><\/tr><tr><td>61<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.WDAY'>WDAY<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.WDAY'>Wday公司<\/a><\/td><td class='tor'><span id='dq105.WDAY'><\/span><\/td><td class='tor'><span id='zd105.WDAY'><\/span><\/td><td class='xglj'><a href='ccbdxq_WDAY.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,WDAY.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.WDAY'>行情<\/a><\/td><td class='tor'>0.64%<\/td><td class='tor'>149.06<\/td><td class='tor'>87,186.97<\/td><\/tr><tr><td>62<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CPRT'>CPRT<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CPRT'>Cprt公司<\/a><\/td><td class='tor'><span id='dq105.CPRT'><\/span><\/td><td class='tor'><span id='zd105.CPRT'><\/span><\/td><td class='xglj'><a href='ccbdxq_CPRT.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,CPRT.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CPRT'>行情<\/a><\/td><td class='tor'>1.58%<\/td><td class='tor'>290.01<\/td><td class='tor'>48,843.35<\/td><\/tr><tr><td>63<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.AEP'>AEP<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.AEP'>Aep公司<\/a><\/td><td class='tor'><span id='dq105.AEP'><\/span><\/td><td class='tor'><span id='zd105.AEP'><\/span><\/td><td class='xglj'><a href='ccbdxq_AEP.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,AEP.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.AEP'>行情<\/a><\/td><td class='tor'>1.04%<\/td><td class='tor'>374.24<\/td><td class='tor'>5,239.16<\/td><\/tr><tr><td>64<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CHTR'>CHTR<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CHTR'>Chtr公司<\/a><\/td><td class='tor'><span id='dq105.CHTR'><\/span><\/td><td class='tor'><span id='zd105.CHTR'><\/span><\/td><td class='xglj'><a href='ccbdxq_CHTR.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,CHTR.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CHTR'>行情<\/a><\/td><td class='tor'>0.91%<\/td><td class='tor'>292.50<\/td><td class='tor'>45,306.25<\/td><\/tr><tr><td>65<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.PAYX'>PAYX<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.PAYX'>Payx公司<\/a><\/td><td class='tor'><span id='dq105.PAYX'><\/span><\/td><td class='tor'><span id='zd105.PAYX'><\/span><\/td><td class='xglj'><a href='ccbdxq_PAYX.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,PAYX.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.PAYX'>行情<\/a><\/td><td class='tor'>1.11%<\/td><td class='tor'>426.51<\/td><td class='tor'>14,253.20<\/td><\/tr><tr><td>66<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ODFL'>ODFL<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ODFL'>Odfl公司<\/a><\/td><td class='tor'><span id='dq105.ODFL'><\/span><\/td><td class='tor'><span id='zd105.ODFL'><\/span><\/td><td class='xglj'><a href='ccbdxq_ODFL.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,ODFL.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ODFL'>行情<\/a><\/td><td class='tor'>1.36%<\/td><td class='tor'>480.43<\/td><td class='tor'>7,302.02<\/td><\/tr><tr><td>67<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.KDP'>KDP<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.KDP'>Kdp公司<\/a><\/td><td class='tor'><span id='dq105.KDP'><\/span><\/td><td class='tor'><span id='zd105.KDP'><\/span><\/td><td class='xglj'><a href='ccbdxq_KDP.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,KDP.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.KDP'>行情<\/a><\/td><td class='tor'>1.25%<\/td><td class='tor'>93.73<\/td><td class='tor'>53,593.66<\/td><\/tr><tr><td>68<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ROST'>ROST<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ROST'>Rost公司<\/a><\/td><td class='tor'><span id='dq105.ROST'><\/span><\/td><td class='tor'><span id='zd105.ROST'><\/span><\/td><td class='xglj'><a href='ccbdxq_ROST.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,ROST.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ROST'>行情<\/a><\/td><td class='tor'>0.41%<\/td><td class='tor'>337.93<\/td><td class='tor'>21,244.83<\/td><\/tr><tr><td>69<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.FAST'>FAST<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.FAST'>Fast公司<\/a><\/td><td class='tor'><span id='dq105.FAST'><\/span><\/td><td class='tor'><span id='zd105.FAST'><\/span><\/td><td class='xglj'><a href='ccbdxq_FAST.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,FAST.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.FAST'>行情<\/a><\/td><td class='tor'>0.10%<\/td><td class='tor'>60.82<\/td><td class='tor'>80,136.83<\/td><\/tr><tr><td>70<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.DDOG'>DDOG<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.DDOG'>Ddog公司<\/a><\/td><td class='tor'><span id='dq105.DDOG'><\/span><\/td><td class='tor'><span id='zd105.DDOG'><\/span><\/td><td class='xglj'><a href='ccbdxq_DDOG.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,DDOG.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.DDOG'>行情<\/a><\/td><td class='tor'>0.54%<\/td><td class='tor'>123.86<\/td><td class='tor'>53,547.27<\/td><\/tr><tr><td>71<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.EA'>EA<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.EA'>Ea公司<\/a><\/td><td class='tor'><span id='dq105.EA'><\/span><\/td><td class='tor'><span id='zd105.EA'><\/span><\/td><td class='xglj'><a href='ccbdxq_EA.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,EA.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.EA'>行情<\/a><\/td><td class='tor'>0.46%<\/td><td class='tor'>310.07<\/td><td class='tor'>37,788.32<\/td><\/tr><tr><td>72<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.BKR'>BKR<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.BKR'>Bkr公司<\/a><\/td><td class='tor'><span id='dq105.BKR'><\/span><\/td><td class='tor'><span id='zd105.BKR'><\/span><\/td><td class='xglj'><a href='ccbdxq_BKR.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,BKR.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.BKR'>行情<\/a><\/td><td class='tor'>0.38%<\/td><td class='tor'>292.25<\/td><td class='tor'>47,098.17<\/td><\/tr><tr><td>73<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.AZN'>AZN<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.AZN'>Azn公司<\/a><\/td><td class='tor'><span id='dq105.AZN'><\/span><\/td><td class='tor'><span id='zd105.AZN'><\/span><\/td><td class='xglj'><a href='ccbdxq_AZN.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,AZN.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.AZN'>行情<\/a><\/td><td class='tor'>1.51%<\/td><td class='tor'>467.42<\/td><td class='tor'>18,462.90<\/td><\/tr><tr><td>74<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.KHC'>KHC<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.KHC'>Khc公司<\/a><\/td><td class='tor'><span id='dq105.KHC'><\/span><\/td><td class='tor'><span id='zd105.KHC'><\/span><\/td><td class='xglj'><a href='ccbdxq_KHC.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,KHC.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.KHC'>行情<\/a><\/td><td class='tor'>1.41%<\/td><td class='tor'>358.38<\/td><td class='tor'>21,557.87<\/td><\/tr><tr><td>75<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.VRSK'>VRSK<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.VRSK'>Vrsk公司<\/a><\/td><td class='tor'><span id='dq105.VRSK'><\/span><\/td><td class='tor'><span id='zd105.VRSK'><\/span><\/td><td class='xglj'><a href='ccbdxq_VRSK.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,VRSK.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.VRSK'>行情<\/a><\/td><td class='tor'>0.54%<\/td><td class='tor'>198.50<\/td><td class='tor'>60,484.95<\/td><\/tr><tr><td>76<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.LULU'>LULU<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.LULU'>Lulu公司<\/a><\/td><td class='tor'><span id='dq105.LULU'><\/span><\/td><td class='tor'><span id='zd105.LULU'><\/span><\/td><td class='xglj'><a href='ccbdxq_LULU.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,LULU.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.LULU'>行情<\/a><\/td><td class='tor'>1.07%<\/td><td class='tor'>150.70<\/td><td class='tor'>28,524.33<\/td><\/tr><tr><td>77<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CTSH'>CTSH<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CTSH'>Ctsh公司<\/a><\/td><td class='tor'><span id='dq105.CTSH'><\/span><\/td><td class='tor'><span id='zd105.CTSH'><\/span><\/td><td class='xglj'><a href='ccbdxq_CTSH.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,CTSH.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CTSH'>行情<\/a><\/td><td class='tor'>0.66%<\/td><td class='tor'>376.18<\/td><td class='tor'>6,621.63<\/td><\/tr><tr><td>78<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.GEHC'>GEHC<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.GEHC'>Gehc公司<\/a><\/td><td class='tor'><span id='dq105.GEHC'><\/span><\/td><td class='tor'><span id='zd105.GEHC'><\/span><\/td><td class='xglj'><a href='ccbdxq_GEHC.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,GEHC.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.GEHC'>行情<\/a><\/td><td class='tor'>1.47%<\/td><td class='tor'>229.68<\/td><td class='tor'>89,861.05<\/td><\/tr><tr><td>79<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.EXC'>EXC<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.EXC'>Exc公司<\/a><\/td><td class='tor'><span id='dq105.EXC'><\/span><\/td><td class='tor'><span id='zd105.EXC'><\/span><\/td><td class='xglj'><a href='ccbdxq_EXC.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,EXC.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.EXC'>行情<\/a><\/td><td class='tor'>0.76%<\/td><td class='tor'>498.05<\/td><td class='tor'>6,686.14<\/td><\/tr><tr><td>80<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.XEL'>XEL<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.XEL'>Xel公司<\/a><\/td><td class='tor'><span id='dq105.XEL'><\/span><\/td><td class='tor'><span id='zd105.XEL'><\/span><\/td><td class='xglj'><a href='ccbdxq_XEL.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,XEL.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.XEL'>行情<\/a><\/td><td class='tor'>0.46%<\/td><td class='tor'>107.36<\/td><td class='tor'>23,941.52<\/td><\/tr><tr><td>81<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.FANG'>FANG<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.FANG'>Fang公司<\/a><\/td><td class='tor'><span id='dq105.FANG'><\/span><\/td><td class='tor'><span id='zd105.FANG'><\/span><\/td><td class='xglj'><a href='ccbdxq_FANG.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,FANG.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.FANG'>行情<\/a><\/td><td class='tor'>0.43%<\/td><td class='tor'>466.70<\/td><td class='tor'>79,289.69<\/td><\/tr><tr><td>82<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.IDXX'>IDXX<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.IDXX'>Idxx公司<\/a><\/td><td class='tor'><span id='dq105.IDXX'><\/span><\/td><td class='tor'><span id='zd105.IDXX'><\/span><\/td><td class='xglj'><a href='ccbdxq_IDXX.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,IDXX.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.IDXX'>行情<\/a><\/td><td class='tor'>0.92%<\/td><td class='tor'>439.76<\/td><td class='tor'>33,320.49<\/td><\/tr><tr><td>83<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CCEP'>CCEP<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CCEP'>Ccep公司<\/a><\/td><td class='tor'><span id='dq105.CCEP'><\/span><\/td><td class='tor'><span id='zd105.CCEP'><\/span><\/td><td class='xglj'><a href='ccbdxq_CCEP.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,CCEP.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CCEP'>行情<\/a><\/td><td class='tor'>0.46%<\/td><td class='tor'>79.72<\/td><td class='tor'>75,053.67<\/td><\/tr><tr><td>84<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.TEAM'>TEAM<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.TEAM'>Team公司<\/a><\/td><td class='tor'><span id='dq105.TEAM'><\/span><\/td><td class='tor'><span id='zd105.TEAM'><\/span><\/td><td class='xglj'><a href='ccbdxq_TEAM.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,TEAM.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.TEAM'>行情<\/a><\/td><td class='tor'>0.96%<\/td><td class='tor'>352.07<\/td><td class='tor'>55,089.83<\/td><\/tr><tr><td>85<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CSGP'>CSGP<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CSGP'>Csgp公司<\/a><\/td><td class='tor'><span id='dq105.CSGP'><\/span><\/td><td class='tor'><span id='zd105.CSGP'><\/span><\/td><td class='xglj'><a href='ccbdxq_CSGP.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,CSGP.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CSGP'>行情<\/a><\/td><td class='tor'>1.44%<\/td><td class='tor'>493.63<\/td><td class='tor'>58,892.47<\/td><\/tr><tr><td>86<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ZS'>ZS<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ZS'>Zs公司<\/a><\/td><td class='tor'><span id='dq105.ZS'><\/span><\/td><td class='tor'><span id='zd105.ZS'><\/span><\/td><td class='xglj'><a href='ccbdxq_ZS.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,ZS.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ZS'>行情<\/a><\/td><td class='tor'>0.67%<\/td><td class='tor'>4.90<\/td><td class='tor'>73,557.66<\/td><\/tr><tr><td>87<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.MCHP'>MCHP<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.MCHP'>Mchp公司<\/a><\/td><td class='tor'><span id='dq105.MCHP'><\/span><\/td><td class='tor'><span id='zd105.MCHP'><\/span><\/td><td class='xglj'><a href='ccbdxq_MCHP.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,MCHP.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.MCHP'>行情<\/a><\/td><td class='tor'>0.39%<\/td><td class='tor'>150.39<\/td><td class='tor'>59,738.65<\/td><\/tr><tr><td>88<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ANSS'>ANSS<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ANSS'>Anss公司<\/a><\/td><td class='tor'><span id='dq105.ANSS'><\/span><\/td><td class='tor'><span id='zd105.ANSS'><\/span><\/td><td class='xglj'><a href='ccbdxq_ANSS.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,ANSS.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ANSS'>行情<\/a><\/td><td class='tor'>1.60%<\/td><td class='tor'>469.53<\/td><td class='tor'>12,172.77<\/td><\/tr><tr><td>89<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.DXCM'>DXCM<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.DXCM'>Dxcm公司<\/a><\/td><td class='tor'><span id='dq105.DXCM'><\/span><\/td><td class='tor'><span id='zd105.DXCM'><\/span><\/td><td class='xglj'><a href='ccbdxq_DXCM.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,DXCM.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.DXCM'>行情<\/a><\/td><td class='tor'>0.84%<\/td><td class='tor'>58.60<\/td><td class='tor'>9,722.53<\/td><\/tr><tr><td>90<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.TTWO'>TTWO<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.TTWO'>Ttwo公司<\/a><\/td><td class='tor'><span id='dq105.TTWO'><\/span><\/td><td class='tor'><span id='zd105.TTWO'><\/span><\/td><td class='xglj'><a href='ccbdxq_TTWO.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,TTWO.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.TTWO'>行情<\/a><\/td><td class='tor'>0.19%<\/td><td class='tor'>277.06<\/td><td class='tor'>24,584.10<\/td><\/tr><tr><td>91<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CDW'>CDW<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CDW'>Cdw公司<\/a><\/td><td class='tor'><span id='dq105.CDW'><\/span><\/td><td class='tor'><span id='zd105.CDW'><\/span><\/td><td class='xglj'><a href='ccbdxq_CDW.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,CDW.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.CDW'>行情<\/a><\/td><td class='tor'>0.12%<\/td><td class='tor'>302.81<\/td><td class='tor'>64,613.34<\/td><\/tr><tr><td>92<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ON'>ON<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ON'>On公司<\/a><\/td><td class='tor'><span id='dq105.ON'><\/span><\/td><td class='tor'><span id='zd105.ON'><\/span><\/td><td class='xglj'><a href='ccbdxq_ON.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,ON.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ON'>行情<\/a><\/td><td class='tor'>0.22%<\/td><td class='tor'>102.60<\/td><td class='tor'>57,117.99<\/td><\/tr><tr><td>93<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.GFS'>GFS<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.GFS'>Gfs公司<\/a><\/td><td class='tor'><span id='dq105.GFS'><\/span><\/td><td class='tor'><span id='zd105.GFS'><\/span><\/td><td class='xglj'><a href='ccbdxq_GFS.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,GFS.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.GFS'>行情<\/a><\/td><td class='tor'>1.02%<\/td><td class='tor'>132.73<\/td><td class='tor'>44,019.01<\/td><\/tr><tr><td>94<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.WBD'>WBD<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.WBD'>Wbd公司<\/a><\/td><td class='tor'><span id='dq105.WBD'><\/span><\/td><td class='tor'><span id='zd105.WBD'><\/span><\/td><td class='xglj'><a href='ccbdxq_WBD.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,WBD.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.WBD'>行情<\/a><\/td><td class='tor'>1.28%<\/td><td class='tor'>452.76<\/td><td class='tor'>76,164.72<\/td><\/tr><tr><td>95<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.BIIB'>BIIB<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.BIIB'>Biib公司<\/a><\/td><td class='tor'><span id='dq105.BIIB'><\/span><\/td><td class='tor'><span id='zd105.BIIB'><\/span><\/td><td class='xglj'><a href='ccbdxq_BIIB.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,BIIB.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.BIIB'>行情<\/a><\/td><td class='tor'>0.70%<\/td><td class='tor'>47.06<\/td><td class='tor'>38,179.46<\/td><\/tr><tr><td>96<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.MDB'>MDB<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.MDB'>Mdb公司<\/a><\/td><td class='tor'><span id='dq105.MDB'><\/span><\/td><td class='tor'><span id='zd105.MDB'><\/span><\/td><td class='xglj'><a href='ccbdxq_MDB.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,MDB.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.MDB'>行情<\/a><\/td><td class='tor'>0.15%<\/td><td class='tor'>139.06<\/td><td class='tor'>418.76<\/td><\/tr><tr><td>97<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ILMN'>ILMN<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ILMN'>Ilmn公司<\/a><\/td><td class='tor'><span id='dq105.ILMN'><\/span><\/td><td class='tor'><span id='zd105.ILMN'><\/span><\/td><td class='xglj'><a href='ccbdxq_ILMN.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,ILMN.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.ILMN'>行情<\/a><\/td><td class='tor'>0.64%<\/td><td class='tor'>385.79<\/td><td class='tor'>57,376.49<\/td><\/tr><tr><td>98<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.SMCI'>SMCI<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.SMCI'>Smci公司<\/a><\/td><td class='tor'><span id='dq105.SMCI'><\/span><\/td><td class='tor'><span id='zd105.SMCI'><\/span><\/td><td class='xglj'><a href='ccbdxq_SMCI.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,SMCI.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.SMCI'>行情<\/a><\/td><td class='tor'>1.59%<\/td><td class='tor'>131.72<\/td><td class='tor'>66,736.66<\/td><\/tr><tr><td>99<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.DLTR'>DLTR<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.DLTR'>Dltr公司<\/a><\/td><td class='tor'><span id='dq105.DLTR'><\/span><\/td><td class='tor'><span id='zd105.DLTR'><\/span><\/td><td class='xglj'><a href='ccbdxq_DLTR.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,DLTR.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.DLTR'>行情<\/a><\/td><td class='tor'>0.87%<\/td><td class='tor'>276.29<\/td><td class='tor'>38,549.05<\/td><\/tr><tr><td>100<\/td><td><a href='\/\/quote.eastmoney.com\/unify\/r\/105.WBA'>WBA<\/a><\/td><td class='tol'><a href='\/\/quote.eastmoney.com\/unify\/r\/105.WBA'>Wba公司<\/a><\/td><td class='tor'><span id='dq105.WBA'><\/span><\/td><td class='tor'><span id='zd105.WBA'><\/span><\/td><td class='xglj'><a href='ccbdxq_WBA.html' class='red'>变动详情<\/a><a href='\/\/guba.eastmoney.com\/list,WBA.html'>股吧<\/a><a href='\/\/quote.eastmoney.com\/unify\/r\/105.WBA'>行情<\/a><\/td><td class='tor'>1.56%<\/td><td class='tor'>5.83<\/td><td class='tor'>6,864.42<\/td><\/tr><\/tbody><\/table><\/div><\/div>",arryear:[2024,2023,2022],curyear:2024};
\ No newline at end of file
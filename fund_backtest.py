@@ -0,0 +1,275 @@
+"""估值准确度回测：用历史披露持仓 + 成分股日涨跌重算每日预估，与基金实际净值涨跌对比。
+
+输入均为本地文件（长表 CSV，UTF-8）：
+- 持仓：fund_code,effective_date,symbol,weight —— effective_date 起生效，直到该基金下一次披露
+- 成分股日涨跌：date,symbol,pct
+- 基金实际涨跌：date,fund_code,pct；或用 --nav-db 直接读取 nav_history 表（change_percent）
+
+计算按“披露期段”分块做矩阵乘法：每段内 预估[日期×基金] = 涨跌[日期×成分] @ 权重[成分×基金]，
+缺失行情按 0% 处理（与线上 estimate_fund 一致），全程不逐日逐基金循环。
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import sqlite3
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - 运行期提示
+    np = None  # type: ignore[assignment]
+
+
+@dataclass
+class BacktestData:
+    dates: List[str]
+    symbols: List[str]
+    funds: List[str]
+    returns: "np.ndarray"  # [日期, 成分]，缺失为 NaN
+    actual: "np.ndarray"  # [日期, 基金]，缺失为 NaN
+    # fund -> [(effective_date, {symbol: weight%}), ...] 按日期升序
+    holdings: Dict[str, List[Tuple[str, Dict[str, float]]]]
+
+
+@dataclass
+class BacktestResult:
+    funds: List[str]
+    dates: List[str]
+    estimated: "np.ndarray"  # [日期, 基金]，无生效持仓为 NaN
+    coverage: "np.ndarray"  # [日期, 基金]，有行情的持仓权重合计(%)
+    actual: "np.ndarray"
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise SystemExit("回测需要 numpy：python -m pip install numpy")
+
+
+def _read_rows(path: Path, required: Iterable[str]) -> Iterable[Dict[str, str]]:
+    with path.open("r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        missing = set(required) - set(reader.fieldnames or [])
+        if missing:
+            raise ValueError(f"{path} 缺少列：{','.join(sorted(missing))}")
+        yield from reader
+
+
+def load_holdings(path: Path) -> Dict[str, List[Tuple[str, Dict[str, float]]]]:
+    periods: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for row in _read_rows(path, ("fund_code", "effective_date", "symbol", "weight")):
+        fund = row["fund_code"].strip()
+        by_date = periods.setdefault(fund, {})
+        weights = by_date.setdefault(row["effective_date"].strip(), {})
+        weights[row["symbol"].strip()] = weights.get(row["symbol"].strip(), 0.0) + float(row["weight"] or 0)
+    return {fund: sorted(by_date.items()) for fund, by_date in periods.items()}
+
+
+def _long_to_matrix(
+    rows: Iterable[Tuple[str, str, float]], dates: Dict[str, int], columns: Dict[str, int]
+) -> "np.ndarray":
+    matrix = np.full((len(dates), len(columns)), np.nan)
+    for day, key, value in rows:
+        i = dates.get(day)
+        j = columns.get(key)
+        if i is not None and j is not None:
+            matrix[i, j] = value
+    return matrix
+
+
+def _csv_triples(path: Path, key_col: str) -> List[Tuple[str, str, float]]:
+    triples = []
+    for row in _read_rows(path, ("date", key_col, "pct")):
+        raw = (row["pct"] or "").strip()
+        if raw:
+            triples.append((row["date"].strip(), row[key_col].strip(), float(raw)))
+    return triples
+
+
+def _nav_db_triples(db_path: Path, funds: List[str]) -> List[Tuple[str, str, float]]:
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT date, code, change_percent FROM nav_history "
+            "WHERE code IN (SELECT value FROM json_each(?)) AND change_percent IS NOT NULL",
+            (json.dumps(funds),),
+        ).fetchall()
+    finally:
+        conn.close()
+    return [(str(d), str(c), float(p)) for d, c, p in rows]
+
+
+def load_backtest_data(
+    holdings_path: Path,
+    returns_path: Path,
+    actual_path: Optional[Path] = None,
+    nav_db: Optional[Path] = None,
+) -> BacktestData:
+    _require_numpy()
+    holdings = load_holdings(holdings_path)
+    funds = sorted(holdings)
+    held_symbols = {s for periods in holdings.values() for _, weights in periods for s in weights}
+
+    return_rows = [r for r in _csv_triples(returns_path, "symbol") if r[1] in held_symbols]
+    if actual_path is not None:
+        actual_rows = _csv_triples(actual_path, "fund_code")
+    elif nav_db is not None:
+        actual_rows = _nav_db_triples(nav_db, funds)
+    else:
+        raise ValueError("需要 --actual 或 --nav-db 提供基金实际涨跌")
+
+    dates = sorted({r[0] for r in return_rows} | {r[0] for r in actual_rows})
+    symbols = sorted(held_symbols)
+    date_idx = {d: i for i, d in enumerate(dates)}
+    return BacktestData(
+        dates=dates,
+        symbols=symbols,
+        funds=funds,
+        returns=_long_to_matrix(return_rows, date_idx, {s: j for j, s in enumerate(symbols)}),
+        actual=_long_to_matrix(actual_rows, date_idx, {f: j for j, f in enumerate(funds)}),
+        holdings=holdings,
+    )
+
+
+def _top_n(weights: Dict[str, float], top_n: int) -> Dict[str, float]:
+    if top_n <= 0 or len(weights) <= top_n:
+        return weights
+    return dict(sorted(weights.items(), key=lambda kv: kv[1], reverse=True)[:top_n])
+
+
+def run_backtest(data: BacktestData, top_n: int = 0) -> BacktestResult:
+    """top_n>0 时每期只取权重最大的 N 只成分，用于衡量近似估值的精度损失。"""
+    _require_numpy()
+    n_dates, n_funds = len(data.dates), len(data.funds)
+    symbol_idx = {s: j for j, s in enumerate(data.symbols)}
+    dates = np.array(data.dates)
+
+    returns = np.nan_to_num(data.returns, nan=0.0)
+    available = (~np.isnan(data.returns)).astype(float)
+
+    # 所有基金的披露日合并成段边界；每段内各基金的生效持仓固定
+    changes: Dict[str, List[Tuple[int, Dict[str, float]]]] = {}
+    for f, fund in enumerate(data.funds):
+        for effective, weights in data.holdings.get(fund, []):
+            changes.setdefault(effective, []).append((f, _top_n(weights, top_n)))
+    boundaries = sorted(changes)
+
+    weights = np.zeros((len(data.symbols), n_funds))
+    active = np.zeros(n_funds, dtype=bool)
+    estimated = np.full((n_dates, n_funds), np.nan)
+    coverage = np.zeros((n_dates, n_funds))
+
+    for k, effective in enumerate(boundaries):
+        for f, fund_weights in changes[effective]:
+            weights[:, f] = 0.0
+            for symbol, w in fund_weights.items():
+                weights[symbol_idx[symbol], f] = w
+            active[f] = True
+        start = int(np.searchsorted(dates, effective, side="left"))
+        end = int(np.searchsorted(dates, boundaries[k + 1], side="left")) if k + 1 < len(boundaries) else n_dates
+        if start >= end:
+            continue
+        # 权重为百分数、涨跌为百分数，贡献 = w/100 * pct
+        segment = returns[start:end] @ weights / 100.0
+        estimated[start:end] = np.where(active, segment, np.nan)
+        coverage[start:end] = available[start:end] @ weights
+
+    return BacktestResult(funds=data.funds, dates=data.dates, estimated=estimated, coverage=coverage, actual=data.actual)
+
+
+def error_stats(result: BacktestResult) -> List[Dict[str, object]]:
+    """逐基金误差统计：样本数、偏差、MAE、RMSE、最大绝对误差、相关系数、方向命中率、平均覆盖权重。"""
+    _require_numpy()
+    valid = ~np.isnan(result.estimated) & ~np.isnan(result.actual)
+    n = valid.sum(axis=0)
+    est = np.where(valid, result.estimated, 0.0)
+    act = np.where(valid, result.actual, 0.0)
+    err = est - act
+    safe_n = np.maximum(n, 1)
+
+    bias = err.sum(axis=0) / safe_n
+    mae = np.abs(err).sum(axis=0) / safe_n
+    rmse = np.sqrt((err**2).sum(axis=0) / safe_n)
+    max_abs = np.abs(err).max(axis=0, initial=0.0)
+    hit = ((np.sign(est) == np.sign(act)) & valid).sum(axis=0) / safe_n
+    cover = np.where(valid, result.coverage, 0.0).sum(axis=0) / safe_n
+
+    est_c = np.where(valid, est - est.sum(axis=0) / safe_n, 0.0)
+    act_c = np.where(valid, act - act.sum(axis=0) / safe_n, 0.0)
+    denom = np.sqrt((est_c**2).sum(axis=0) * (act_c**2).sum(axis=0))
+    corr = np.divide((est_c * act_c).sum(axis=0), denom, out=np.full(len(result.funds), np.nan), where=denom > 0)
+
+    stats = []
+    for f, fund in enumerate(result.funds):
+        count = int(n[f])
+        stats.append(
+            {
+                "fund_code": fund,
+                "days": count,
+                "bias": round(float(bias[f]), 6) if count else None,
+                "mae": round(float(mae[f]), 6) if count else None,
+                "rmse": round(float(rmse[f]), 6) if count else None,
+                "max_abs_error": round(float(max_abs[f]), 6) if count else None,
+                "corr": None if np.isnan(corr[f]) else round(float(corr[f]), 6),
+                "direction_hit": round(float(hit[f]), 4) if count else None,
+                "avg_coverage": round(float(cover[f]), 4) if count else None,
+            }
+        )
+    return stats
+
+
+def write_stats(stats: List[Dict[str, object]], out: IO[str], fmt: str = "csv") -> None:
+    if fmt == "jsonl":
+        for row in stats:
+            out.write(json.dumps(row, ensure_ascii=False) + "\n")
+        return
+    if not stats:
+        return
+    writer = csv.DictWriter(out, fieldnames=list(stats[0]))
+    writer.writeheader()
+    writer.writerows(stats)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="基金估值准确度回测（预估涨跌 vs 实际净值涨跌）")
+    parser.add_argument("--holdings", required=True, type=Path, help="持仓长表 CSV：fund_code,effective_date,symbol,weight")
+    parser.add_argument("--returns", required=True, type=Path, help="成分股日涨跌 CSV：date,symbol,pct")
+    parser.add_argument("--actual", type=Path, default=None, help="基金实际涨跌 CSV：date,fund_code,pct")
+    parser.add_argument("--nav-db", type=Path, default=None, help="从 SQLite nav_history 表读取实际涨跌")
+    parser.add_argument("--top-n", type=int, default=0, help="每期只用权重前 N 的成分（近似估值）")
+    parser.add_argument("--format", choices=["csv", "jsonl"], default="csv")
+    parser.add_argument("--output", type=Path, default=None, help="输出文件（默认 stdout）")
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    _require_numpy()
+
+    begin = time.perf_counter()
+    data = load_backtest_data(args.holdings, args.returns, args.actual, args.nav_db)
+    loaded = time.perf_counter()
+    stats = error_stats(run_backtest(data, top_n=args.top_n))
+    done = time.perf_counter()
+
+    if args.output is None:
+        write_stats(stats, sys.stdout, args.format)
+    else:
+        with args.output.open("w", encoding="utf-8", newline="") as out:
+            write_stats(stats, out, args.format)
+
+    rmse = [s["rmse"] for s in stats if s["rmse"] is not None]
+    print(
+        f"{len(data.funds)} 只基金 × {len(data.dates)} 个交易日 | 加载 {(loaded - begin) * 1000:.0f} ms"
+        f" | 计算 {(done - loaded) * 1000:.0f} ms | RMSE 中位数 {sorted(rmse)[len(rmse) // 2] if rmse else '-'}",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,16 @@ from __future__ import annotations
 
 import argparse
 import csv
+import itertools
 import json
+import multiprocessing
+import multiprocessing.pool
+import os
+import re
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Tuple
 
 
 @dataclass(frozen=True)
@@ -99,20 +105,189 @@ def load_changes_json(path: Optional[Path]) -> Dict[str, float]:
     return {str(k): float(v) for k, v in raw.items()}
 
 
+@dataclass(frozen=True)
+class BatchJob:
+    """清单中的字段原样保留，校验放在 estimate_job 里，坏行只影响这一只基金。"""
+
+    fund_code: str
+    fund_name: str
+    holdings: Optional[Path]
+    cash_weight: str = ""
+
+
+_FUND_CODE_RE = re.compile(r"\d{6}")
+BATCH_CSV_FIELDS = ["fund_code", "fund_name", "estimated_change_pct", "direction", "holdings", "missing", "error"]
+
+
+def iter_batch_jobs(source: Path) -> Iterator[BatchJob]:
+    """目录：其中每个 *.csv 为一只基金，代码取文件名中的 6 位数字（没有则用文件名）；
+    清单：CSV 列 fund_code,fund_name,holdings[,cash_weight]，holdings 相对清单所在目录。"""
+    if source.is_dir():
+        for path in sorted(source.glob("*.csv")):
+            match = _FUND_CODE_RE.search(path.stem)
+            yield BatchJob(fund_code=match.group(0) if match else path.stem, fund_name=path.stem, holdings=path)
+        return
+
+    with source.open("r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        required = {"fund_code", "holdings"}
+        if not required.issubset(reader.fieldnames or set()):
+            raise ValueError("清单 CSV 必须包含列：fund_code,holdings")
+        for row in reader:
+            # 列数不足的行缺失字段为 None
+            raw = (row.get("holdings") or "").strip()
+            holdings = Path(raw) if raw else None
+            if holdings is not None and not holdings.is_absolute():
+                holdings = source.parent / holdings
+            code = (row.get("fund_code") or "").strip()
+            yield BatchJob(
+                fund_code=code,
+                fund_name=(row.get("fund_name") or "").strip() or code,
+                holdings=holdings,
+                cash_weight=(row.get("cash_weight") or "").strip(),
+            )
+
+
+# 每个 worker 进程只加载一次共享的涨跌文件
+_WORKER_CHANGES: Dict[str, float] = {}
+
+
+def _init_worker(changes_path: Optional[Path]) -> None:
+    global _WORKER_CHANGES
+    _WORKER_CHANGES = load_changes_json(changes_path)
+
+
+def estimate_job(job: BatchJob) -> dict:
+    """单只基金的批量估算结果，失败时返回带 error 的记录而不中断整批。"""
+    record: dict = {"fund_code": job.fund_code, "fund_name": job.fund_name}
+    try:
+        if not job.fund_code:
+            raise ValueError("缺少 fund_code")
+        if job.holdings is None:
+            raise ValueError("缺少 holdings")
+        try:
+            cash_weight = float(job.cash_weight or 0)
+        except ValueError:
+            raise ValueError(f"cash_weight 不是数字: {job.cash_weight!r}") from None
+        holdings = load_holdings_csv(job.holdings)
+        result = FundEstimator(job.fund_name, job.fund_code, holdings, cash_weight=cash_weight).estimate(
+            _WORKER_CHANGES
+        )
+    except (OSError, ValueError) as exc:
+        record["error"] = str(exc)
+        return record
+    except Exception as exc:  # noqa: BLE001
+        # 如 CSV 行列数不足时的 AttributeError，记录后继续下一只
+        record["error"] = f"{type(exc).__name__}: {exc}"
+        return record
+    record.update(
+        {
+            "estimated_change_pct": round(result.estimated_change_pct, 6),
+            "direction": result.direction,
+            "holdings": len(holdings),
+            "missing": [h.symbol for h in holdings if h.symbol not in _WORKER_CHANGES],
+            "contributions": {k: round(v, 6) for k, v in result.contributions.items()},
+        }
+    )
+    return record
+
+
+# 每个 worker 在一个投递窗口内分到的任务数
+BATCH_WINDOW_PER_WORKER = 64
+BATCH_CHUNKSIZE = 16
+
+
+def _imap_windows(pool: "multiprocessing.pool.Pool", jobs: Iterable[BatchJob], window: int) -> Iterator[dict]:
+    """每次只从 jobs 取 window 条交给 imap，窗口内结果全部产出后再取下一批。"""
+    it = iter(jobs)
+    while True:
+        batch = list(itertools.islice(it, window))
+        if not batch:
+            return
+        yield from pool.imap(estimate_job, batch, chunksize=BATCH_CHUNKSIZE)
+
+
+def run_batch(
+    jobs: Iterable[BatchJob],
+    changes_path: Optional[Path],
+    out: IO[str],
+    fmt: str = "jsonl",
+    workers: int = 0,
+) -> Tuple[int, int]:
+    """按输入顺序逐条写出结果，返回 (成功数, 失败数)。
+
+    任务按 workers * BATCH_WINDOW_PER_WORKER 条一个窗口投递（Pool.imap 会一次取空整个生成器），
+    结果写出后即释放，内存占用不随基金数量增长。
+    """
+    writer = None
+    if fmt == "csv":
+        writer = csv.DictWriter(out, fieldnames=BATCH_CSV_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+
+    workers = workers or os.cpu_count() or 1
+    ok = failed = 0
+    pool = None
+    if workers > 1:
+        pool = multiprocessing.Pool(workers, initializer=_init_worker, initargs=(changes_path,))
+        records: Iterable[dict] = _imap_windows(pool, jobs, workers * BATCH_WINDOW_PER_WORKER)
+    else:
+        _init_worker(changes_path)
+        records = map(estimate_job, jobs)
+
+    try:
+        for record in records:
+            if "error" in record:
+                failed += 1
+            else:
+                ok += 1
+            if writer is not None:
+                row = dict(record)
+                if "missing" in row:
+                    row["missing"] = " ".join(row["missing"])
+                writer.writerow(row)
+            else:
+                out.write(json.dumps(record, ensure_ascii=False) + "\n")
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    return ok, failed
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="根据持仓估算基金涨跌")
-    parser.add_argument("--fund-name", required=True, help="基金名")
-    parser.add_argument("--fund-code", required=True, help="基金代码")
-    parser.add_argument("--holdings", required=True, type=Path, help="持仓CSV路径")
+    parser.add_argument("--fund-name", help="基金名")
+    parser.add_argument("--fund-code", help="基金代码")
+    parser.add_argument("--holdings", type=Path, help="持仓CSV路径")
     parser.add_argument("--changes", type=Path, default=None, help="实时涨跌JSON路径")
-    parser.add_argument("--cash-weight", type=float, default=0.0, help="现金仓位(%)")
+    parser.add_argument("--cash-weight", type=float, default=0.0, help="现金仓位(%%)")
+    parser.add_argument("--batch", type=Path, default=None, help="批量模式：持仓CSV目录或清单CSV")
+    parser.add_argument("--format", choices=["jsonl", "csv"], default="jsonl", help="批量输出格式")
+    parser.add_argument("--output", type=Path, default=None, help="批量输出文件（默认 stdout）")
+    parser.add_argument("--workers", type=int, default=0, help="批量进程数（默认 CPU 核数，1 为单进程）")
     return parser
 
 
+def main_batch(args: argparse.Namespace) -> None:
+    jobs = iter_batch_jobs(args.batch)
+    if args.output is None:
+        ok, failed = run_batch(jobs, args.changes, sys.stdout, args.format, args.workers)
+    else:
+        with args.output.open("w", encoding="utf-8", newline="") as out:
+            ok, failed = run_batch(jobs, args.changes, out, args.format, args.workers)
+    print(f"完成 {ok} 只，失败 {failed} 只", file=sys.stderr)
+
+
 def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
 
+    if args.batch is not None:
+        main_batch(args)
+        return
+    if not (args.fund_name and args.fund_code and args.holdings):
+        parser.error("单只模式需要 --fund-name、--fund-code、--holdings（或使用 --batch）")
+
     holdings = load_holdings_csv(args.holdings)
     changes = load_changes_json(args.changes)
 